@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import json
 import os
-import re
 import sys
 
 import click
@@ -35,9 +34,9 @@ def _base_url() -> str:
     return normalize_url(os.environ.get("WINUSE_URL", DEFAULT_URL))
 
 
-def _api_get(base: str, endpoint: str) -> dict:
+def _api_get(base: str, endpoint: str, params: dict | None = None) -> dict:
     try:
-        resp = requests.get(f"{base}{endpoint}", timeout=30)
+        resp = requests.get(f"{base}{endpoint}", params=params, timeout=30)
         resp.raise_for_status()
         return resp.json()
     except requests.RequestException as e:
@@ -62,9 +61,8 @@ def _resolve_window(base: str, hwnd: int | None, title: str | None) -> int | Non
     if not title:
         click.echo("Error: provide --hwnd or --title", err=True)
         sys.exit(1)
-    windows = _api_get(base, "/windows").get("data", [])
-    pattern = re.compile(re.escape(title), re.IGNORECASE)
-    matches = [w for w in windows if pattern.search(w.get("title", ""))]
+    params = {"title": title, "limit": 1, "fields": "title"}
+    matches = _api_get(base, "/windows", params).get("data", [])
     if not matches:
         click.echo(f"No windows matching '{title}'", err=True)
         sys.exit(1)
@@ -109,14 +107,12 @@ def _base(ctx: click.Context) -> str:
 def list_windows(ctx: click.Context, title_filter: str | None) -> None:
     """List all windows."""
     base = _base(ctx)
-    result = _api_get(base, "/windows")
+    params = {"title_regex": title_filter} if title_filter else None
+    result = _api_get(base, "/windows", params)
     if not result.get("success"):
         click.echo(f"Error: {result}", err=True)
         return
     windows = result.get("data", [])
-    if title_filter:
-        pat = re.compile(title_filter, re.IGNORECASE)
-        windows = [w for w in windows if pat.search(w.get("title", ""))]
 
     click.echo(f"{'HWND':>12}  {'Title':<40}  {'Process':<25}  Position")
     click.echo("-" * 105)
@@ -154,7 +150,12 @@ def focus(ctx: click.Context, hwnd: int | None, title: str | None) -> None:
     base = _base(ctx)
     resolved = _resolve_window(base, hwnd, title)
     result = _api_post(base, f"/windows/{resolved}/focus")
-    click.echo(f"Focused HWND {resolved}: {result.get('success')}")
+    data = result.get("data") or {}
+    if result.get("success"):
+        strategy, elapsed = data.get("strategy"), data.get("elapsed_ms")
+        click.echo(f"Focused HWND {resolved} via {strategy} in {elapsed} ms")
+    else:
+        click.echo(f"Focus HWND {resolved} failed: {(result.get('error') or {}).get('message')}")
 
 
 @cli.command()
@@ -201,9 +202,12 @@ def close(ctx: click.Context, hwnd: int | None, title: str | None) -> None:
     """Close a window (focus + Alt+F4)."""
     base = _base(ctx)
     resolved = _resolve_window(base, hwnd, title)
-    _api_post(base, f"/windows/{resolved}/focus")
-    _api_post(base, "/keyboard/press", {"keys": ["alt", "f4"]})
-    click.echo(f"Closed HWND {resolved}")
+    steps = [{"type": "focus", "hwnd": resolved}, {"type": "press", "keys": ["alt", "f4"]}]
+    result = _api_post(base, "/actions", {"actions": steps})
+    if result.get("success"):
+        click.echo(f"Closed HWND {resolved}")
+    else:
+        click.echo(f"Close HWND {resolved} failed: {(result.get('error') or {}).get('message')}")
 
 
 # ---------------------------------------------------------------------------
@@ -255,30 +259,83 @@ def paste(ctx: click.Context, hwnd: int | None, title: str | None, text: str | N
 # Mouse
 # ---------------------------------------------------------------------------
 
+def _mouse_target(
+    base: str,
+    x: float,
+    y: float,
+    hwnd: int | None,
+    title: str | None,
+    client_area: bool,
+    normalized: bool,
+) -> dict:
+    """Request body for x/y, relative to a window if --hwnd or --title is given."""
+    data: dict = {"x": x, "y": y}
+    if hwnd or title:
+        data["hwnd"] = _resolve_window(base, hwnd, title)
+        data["relative_to"] = "client" if client_area else "window"
+    if normalized:
+        data["normalized"] = True
+    return data
+
+
 @cli.command(name="mouse-click")
-@click.argument("x", type=int)
-@click.argument("y", type=int)
+@click.argument("x", type=float)
+@click.argument("y", type=float)
 @click.option("--double", is_flag=True, help="Double-click")
+@click.option("--hwnd", type=int, help="x/y are relative to this window")
+@click.option("--title", "-t", help="x/y are relative to the window with this title")
+@click.option(
+    "--client", "client_area", is_flag=True, help="Relative to the client area, not the frame"
+)
+@click.option("--normalized", is_flag=True, help="x/y are fractions (0..1) of the window size")
 @click.pass_context
-def mouse_click(ctx: click.Context, x: int, y: int, double: bool) -> None:
-    """Click at screen coordinates."""
+def mouse_click(
+    ctx: click.Context,
+    x: float,
+    y: float,
+    double: bool,
+    hwnd: int | None,
+    title: str | None,
+    client_area: bool,
+    normalized: bool,
+) -> None:
+    """Click at screen coordinates, or at a point in a window."""
     base = _base(ctx)
-    data: dict = {"x": x, "y": y}
+    data = _mouse_target(base, x, y, hwnd, title, client_area, normalized)
     if double:
-        data["double"] = True
+        data["clicks"] = 2
     result = _api_post(base, "/mouse/click", data)
-    click.echo(f"Clicked ({x}, {y}){' [double]' if double else ''}: {result.get('success')}")
+    point = result.get("data") or {}
+    suffix = " [double]" if double else ""
+    where = f"({point.get('x', x)}, {point.get('y', y)})"
+    click.echo(f"Clicked {where}{suffix}: {result.get('success')}")
 
 
 @cli.command(name="mouse-move")
-@click.argument("x", type=int)
-@click.argument("y", type=int)
+@click.argument("x", type=float)
+@click.argument("y", type=float)
+@click.option("--hwnd", type=int, help="x/y are relative to this window")
+@click.option("--title", "-t", help="x/y are relative to the window with this title")
+@click.option(
+    "--client", "client_area", is_flag=True, help="Relative to the client area, not the frame"
+)
+@click.option("--normalized", is_flag=True, help="x/y are fractions (0..1) of the window size")
 @click.pass_context
-def mouse_move(ctx: click.Context, x: int, y: int) -> None:
-    """Move the mouse cursor to screen coordinates."""
+def mouse_move(
+    ctx: click.Context,
+    x: float,
+    y: float,
+    hwnd: int | None,
+    title: str | None,
+    client_area: bool,
+    normalized: bool,
+) -> None:
+    """Move the mouse cursor to screen coordinates, or to a point in a window."""
     base = _base(ctx)
-    result = _api_post(base, "/mouse/move", {"x": x, "y": y})
-    click.echo(f"Moved to ({x}, {y}): {result.get('success')}")
+    data = _mouse_target(base, x, y, hwnd, title, client_area, normalized)
+    result = _api_post(base, "/mouse/move", data)
+    point = result.get("data") or {}
+    click.echo(f"Moved to ({point.get('x', x)}, {point.get('y', y)}): {result.get('success')}")
 
 
 # ---------------------------------------------------------------------------
@@ -287,14 +344,35 @@ def mouse_move(ctx: click.Context, x: int, y: int) -> None:
 
 @cli.command()
 @click.option("--output", "-o", help="Save screenshot to local file")
+@click.option("--inline/--no-inline", default=True, show_default=True,
+              help="Receive image bytes in the response instead of a server-side file URL")
 @click.pass_context
-def screenshot(ctx: click.Context, output: str | None) -> None:
+def screenshot(ctx: click.Context, output: str | None, inline: bool) -> None:
     """Take a full-desktop screenshot."""
     base = _base(ctx)
+    if inline:
+        try:
+            resp = requests.post(f"{base}/screenshot", json={"inline": True}, timeout=60)
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+        if resp.headers.get("content-type", "").startswith("application/json"):
+            click.echo(f"Error: {resp.json()}", err=True)
+            sys.exit(1)
+        if not output:
+            media_type = resp.headers.get("content-type", "image/png")
+            ext = media_type.split("/")[-1].replace("jpeg", "jpg")
+            output = f"screenshot_{resp.headers.get('x-winuse-frame-id', 'latest')}.{ext}"
+        with open(output, "wb") as f:
+            f.write(resp.content)
+        click.echo(f"Saved to {output}")
+        return
+
     result = _api_post(base, "/screenshot")
     if not result.get("success"):
         click.echo(f"Error: {result}", err=True)
-        return
+        sys.exit(1)
 
     file_url = result.get("data", {}).get("url", "")
     full_url = f"{base}{file_url}" if file_url.startswith("/") else file_url
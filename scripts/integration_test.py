@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 import json
 import os
-import time
 from datetime import datetime
 from urllib import request
 from urllib.error import URLError, HTTPError
@@ -39,6 +38,15 @@ def _req(method: str, host: str, path: str, body: dict | None = None) -> dict:
         raise SystemExit(f"Request failed: {exc}")
 
 
+def _wait(host: str, until: str, since: int | None = None, timeout_ms: int = 5000) -> int | None:
+    """Block on the server until the screen changes/settles; returns the last frame_id."""
+    body: dict = {"until": until, "timeout_ms": timeout_ms}
+    if since is not None:
+        body["since"] = since
+    result = _req("POST", host, "/wait", body)
+    return (result.get("data") or {}).get("frame_id")
+
+
 def main() -> None:
     load_env(os.path.join(os.path.dirname(__file__), "..", ".env"))
 
@@ -49,15 +57,21 @@ def main() -> None:
     ts = datetime.now().strftime("%Y%m%d-%H%M%S")
     msg = f"integration-test-{ts}"
 
+    # Each step waits for the screen to change from the frame seen before the
+    # action (so a fast UI is not missed), then for it to settle.
+    frame = _wait(host, "stable")
     _req("POST", host, "/keyboard/press", {"keys": ["winleft", "r"]})
-    time.sleep(1)
+    _wait(host, "change", since=frame)
+    frame = _wait(host, "stable")
     _req("POST", host, "/keyboard/type", {"text": "cmd", "mode": "paste"})
-    time.sleep(0.5)
+    _wait(host, "change", since=frame)
+    frame = _wait(host, "stable")
     _req("POST", host, "/keyboard/press", {"keys": ["enter"]})
-    time.sleep(1)
+    _wait(host, "change", since=frame)
+    _wait(host, "stable")
     _req("POST", host, "/keyboard/type", {"text": msg, "mode": "paste"})
     _req("POST", host, "/keyboard/press", {"keys": ["enter"]})
-    time.sleep(0.5)
+    _wait(host, "stable")
 
     shot = _req("POST", host, "/screenshot", {})
     print(json.dumps({"sent": msg, "screenshot": shot}, indent=2, ensure_ascii=False))
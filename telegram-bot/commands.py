@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-import asyncio
 import functools
 import io
 import logging
-import re
 import traceback
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ForceReply
@@ -71,17 +69,12 @@ async def cmd_help(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 @auth
 async def cmd_windows(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    windows = await api.list_windows()
-    if not windows:
+    filter_str = " ".join(context.args) if context.args else None
+    windows = await api.list_windows(title=filter_str, fields="title")
+    if not windows and not filter_str:
         await update.message.reply_text("🖥️ No windows found")
         return
 
-    # Filter arg
-    filter_str = " ".join(context.args) if context.args else None
-    if filter_str:
-        pat = re.compile(re.escape(filter_str), re.IGNORECASE)
-        windows = [w for w in windows if pat.search(w.get("title", ""))]
-
     if not windows:
         await update.message.reply_text(f"🖥️ No windows matching '{filter_str}'")
         return
@@ -164,9 +157,8 @@ async def cmd_close(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text(f"❌ No window matching '{target}'")
         return
 
-    await api.focus_window(hwnd)
-    ok = await api.press_keys(["alt", "f4"])
-    await update.message.reply_text(f"{'✅' if ok else '❌'} Closed HWND {hwnd}")
+    result = await api.run_actions([{"type": "focus", "hwnd": hwnd}, {"type": "press", "keys": ["alt", "f4"]}])
+    await update.message.reply_text(f"{'✅' if result.get('success') else '❌'} Closed HWND {hwnd}")
 
 
 # ---------------------------------------------------------------------------
@@ -310,14 +302,11 @@ async def _dispatch_callback(query, data: str):
     elif data.startswith("focus:"):
         hwnd = int(data.split(":", 1)[1])
         ok = await api.focus_window(hwnd)
-        await asyncio.sleep(0.3)
         await query.message.reply_text(f"{'✅' if ok else '❌'} Focused HWND {hwnd}")
     elif data.startswith("close:"):
         hwnd = int(data.split(":", 1)[1])
-        await api.focus_window(hwnd)
-        await asyncio.sleep(0.3)
-        ok = await api.press_keys(["alt", "f4"])
-        await query.message.reply_text(f"{'✅' if ok else '❌'} Closed HWND {hwnd}")
+        result = await api.run_actions([{"type": "focus", "hwnd": hwnd}, {"type": "press", "keys": ["alt", "f4"]}])
+        await query.message.reply_text(f"{'✅' if result.get('success') else '❌'} Closed HWND {hwnd}")
     elif data.startswith("min:"):
         hwnd = int(data.split(":", 1)[1])
         ok = await api.minimize_window(hwnd)
@@ -329,7 +318,7 @@ async def _dispatch_callback(query, data: str):
     elif data.startswith("shot:"):
         hwnd = int(data.split(":", 1)[1])
         await api.focus_window(hwnd)
-        await asyncio.sleep(0.3)
+        await api.wait_for(hwnd=hwnd)
         png = await api.take_screenshot(hwnd=hwnd)
         if png:
             await query.message.reply_photo(photo=io.BytesIO(png), caption=f"📸 HWND {hwnd}")
@@ -369,10 +358,7 @@ async def _dispatch_callback(query, data: str):
         parts = data.split(":", 2)
         hwnd = int(parts[1])
         key = parts[2]
-        await api.focus_window(hwnd)
-        await asyncio.sleep(0.3)
-        await api.press_keys([key])
-        await asyncio.sleep(0.1)
+        await api.run_actions([{"type": "focus", "hwnd": hwnd}, {"type": "press", "keys": [key]}])
         await query.answer(f"Pressed {key}", show_alert=False)
 
 
@@ -413,8 +399,7 @@ def _window_keyboard(hwnd: int) -> InlineKeyboardMarkup:
 
 async def _show_window_detail(query, hwnd: int):
     """Show window details with action buttons."""
-    windows = await api.list_windows()
-    w = next((w for w in windows if w.get("hwnd") == hwnd), None)
+    w = await api.get_window(hwnd)
     if not w:
         await query.message.reply_text(f"❌ Window {hwnd} not found")
         return
@@ -456,32 +441,31 @@ async def handle_pending_input(update: Update, context: ContextTypes.DEFAULT_TYP
     text = update.message.text
 
     try:
-        await api.focus_window(hwnd)
-        await asyncio.sleep(0.5)
-
+        # Focus, input and the settle wait go to the server as one batch.
+        settle = {"type": "wait", "until": "stable", "hwnd": hwnd, "stable_ms": 150, "timeout_ms": 2000}
+        steps: list[dict] = [{"type": "focus", "hwnd": hwnd}]
         if action == "type":
-            ok = await api.type_text(text)
-            await asyncio.sleep(0.2)
-            await update.message.reply_text(f"{'✅' if ok else '❌'} Typed {len(text)} chars into HWND {hwnd}")
+            steps.append({"type": "type", "text": text, "mode": "type"})
+            done = f"Typed {len(text)} chars into HWND {hwnd}"
         elif action == "paste":
-            ok = await api.paste_text(text)
-            await asyncio.sleep(0.2)
-            await update.message.reply_text(f"{'✅' if ok else '❌'} Pasted into HWND {hwnd}")
+            steps.append({"type": "paste", "text": text})
+            done = f"Pasted into HWND {hwnd}"
         elif action == "tpaste":
-            # Copy text to clipboard via type endpoint, then Ctrl+Shift+V
-            ok = await api.paste_text(text)
-            if not ok:
-                # Fallback: set clipboard then press ctrl+shift+v
-                await api.type_text(text)
-            await asyncio.sleep(0.3)
-            ok = await api.press_keys(["ctrl", "shift", "v"])
-            await asyncio.sleep(0.2)
-            await update.message.reply_text(f"{'✅' if ok else '❌'} Terminal-pasted into HWND {hwnd}")
+            # Terminals paste with Ctrl+Shift+V
+            steps.append({"type": "paste", "text": text, "paste_keys": ["ctrl", "shift", "v"]})
+            done = f"Terminal-pasted into HWND {hwnd}"
         elif action == "keycombo":
             keys = [k.strip().lower() for k in text.split(",")]
-            ok = await api.press_keys(keys)
-            await asyncio.sleep(0.2)
-            await update.message.reply_text(f"{'✅' if ok else '❌'} Pressed {'+'.join(keys)} on HWND {hwnd}")
+            steps.append({"type": "press", "keys": keys})
+            done = f"Pressed {'+'.join(keys)} on HWND {hwnd}"
+        else:
+            return True
+        steps.append(settle)
+        result = await api.run_actions(steps)
+        if result.get("success"):
+            await update.message.reply_text(f"✅ {done}")
+        else:
+            await update.message.reply_text(f"❌ {(result.get('error') or {}).get('message', done)}")
     except Exception as e:
         logger.error(f"Error in pending input: {e}\n{traceback.format_exc()}")
         await update.message.reply_text(f"❌ Error: {e}")
@@ -6,9 +6,9 @@ import httpx
 from config import WINUSE_BASE
 
 
-async def api_get(path: str) -> dict:
+async def api_get(path: str, params: dict | None = None) -> dict:
     async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.get(f"{WINUSE_BASE}{path}")
+        resp = await client.get(f"{WINUSE_BASE}{path}", params=params)
         resp.raise_for_status()
         return resp.json()
 
@@ -27,9 +27,20 @@ async def api_get_bytes(path: str) -> bytes:
         return resp.content
 
 
-async def list_windows() -> list[dict]:
-    result = await api_get("/windows")
-    return result.get("data", [])
+async def list_windows(title: str | None = None, fields: str | None = None) -> list[dict]:
+    """List windows, optionally filtered by title substring and projected to ``fields``."""
+    params = {}
+    if title:
+        params["title"] = title
+    if fields:
+        params["fields"] = fields
+    result = await api_get("/windows", params or None)
+    return result.get("data") or []
+
+
+async def get_window(hwnd: int) -> dict | None:
+    result = await api_get(f"/windows/{hwnd}")
+    return result.get("data") if result.get("success") else None
 
 
 async def get_active_window() -> dict | None:
@@ -44,12 +55,9 @@ async def focus_window(hwnd: int) -> bool:
 
 async def find_window_by_title(title: str) -> dict | None:
     """Find first window whose title contains the given string (case-insensitive)."""
-    windows = await list_windows()
-    title_lower = title.lower()
-    for w in windows:
-        if title_lower in w.get("title", "").lower():
-            return w
-    return None
+    result = await api_get("/windows", {"title": title, "limit": 1})
+    windows = result.get("data") or []
+    return windows[0] if windows else None
 
 
 async def press_keys(keys: list[str]) -> bool:
@@ -69,15 +77,51 @@ async def paste_text(text: str | None = None) -> bool:
 
 
 async def take_screenshot(hwnd: int | None = None) -> bytes | None:
-    """Take screenshot and return PNG bytes. If hwnd given, screenshot that window."""
-    data = {"hwnd": hwnd} if hwnd else {}
-    result = await api_post("/screenshot", data)
-    if not result.get("success"):
-        return None
-    file_url = result.get("data", {}).get("url", "")
-    if not file_url:
+    """Take screenshot and return image bytes. If hwnd given, screenshot that window.
+
+    Uses the inline response mode, so the image arrives in a single request
+    and is never written to disk on the Windows host.
+    """
+    data: dict = {"inline": True}
+    if hwnd:
+        data["hwnd"] = hwnd
+    async with httpx.AsyncClient(timeout=60) as client:
+        resp = await client.post(f"{WINUSE_BASE}/screenshot", json=data)
+        resp.raise_for_status()
+    if resp.headers.get("content-type", "").startswith("application/json"):
         return None
-    return await api_get_bytes(file_url)
+    return resp.content
+
+
+async def wait_for(
+    until: str = "stable",
+    hwnd: int | None = None,
+    since: int | None = None,
+    stable_ms: int = 150,
+    timeout_ms: int = 2000,
+) -> dict | None:
+    """Block until the screen (or window) changes or settles, server-side.
+
+    Replaces fixed sleeps between actions: returns as soon as the UI has
+    been still for ``stable_ms`` (or changed since frame ``since``), or
+    after ``timeout_ms``. Returns the wait result, or None on error.
+    """
+    data: dict = {"until": until, "stable_ms": stable_ms, "timeout_ms": timeout_ms}
+    if hwnd:
+        data["hwnd"] = hwnd
+    if since is not None:
+        data["since"] = since
+    result = await api_post("/wait", data)
+    return result.get("data") if result.get("success") else None
+
+
+async def run_actions(actions: list[dict], stop_on_error: bool = True) -> dict:
+    """Run several steps (focus, type, press, wait, ...) server-side in one request.
+
+    Returns the full envelope: ``success`` is False if any step failed, and
+    ``data["steps"]`` has each step's own result.
+    """
+    return await api_post("/actions", {"actions": actions, "stop_on_error": stop_on_error})
 
 
 async def mouse_click(x: int, y: int, double: bool = False) -> bool:
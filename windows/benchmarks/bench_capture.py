@@ -0,0 +1,81 @@
+"""Capture latency: one-shot mss context vs. the long-lived capture engine.
+
+Run from the ``windows/`` directory on the Windows host:
+
+    python benchmarks/bench_capture.py --iterations 50
+
+``--synthetic`` swaps mss for an in-memory frame source so the engine
+overhead itself can be measured anywhere.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from winuse.core.capture import CaptureEngine, MssFrameSource  # noqa: E402
+
+
+class SyntheticSource:
+    def __init__(self, width: int = 3840, height: int = 2160) -> None:
+        self._region = {"left": 0, "top": 0, "width": width, "height": height}
+        self._raw = bytes(width * height * 4)
+
+    def full_region(self):
+        return dict(self._region)
+
+    def grab(self, region):
+        return bytearray(self._raw)
+
+    def close(self) -> None:
+        pass
+
+
+def _measure(fn: Callable[[], object], iterations: int) -> List[float]:
+    fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def _report(name: str, samples: List[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{name:<28} mean {statistics.mean(samples):8.2f} ms  p50 {statistics.median(samples):8.2f} ms  p95 {p95:8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--synthetic", action="store_true")
+    args = parser.parse_args()
+
+    factory = SyntheticSource if args.synthetic else MssFrameSource
+
+    def one_shot() -> None:
+        source = factory()
+        try:
+            source.grab(source.full_region())
+        finally:
+            source.close()
+
+    engine = CaptureEngine(factory, ring_size=4)
+    try:
+        _report("one-shot (current path)", _measure(one_shot, args.iterations))
+        _report("engine, fresh grab", _measure(lambda: engine.grab(), args.iterations))
+        _report("engine, max_age_ms=250", _measure(lambda: engine.grab(max_age_ms=250), args.iterations))
+    finally:
+        engine.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Bytes on the wire and server CPU: full PNG captures vs. dirty-tile deltas.
+
+Uses synthetic desktop-like frames so it runs anywhere:
+
+    python benchmarks/bench_delta.py --width 1920 --height 1080
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from winuse.core.capture import Frame  # noqa: E402
+from winuse.core.delta import DeltaTracker  # noqa: E402
+
+
+def _desktop(width: int, height: int) -> np.ndarray:
+    rng = np.random.default_rng(7)
+    px = np.full((height, width, 4), 235, dtype=np.uint8)
+    px[:, :, 3] = 255
+    px[: height // 20] = (120, 60, 30, 255)  # title bar
+    # Text-ish noise in a few "paragraphs" so PNG has real work to do.
+    for top in range(height // 10, height - 40, 60):
+        px[top : top + 14, 40 : width - 40, :3] = rng.integers(0, 255, size=(14, width - 80, 3), dtype=np.uint8)
+    return px
+
+
+def _png(img: Image.Image) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _frame(frame_id: int, px: np.ndarray) -> Frame:
+    height, width = px.shape[:2]
+    return Frame(frame_id, time.monotonic(), 0, 0, width, height, px.tobytes())
+
+
+def _full(frame: Frame) -> int:
+    img = Image.frombytes("RGB", frame.size, frame.raw, "raw", "BGRX")
+    return len(base64.b64encode(_png(img)))
+
+
+def _delta(tracker: DeltaTracker, frame: Frame, since: int, tile: int) -> int:
+    _, rects = tracker.diff(frame, since, tile)
+    img = Image.frombytes("RGB", frame.size, frame.raw, "raw", "BGRX")
+    tiles = []
+    for r in rects:
+        data = _png(img.crop((r["x"], r["y"], r["x"] + r["width"], r["y"] + r["height"])))
+        tiles.append({**r, "data": base64.b64encode(data).decode("ascii")})
+    return len(json.dumps(tiles))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--tile", type=int, default=64)
+    parser.add_argument("--steps", type=int, default=10)
+    args = parser.parse_args()
+
+    px = _desktop(args.width, args.height)
+    frames = []
+    for step in range(args.steps + 1):
+        # Simulate typing: a short run of new glyphs per step on one line.
+        x = 60 + step * 24
+        px[args.height // 2 : args.height // 2 + 16, x : x + 20, :3] = (step * 20) % 255
+        frames.append(_frame(step + 1, px.copy()))
+
+    tracker = DeltaTracker()
+    tracker.diff(frames[0], None, args.tile)
+
+    full_bytes = delta_bytes = 0
+    full_cpu = delta_cpu = 0.0
+    for prev, frame in zip(frames, frames[1:]):
+        start = time.process_time()
+        full_bytes += _full(frame)
+        full_cpu += time.process_time() - start
+
+        start = time.process_time()
+        delta_bytes += _delta(tracker, frame, prev.frame_id, args.tile)
+        delta_cpu += time.process_time() - start
+
+    n = args.steps
+    print(f"{args.width}x{args.height}, tile {args.tile}, {n} steps")
+    print(f"full PNG   {full_bytes / n / 1024:10.1f} KiB/frame  {full_cpu / n * 1000:8.2f} ms CPU/frame")
+    print(f"delta      {delta_bytes / n / 1024:10.1f} KiB/frame  {delta_cpu / n * 1000:8.2f} ms CPU/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Input latency while slow captures are in flight: one shared pool vs. lanes.
+
+Floods the server-side executors with ``--captures`` jobs of ``--capture-ms``
+each (a stand-in for 4K grab + PNG encode) and times ``--presses`` short
+input jobs submitted behind them:
+
+    python benchmarks/bench_lanes.py --captures 64 --capture-ms 200 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from winuse.core.lanes import Lane, LaneLimits  # noqa: E402
+from winuse.core.timing import percentile  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--captures", type=int, default=64)
+    parser.add_argument("--capture-ms", type=float, default=200.0)
+    parser.add_argument("--presses", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=8, help="shared pool size, and the capture lane's")
+    args = parser.parse_args()
+
+    def capture() -> None:
+        time.sleep(args.capture_ms / 1000.0)
+
+    def press() -> None:
+        time.sleep(0.001)
+
+    def timed_presses(submit) -> list:
+        latencies = []
+        for _ in range(args.presses):
+            start = time.perf_counter()
+            submit(press).result()
+            latencies.append((time.perf_counter() - start) * 1000.0)
+        return latencies
+
+    shared = ThreadPoolExecutor(max_workers=args.workers)
+    for _ in range(args.captures):
+        shared.submit(capture)
+    shared_latencies = timed_presses(shared.submit)
+    shared.shutdown(wait=True)
+
+    input_lane = Lane("input", LaneLimits(workers=4, max_pending=args.presses + 4))
+    capture_lane = Lane("capture", LaneLimits(workers=args.workers, max_pending=args.captures), defer_to=input_lane)
+    for _ in range(args.captures):
+        capture_lane.submit(capture)
+    lane_latencies = timed_presses(input_lane.submit)
+    capture_lane.shutdown()
+    input_lane.shutdown()
+
+    print(f"{args.captures} captures x {args.capture_ms:.0f} ms on {args.workers} workers, {args.presses} presses")
+    for name, values in (("shared pool", shared_latencies), ("lanes", lane_latencies)):
+        print(
+            f"{name:12s} press p50 {percentile(values, 0.5):8.1f} ms  p95 {percentile(values, 0.95):8.1f} ms"
+            f"  max {max(values):8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
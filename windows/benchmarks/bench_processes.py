@@ -0,0 +1,110 @@
+"""Process lookups per /windows listing: uncached psutil calls vs. ProcessCache.
+
+Simulates a busy desktop (500 windows spread over a few dozen processes)
+with a fake psutil whose calls cost ``--call-us`` microseconds each, so it
+runs anywhere:
+
+    python benchmarks/bench_processes.py --windows 500 --processes 60 --call-us 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from winuse.core.processes import ProcessCache  # noqa: E402
+
+
+class SlowPsutil:
+    class NoSuchProcess(Exception):
+        pass
+
+    class AccessDenied(Exception):
+        pass
+
+    def __init__(self, procs: dict, call_s: float) -> None:
+        self.procs = procs
+        self.call_s = call_s
+        self.calls = 0
+
+    def _cost(self) -> None:
+        self.calls += 1
+        end = time.perf_counter() + self.call_s
+        while time.perf_counter() < end:
+            pass
+
+    def pids(self):
+        return list(self.procs)
+
+    def Process(self, pid):
+        self._cost()  # OpenProcess
+        if pid not in self.procs:
+            raise self.NoSuchProcess(pid)
+        api = self
+
+        class Proc:
+            def create_time(self):
+                api._cost()
+                return api.procs[pid][0]
+
+            def name(self):
+                api._cost()
+                return api.procs[pid][1]
+
+        return Proc()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--windows", type=int, default=500)
+    parser.add_argument("--processes", type=int, default=60)
+    parser.add_argument("--call-us", type=float, default=40.0)
+    parser.add_argument("--listings", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    procs = {1000 + i * 4: (float(i), f"app{i}.exe") for i in range(args.processes)}
+    pids = [rng.choice(list(procs)) for _ in range(args.windows)]
+    api = SlowPsutil(procs, args.call_us / 1e6)
+
+    def uncached() -> None:
+        for pid in pids:
+            try:
+                api.Process(pid).name()
+            except Exception:
+                pass
+
+    clock = [0.0]
+    cache = ProcessCache(backend=api, revalidate_s=5.0, clock=lambda: clock[0])
+
+    def cached() -> None:
+        for pid in pids:
+            cache.name(pid)
+
+    def run(fn, listings: int, step_s: float) -> tuple[float, float]:
+        api.calls = 0
+        start = time.perf_counter()
+        for _ in range(listings):
+            fn()
+            clock[0] += step_s
+        return (time.perf_counter() - start) / listings * 1000.0, api.calls / listings
+
+    n = args.listings
+    print(f"{args.windows} windows over {args.processes} processes, {args.call_us:.0f} us per psutil call")
+    rows = [
+        ("uncached", *run(uncached, n, 0.5)),
+        ("cache, first listing", *run(cached, 1, 0.0)),
+        ("cache, 2 listings/s", *run(cached, n, 0.5)),
+        ("cache, revalidating", *run(cached, n, 6.0)),
+    ]
+    for name, ms, calls in rows:
+        print(f"{name:22s} {ms:8.2f} ms/listing  {calls:8.1f} psutil calls/listing")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Typing cost: one input call per key (pyautogui.write) vs. batched SendInput.
+
+Builds the real KEYEVENTF_UNICODE event arrays and charges ``--call-us``
+microseconds per dispatch call (a stand-in for the user/kernel transition
+and pyautogui's per-key overhead), so it runs anywhere:
+
+    python benchmarks/bench_sendinput.py --chars 20000 --call-us 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from winuse.core.sendinput import UnicodeTyper, char_events, normalize_newlines, to_input_array  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chars", type=int, default=20000)
+    parser.add_argument("--call-us", type=float, default=50.0)
+    parser.add_argument("--batch-events", type=int, default=1000)
+    args = parser.parse_args()
+
+    line = "def main():  # Grüße, мир 👋\n"
+    text = (line * (args.chars // len(line) + 1))[: args.chars]
+    calls = [0]
+
+    def dispatch(events) -> int:
+        calls[0] += 1
+        to_input_array(events)
+        end = time.perf_counter() + args.call_us / 1e6
+        while time.perf_counter() < end:
+            pass
+        return len(events)
+
+    def per_key() -> None:
+        for ch in normalize_newlines(text):
+            for event in char_events(ch):
+                dispatch([event])
+
+    typer = UnicodeTyper(dispatch, batch_events=args.batch_events)
+
+    print(f"{len(text)} chars (mixed ASCII, accents, Cyrillic, emoji), {args.call_us:.0f} us per input call")
+    for name, fn in (("one call per key", per_key), ("batched SendInput", lambda: typer.type(text))):
+        calls[0] = 0
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        print(f"{name:18s} {elapsed * 1000.0:9.1f} ms  {calls[0]:7d} calls  {len(text) / elapsed:12,.0f} chars/s")
+
+
+if __name__ == "__main__":
+    main()
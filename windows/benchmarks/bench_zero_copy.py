@@ -0,0 +1,75 @@
+"""Time and Python-heap allocations per frame on the capture-to-encode path.
+
+Compares the old conversion (``ScreenShot.rgb`` then ``frombytes("RGB")``)
+with decoding mss's BGRA buffer directly, plus full-frame vs. row-sliced
+decoding for delta tiles. Uses a synthetic buffer so it runs anywhere:
+
+    python benchmarks/bench_zero_copy.py --width 3840 --height 2160
+
+tracemalloc only sees Python allocations; Pillow's own image memory is the
+same for every variant and is not included.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from mss.screenshot import ScreenShot
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from winuse.core.capture import Frame  # noqa: E402
+from winuse.core.delta import tile_hashes  # noqa: E402
+from winuse.core.encode import frame_image, rect_image  # noqa: E402
+
+
+def _measure(fn: Callable[[], object], repeat: int) -> tuple[float, int]:
+    fn()  # warm up
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / repeat * 1000.0, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--tile", type=int, default=64)
+    args = parser.parse_args()
+
+    width, height = args.width, args.height
+    raw = bytearray(bytes(range(256)) * (width * height * 4 // 256 + 1))[: width * height * 4]
+    monitor = {"left": 0, "top": 0, "width": width, "height": height}
+    frame = Frame(1, time.monotonic(), 0, 0, width, height, raw)
+    rects = [{"x": x, "y": height // 2, "width": 256, "height": 32} for x in range(0, width - 256, width // 4)]
+
+    cases = {
+        "frame: ScreenShot.rgb": lambda: Image.frombytes("RGB", (width, height), ScreenShot(raw, monitor).rgb),
+        "frame: raw BGRX": lambda: frame_image(frame),
+        "tiles: decode + crop": lambda: [
+            frame_image(frame).crop((r["x"], r["y"], r["x"] + r["width"], r["y"] + r["height"])) for r in rects
+        ],
+        "tiles: row slices": lambda: [rect_image(frame, r) for r in rects],
+        f"tile_hashes({args.tile})": lambda: tile_hashes(frame, args.tile),
+    }
+
+    print(f"{width}x{height} ({len(raw) / 2**20:.1f} MiB BGRA), {args.repeat} runs")
+    for name, fn in cases.items():
+        ms, peak = _measure(fn, args.repeat)
+        print(f"{name:24s} {ms:8.2f} ms  peak {peak / 2**20:8.2f} MiB Python")
+
+
+if __name__ == "__main__":
+    main()
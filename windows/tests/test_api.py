@@ -1,3 +1,4 @@
+import base64
 import os
 import time
 
@@ -87,3 +88,198 @@ def test_screenshot_full(client):
     file_url = body["data"]["url"]
     fr = client.get(file_url)
     assert fr.status_code == 200
+
+
+def test_screenshot_max_age_reuses_frame(client):
+    r = client.post("/screenshot", json={})
+    first = r.json()["data"]
+    r = client.post("/screenshot", json={"max_age_ms": 60000})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["success"] is True
+    assert body["data"]["frame_id"] == first["frame_id"]
+
+
+def test_screenshot_inline(client):
+    r = client.post("/screenshot", json={"inline": True})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("image/")
+    assert int(r.headers["x-winuse-width"]) > 0
+    assert r.content[:4] == b"\x89PNG"
+
+
+def test_screenshot_delta(client):
+    first = client.post("/screenshot", json={}).json()["data"]
+    r = client.get("/screenshot/delta", params={"since": first["frame_id"]})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["success"] is True
+    assert body["data"]["full"] is False
+    assert isinstance(body["data"]["tiles"], list)
+
+
+def test_screenshot_scaled_and_click_in_frame_space(client):
+    r = client.post("/screenshot", json={"max_width": 640})
+    body = r.json()
+    assert body["success"] is True
+    data = body["data"]
+    assert data["image_width"] <= 640
+    assert data["scale"] <= 1
+    r = client.post("/mouse/move", json={"x": 10, "y": 10, "frame_id": data["frame_id"]})
+    body = r.json()
+    assert body["success"] is True
+    assert body["data"]["x"] == data["left"] + round(10 / data["scale"])
+
+
+def test_monitors_and_monitor_screenshot(client):
+    r = client.get("/monitors")
+    body = r.json()
+    assert body["success"] is True
+    monitors = body["data"]
+    assert monitors[0]["index"] == 0
+    if len(monitors) > 1:
+        r = client.post("/screenshot", json={"monitor": 1})
+        data = r.json()["data"]
+        assert (data["width"], data["height"]) == (monitors[1]["width"], monitors[1]["height"])
+
+
+def test_screenshot_region(client):
+    r = client.post("/screenshot", json={"region": {"x": 0, "y": 0, "width": 100, "height": 50}})
+    body = r.json()
+    assert body["success"] is True
+    assert body["data"]["width"] <= 100
+    assert body["data"]["height"] <= 50
+
+
+def test_stream_mjpeg_first_frame(client):
+    with client.stream("GET", "/stream.mjpeg") as r:
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("multipart/x-mixed-replace")
+        buf = b""
+        for chunk in r.iter_bytes():
+            buf += chunk
+            if b"\xff\xd8" in buf:
+                break
+    assert buf.startswith(b"--frame")
+
+
+def test_metrics(client):
+    r = client.get("/metrics")
+    body = r.json()
+    assert body["success"] is True
+    assert "capture" in body["data"]
+    assert "stream" in body["data"]
+
+
+def test_pixels(client):
+    r = client.post("/pixels", json={"points": [{"x": 0, "y": 0}], "rects": [{"x": 0, "y": 0, "width": 4, "height": 4}]})
+    body = r.json()
+    assert body["success"] is True
+    assert body["data"]["region"]["width"] == 4
+    assert body["data"]["points"][0]["hex"].startswith("#")
+    assert len(body["data"]["rects"]) == 1
+
+
+def test_find_with_cached_template(client):
+    rect = {"x": 0, "y": 0, "width": 200, "height": 120}
+    shot = client.post("/screenshot", json={"region": rect, "inline": True, "format": "png"})
+    template = base64.b64encode(shot.content).decode("ascii")
+    body = client.post("/find", json={"template": template, "region": rect}).json()
+    if not body["success"]:
+        pytest.skip(body["error"]["message"])  # flat desktop corner
+    assert body["data"]["matches"][0]["x"] == 0
+    again = client.post("/find", json={"template_id": body["data"]["template_id"], "region": rect}).json()
+    assert again["success"] is True
+    assert again["data"]["template_id"] == body["data"]["template_id"]
+
+
+def test_wait_stable_and_timeout(client):
+    body = client.post("/wait", json={"until": "stable", "stable_ms": 50, "timeout_ms": 5000}).json()
+    assert body["success"] is True
+    assert body["data"]["frame_id"] >= 1
+    body = client.post(
+        "/wait", json={"until": "change", "region": {"x": 0, "y": 0, "width": 1, "height": 1}, "timeout_ms": 200}
+    ).json()
+    assert body["success"] is True
+    assert body["data"]["met"] in (True, False)
+    assert body["data"]["elapsed_ms"] <= 1000
+
+
+def test_windows_query_and_lookup(client):
+    body = client.get("/windows", params={"limit": 1, "fields": "title"}).json()
+    assert body["success"] is True
+    assert len(body["data"]) <= 1
+    if body["data"]:
+        w = body["data"][0]
+        assert set(w) == {"hwnd", "title"}
+        one = client.get(f"/windows/{w['hwnd']}").json()
+        assert one["success"] is True
+        assert one["data"]["title"] == w["title"]
+    assert client.get("/windows", params={"fields": "nope"}).json()["error"]["code"] == "WINDOW_QUERY_INVALID"
+    assert client.get("/windows/1").json()["error"]["code"] == "WINDOW_NOT_FOUND"
+
+
+def test_window_events_cursor(client):
+    body = client.get("/windows/events", params={"limit": 10}).json()
+    assert body["success"] is True
+    cursor = body["data"]["cursor"]
+    again = client.get("/windows/events", params={"since": cursor}).json()
+    assert again["data"]["gap"] is False
+    assert again["data"]["cursor"] >= cursor
+    assert client.get("/windows/events", params={"kinds": "nope"}).json()["error"]["code"] == "WINDOW_QUERY_INVALID"
+
+
+def test_actions_batch(client):
+    body = client.post(
+        "/actions",
+        json={"actions": [{"type": "move", "x": 10, "y": 10}, {"type": "wait", "until": "stable", "stable_ms": 0}]},
+    ).json()
+    assert body["success"] is True
+    assert [s["type"] for s in body["data"]["steps"]] == ["move", "wait"]
+    assert body["data"]["completed"] == 2
+    bad = client.post("/actions", json={"actions": [{"type": "move", "x": 1, "y": 1}, {"type": "press"}]}).json()
+    assert bad["error"]["code"] == "ACTION_INVALID"
+    stopped = client.post(
+        "/actions", json={"actions": [{"type": "move", "x": 1, "y": 1, "frame_id": 1 << 40}, {"type": "move", "x": 2, "y": 2}]}
+    ).json()
+    assert stopped["success"] is False
+    assert stopped["error"]["code"] == "FRAME_UNKNOWN"
+    assert len(stopped["data"]["steps"]) == 1
+
+
+def test_mouse_gestures(client):
+    body = client.post("/mouse/path", json={"points": [{"x": 20, "y": 20}, {"x": 40, "y": 30}], "duration_ms": 50}).json()
+    assert body["success"] is True
+    assert (body["data"]["x"], body["data"]["y"]) == (40, 30)
+    assert body["data"]["sent"] >= 1
+    scrolled = client.post("/mouse/scroll", json={"dy": 0, "dx": 0}).json()
+    assert scrolled["success"] is True
+    assert client.post("/mouse/drag", json={"points": [{"x": 1, "y": 1}]}).status_code == 422
+
+
+def test_input_is_serialized_per_session(client):
+    body = client.post("/mouse/move", json={"x": 10, "y": 10}, headers={"X-WinUse-Session": "test"}).json()
+    assert body["success"] is True
+    assert body["data"]["queue_ms"] >= 0
+    stats = client.get("/metrics").json()["data"]["input"]
+    assert stats["completed"] >= 1
+    assert stats["depth"] >= 0
+
+
+def test_window_relative_click_target(client):
+    assert client.post("/mouse/move", json={"hwnd": 1, "x": 1, "y": 1}).json()["error"]["code"] == "WINDOW_NOT_FOUND"
+    windows = client.get("/windows", params={"limit": 1}).json()["data"]
+    if not windows:
+        pytest.skip("No windows listed")
+    w = windows[0]
+    body = client.post("/mouse/move", json={"hwnd": w["hwnd"], "x": 0, "y": 0}).json()
+    assert body["success"] is True
+    assert (body["data"]["x"], body["data"]["y"]) == (w["rect"]["x"], w["rect"]["y"])
+    bad = client.post("/mouse/move", json={"hwnd": w["hwnd"], "x": 2, "y": 0.5, "normalized": True}).json()
+    assert bad["error"]["code"] == "MOUSE_TARGET_INVALID"
+
+
+def test_metrics_report_executor_lanes(client):
+    lanes = client.get("/metrics").json()["data"]["lanes"]
+    assert set(lanes) == {"input", "capture", "windows", "wait"}
+    assert all(lane["workers"] >= 1 and lane["active"] >= 0 for lane in lanes.values())
@@ -0,0 +1,151 @@
+import threading
+import time
+
+import pytest
+
+
+class Backend:
+    """Stands in for the input and window functions the handlers call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def record(self, *call):
+        self.calls.append((time.perf_counter(), *call))
+
+    def focus_window(self, hwnd, timeout_ms=1000):
+        self.record("focus", hwnd)
+        time.sleep(0.05)  # long enough for another batch to queue up behind it
+        return {"hwnd": hwnd, "strategy": "direct", "attempts": ["direct"], "elapsed_ms": 0.0}
+
+    def press_keys(self, keys, key_interval=0.0):
+        self.record("press", tuple(keys))
+
+    def click(self, x=None, y=None, **kwargs):
+        self.record("click", x, y)
+
+    def move(self, x, y, duration=0.0):
+        self.record("move", x, y)
+
+    @property
+    def names(self):
+        return [call[1:] for call in self.calls]
+
+
+@pytest.fixture
+def backend(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("WINUSE_OUTPUT_DIR", str(tmp_path / "captures"))
+    app_module = pytest.importorskip("winuse.app")  # Windows-only input dependencies
+    backend = Backend()
+    monkeypatch.setattr(app_module.windows, "focus_window", backend.focus_window)
+    monkeypatch.setattr(app_module.kb, "press_keys", backend.press_keys)
+    monkeypatch.setattr(app_module.mouse, "click", backend.click)
+    monkeypatch.setattr(app_module.mouse, "move", backend.move)
+    return backend
+
+
+@pytest.fixture
+def client(backend, tmp_path):
+    from fastapi.testclient import TestClient
+
+    from winuse.app import create_app
+    from winuse.config import load_settings
+
+    # Not entered as a context manager: the lifespan would hook real windows.
+    return TestClient(create_app(load_settings(str(tmp_path / "config.yaml"))))
+
+
+def test_actions_reject_unknown_step_fields_before_running(client, backend):
+    body = client.post("/actions", json={"actions": [{"type": "press", "keys": ["a"]}, {"type": "click", "X": 5}]}).json()
+    assert body["success"] is False
+    assert body["error"]["code"] == "ACTION_INVALID"
+    assert "Step 1 (click)" in body["error"]["message"] and "X" in body["error"]["message"]
+    assert backend.calls == []
+
+
+def test_actions_result_shape(client, backend):
+    body = client.post(
+        "/actions", json={"actions": [{"type": "focus", "hwnd": 42}, {"type": "click", "x": 5, "y": 6}]}
+    ).json()
+    assert body["success"] is True and body["error"] is None
+    assert backend.names == [("focus", 42), ("click", 5, 6)]
+    data = body["data"]
+    assert (data["completed"], data["total"]) == (2, 2)
+    assert data["elapsed_ms"] >= 0
+    focus, click = data["steps"]
+    assert set(focus) == {"index", "type", "success", "data", "error", "elapsed_ms"}
+    assert (focus["index"], focus["type"], focus["data"]["strategy"]) == (0, "focus", "direct")
+    assert (click["index"], click["type"], click["data"]["x"], click["data"]["y"]) == (1, "click", 5, 6)
+
+
+def test_actions_stop_on_error(client, backend):
+    steps = [{"type": "move", "x": 1, "y": 1, "frame_id": 1 << 40}, {"type": "press", "keys": ["a"]}]
+    body = client.post("/actions", json={"actions": steps}).json()
+    assert body["success"] is False
+    assert body["error"]["code"] == "FRAME_UNKNOWN"
+    assert body["error"]["message"].startswith("Step 0 (move)")
+    assert len(body["data"]["steps"]) == 1 and body["data"]["completed"] == 0
+    assert backend.calls == []
+
+    body = client.post("/actions", json={"actions": steps, "stop_on_error": False}).json()
+    assert body["success"] is False
+    assert [s["success"] for s in body["data"]["steps"]] == [False, True]
+    assert backend.names == [("press", ("a",))]
+
+
+def test_actions_per_step_delay_overrides_default(client, backend):
+    body = client.post(
+        "/actions",
+        json={
+            "actions": [
+                {"type": "press", "keys": ["a"], "delay_ms": 0},
+                {"type": "press", "keys": ["b"]},
+                {"type": "press", "keys": ["c"]},
+            ],
+            "delay_ms": 80,
+        },
+    ).json()
+    assert body["success"] is True
+    (a, _, _), (b, _, _), (c, _, _) = backend.calls
+    assert b - a < 0.08
+    assert c - b >= 0.08
+
+
+def test_concurrent_batches_do_not_interleave(client, backend):
+    results = {}
+
+    def batch(session, hwnd, key):
+        steps = [{"type": "focus", "hwnd": hwnd}, {"type": "press", "keys": ["ctrl", key]}]
+        results[session] = client.post("/actions", json={"actions": steps}, headers={"X-WinUse-Session": session}).json()
+
+    threads = [threading.Thread(target=batch, args=args) for args in (("a", 42, "a"), ("b", 43, "b"))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    assert results["a"]["success"] and results["b"]["success"]
+    names = backend.names
+    assert sorted(names) == sorted([("focus", 42), ("press", ("ctrl", "a")), ("focus", 43), ("press", ("ctrl", "b"))])
+    # Each session's keys follow its own focus, not the other session's.
+    for focus, keys in ((("focus", 42), ("press", ("ctrl", "a"))), (("focus", 43), ("press", ("ctrl", "b")))):
+        assert names[names.index(focus) + 1] == keys
+
+
+def test_batch_delays_do_not_hold_other_sessions_input(client, backend):
+    results = {}
+
+    def batch():
+        steps = [{"type": "press", "keys": ["a"], "delay_ms": 400}, {"type": "press", "keys": ["b"]}]
+        results["batch"] = client.post("/actions", json={"actions": steps}, headers={"X-WinUse-Session": "a"}).json()
+
+    thread = threading.Thread(target=batch)
+    thread.start()
+    deadline = time.time() + 5
+    while not backend.calls and time.time() < deadline:
+        time.sleep(0.005)
+    click = client.post("/mouse/click", json={"x": 1, "y": 1}, headers={"X-WinUse-Session": "b"}).json()
+    thread.join(10)
+    assert click["success"] and click["data"]["queue_ms"] < 100
+    assert results["batch"]["success"]
+    assert backend.names == [("press", ("a",)), ("click", 1, 1), ("press", ("b",))]
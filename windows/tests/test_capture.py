@@ -0,0 +1,172 @@
+import threading
+import time
+
+import pytest
+
+from winuse.core.capture import CaptureEngine, clip_region
+
+FULL = {"left": 0, "top": 0, "width": 8, "height": 4}
+
+
+class SyntheticSource:
+    """Produces solid BGRA frames whose colour increments on every grab."""
+
+    def __init__(self, delay_s: float = 0.0) -> None:
+        self.delay_s = delay_s
+        self.grabs = 0
+        self.closed = False
+        self.threads = set()
+
+    def full_region(self):
+        return dict(FULL)
+
+    def monitors(self):
+        return [dict(FULL), {"left": 0, "top": 0, "width": 4, "height": 4}, {"left": 4, "top": 0, "width": 4, "height": 4}]
+
+    def grab(self, region):
+        self.threads.add(threading.get_ident())
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        self.grabs += 1
+        value = self.grabs % 256
+        return bytes([value, value, value, 255]) * (region["width"] * region["height"])
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def source():
+    return SyntheticSource()
+
+
+@pytest.fixture
+def engine(source):
+    eng = CaptureEngine(lambda: source, ring_size=4)
+    yield eng
+    eng.stop()
+
+
+def test_grab_returns_full_frame(engine, source):
+    frame = engine.grab()
+    assert frame.size == (8, 4)
+    assert len(frame.raw) == 8 * 4 * 4
+    assert source.grabs == 1
+
+
+def test_max_age_reuses_buffered_frame(engine, source):
+    first = engine.grab()
+    second = engine.grab(max_age_ms=10_000)
+    assert second.frame_id == first.frame_id
+    assert source.grabs == 1
+    assert engine.stats()["cache_hits"] == 1
+
+
+def test_no_max_age_always_grabs(engine, source):
+    first = engine.grab()
+    second = engine.grab()
+    assert second.frame_id > first.frame_id
+    assert source.grabs == 2
+
+
+def test_stale_frame_is_regrabbed(engine, source):
+    first = engine.grab()
+    time.sleep(0.02)
+    second = engine.grab(max_age_ms=1)
+    assert second.frame_id != first.frame_id
+
+
+def test_region_frames_do_not_satisfy_full_requests(engine, source):
+    region = {"left": 2, "top": 1, "width": 2, "height": 2}
+    small = engine.grab(region)
+    assert small.size == (2, 2)
+    full = engine.grab(max_age_ms=10_000)
+    assert full.frame_id != small.frame_id
+    assert engine.grab(region, max_age_ms=10_000).frame_id == small.frame_id
+
+
+def test_ring_buffer_is_bounded(engine):
+    ids = [engine.grab().frame_id for _ in range(6)]
+    assert engine.get(ids[0]) is None
+    assert engine.get(ids[-1]) is not None
+    assert engine.stats()["buffered"] == 4
+
+
+def test_grabs_happen_on_engine_thread(engine, source):
+    engine.grab()
+    engine.grab()
+    assert len(source.threads) == 1
+    assert threading.get_ident() not in source.threads
+
+
+def test_concurrent_requests_share_a_grab():
+    source = SyntheticSource(delay_s=0.05)
+    engine = CaptureEngine(lambda: source)
+    try:
+        engine.grab()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(engine.grab())) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(results) == 8
+        assert source.grabs < 9
+    finally:
+        engine.stop()
+
+
+def test_source_errors_propagate():
+    class Broken(SyntheticSource):
+        def grab(self, region):
+            raise OSError("no display")
+
+    engine = CaptureEngine(Broken)
+    try:
+        with pytest.raises(OSError):
+            engine.grab()
+    finally:
+        engine.stop()
+
+
+def test_stop_closes_source(engine, source):
+    engine.grab()
+    engine.stop()
+    assert source.closed
+    assert not engine.is_running()
+
+
+def test_refresh_keeps_warm_frame(source):
+    engine = CaptureEngine(lambda: source, refresh_ms=5)
+    try:
+        engine.start()
+        deadline = time.monotonic() + 2
+        while engine.latest(max_age_ms=1000) is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert engine.latest(max_age_ms=1000) is not None
+    finally:
+        engine.stop()
+
+
+def test_monitors_are_queried_on_engine_thread(engine, source):
+    assert [m["width"] for m in engine.monitors()] == [8, 4, 4]
+    assert engine.run(lambda src: threading.get_ident()) != threading.get_ident()
+
+
+def test_run_propagates_errors(engine):
+    def boom(_source):
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError):
+        engine.run(boom)
+
+
+def test_clip_region():
+    bounds = {"left": -100, "top": 0, "width": 200, "height": 100}
+    assert clip_region({"left": 50, "top": 90, "width": 100, "height": 100}, bounds) == {
+        "left": 50,
+        "top": 90,
+        "width": 50,
+        "height": 10,
+    }
+    assert clip_region({"left": 200, "top": 0, "width": 10, "height": 10}, bounds) is None
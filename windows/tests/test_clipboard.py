@@ -0,0 +1,249 @@
+import pytest
+
+from winuse.core import clipboard as clipboard_module
+from winuse.core.clipboard import CF_HDROP, ClipboardBusy, ClipboardTooLarge, PasteEngine, drop_files, split_chunks
+
+
+class FakeClipboard:
+    def __init__(self, contents=None, busy=0):
+        self.contents = list(contents or [(13, "user text"), (49161, b"\x01\x02")])
+        self.busy = busy
+        self.opened = False
+        self.seq = 1
+
+    def open(self):
+        assert not self.opened
+        if self.busy:
+            self.busy -= 1
+            raise ClipboardBusy("Access is denied.")
+        self.opened = True
+
+    def close(self):
+        self.opened = False
+
+    def snapshot(self, max_bytes):
+        assert self.opened
+        if sum(len(data) for _, data in self.contents) > max_bytes:
+            raise ClipboardTooLarge("too large")
+        return list(self.contents)
+
+    def restore(self, snapshot):
+        assert self.opened
+        self.contents = list(snapshot)
+        self.seq += 1
+
+    def set_text(self, text):
+        assert self.opened
+        self.contents = [(13, text)]
+        self.seq += 1
+
+    def sequence(self):
+        return self.seq
+
+
+class Target:
+    """Records what the focused app would receive for each paste key press."""
+
+    def __init__(self, clipboard):
+        self.clipboard = clipboard
+        self.received = []
+
+    def press(self, keys):
+        self.received.append(dict(self.clipboard.contents)[13])
+
+
+class Timers:
+    """Collects deferred restores; ``run`` fires them as the timer thread would."""
+
+    def __init__(self):
+        self.pending = []
+
+    def __call__(self, delay, fn):
+        self.pending.append((delay, fn))
+
+    def run(self):
+        pending, self.pending = self.pending, []
+        for _, fn in pending:
+            fn()
+
+
+def engine(clipboard, target, **kwargs):
+    sleeps = kwargs.pop("sleeps", [])
+    timers = kwargs.pop("timers", Timers())
+    return PasteEngine(clipboard, target.press, sleep=sleeps.append, defer=timers, **kwargs)
+
+
+def test_split_prefers_line_ends_and_keeps_everything():
+    text = "".join(f"line {i}\n" for i in range(1000))
+    chunks = split_chunks(text, 500)
+    assert "".join(chunks) == text
+    assert all(len(c) <= 500 for c in chunks)
+    assert all(c.endswith("\n") for c in chunks)
+    assert split_chunks("x" * 1200, 500) == ["x" * 500, "x" * 500, "x" * 200]
+    assert split_chunks("short", 0) == ["short"]
+
+
+def test_paste_restores_previous_clipboard_after_settle():
+    clipboard = FakeClipboard()
+    before = list(clipboard.contents)
+    target = Target(clipboard)
+    timers = Timers()
+    paste = engine(clipboard, target, settle_s=0.15, timers=timers)
+    result = paste.paste("hello")
+    assert target.received == ["hello"]
+    assert result["restore_pending"] and result["chunks"] == 1 and result["chars"] == 5
+    assert result["chars_per_s"] > 0
+    assert clipboard.contents == [(13, "hello")]  # restored later, not by the caller
+    assert [delay for delay, _ in timers.pending] == [0.15]
+    timers.run()
+    assert clipboard.contents == before
+    assert paste.stats()["restored"] == 1
+
+
+def test_large_text_is_pasted_in_chunks_settle_apart():
+    clipboard = FakeClipboard()
+    target = Target(clipboard)
+    sleeps = []
+    text = "abcdefghij" * 100
+    result = engine(clipboard, target, chunk_chars=300, settle_s=0.1, sleeps=sleeps).paste(text)
+    assert "".join(target.received) == text
+    assert result["chunks"] == 4
+    assert sleeps == [0.1, 0.1, 0.1]  # between chunks only
+
+
+def test_back_to_back_pastes_share_one_restore():
+    clipboard = FakeClipboard()
+    before = list(clipboard.contents)
+    target = Target(clipboard)
+    timers = Timers()
+    paste = engine(clipboard, target, timers=timers)
+    paste.paste("one")
+    paste.paste("two")  # before the first restore fired: must not snapshot "one"
+    assert target.received == ["one", "two"]
+    timers.run()
+    assert clipboard.contents == before
+    assert paste.stats()["restored"] == 1
+
+
+def test_restore_skipped_if_clipboard_changed_since_paste():
+    clipboard = FakeClipboard()
+    target = Target(clipboard)
+    timers = Timers()
+    paste = engine(clipboard, target, timers=timers)
+    paste.paste("hello")
+    clipboard.contents, clipboard.seq = [(13, "user copied this")], clipboard.seq + 1
+    timers.run()
+    assert clipboard.contents == [(13, "user copied this")]
+    assert paste.stats()["restore_superseded"] == 1
+
+
+def test_restore_gives_up_after_timeout_when_busy():
+    clipboard = FakeClipboard()
+    target = Target(clipboard)
+    timers = Timers()
+    now = {"t": 0.0}
+
+    def sleep(seconds):
+        now["t"] += seconds
+
+    paste = PasteEngine(
+        clipboard, target.press, restore_timeout_s=0.5, clock=lambda: now["t"], sleep=sleep, defer=timers
+    )
+    paste.paste("hello")
+    clipboard.busy = 1000
+    timers.run()
+    assert 0.5 <= now["t"] < 1.0
+    assert paste.stats()["restore_failed"] == 1
+    assert clipboard.contents == [(13, "hello")]
+
+
+def test_no_restore_skips_snapshot():
+    clipboard = FakeClipboard()
+    target = Target(clipboard)
+    timers = Timers()
+    result = engine(clipboard, target, timers=timers).paste("hi", restore=False)
+    assert clipboard.contents == [(13, "hi")]
+    assert timers.pending == [] and result["restore_pending"] is False
+
+
+def test_busy_clipboard_is_retried_with_backoff():
+    clipboard = FakeClipboard(busy=3)
+    target = Target(clipboard)
+    sleeps = []
+    paste = engine(clipboard, target, backoff_s=0.005, sleeps=sleeps)
+    paste.paste("x")
+    assert sleeps == [0.005, 0.01, 0.02]
+    assert paste.stats()["open_retries"] == 3
+
+
+def test_busy_clipboard_gives_up_after_attempts():
+    clipboard = FakeClipboard(busy=100)
+    with pytest.raises(ClipboardBusy):
+        engine(clipboard, Target(clipboard), open_attempts=4).paste("x")
+
+
+def test_clipboard_is_restored_even_if_paste_fails():
+    clipboard = FakeClipboard()
+    before = list(clipboard.contents)
+    timers = Timers()
+
+    def broken(keys):
+        raise RuntimeError("input blocked")
+
+    with pytest.raises(RuntimeError):
+        PasteEngine(clipboard, broken, defer=timers).paste("secret")
+    timers.run()
+    assert clipboard.contents == before
+
+
+def test_flush_restores_immediately():
+    clipboard = FakeClipboard()
+    before = list(clipboard.contents)
+    paste = engine(clipboard, Target(clipboard))
+    paste.paste("hello")
+    paste.flush()
+    assert clipboard.contents == before
+
+
+def test_oversized_clipboard_is_not_partially_restored():
+    clipboard = FakeClipboard([(13, "x" * 100), (49161, b"\x01" * 100)])
+    target = Target(clipboard)
+    timers = Timers()
+    paste = engine(clipboard, target, max_snapshot_bytes=150, timers=timers)
+    result = paste.paste("hello")
+    assert target.received == ["hello"]
+    assert clipboard.contents == [(13, "hello")]
+    assert result["restore_pending"] is False and result["restore_error"] == "too large"
+    assert timers.pending == []
+    assert paste.stats()["restore_skipped"] == 1
+
+
+class FakeWin32Clipboard:
+    """The slice of pywin32's win32clipboard that ``Win32Clipboard.snapshot`` reads."""
+
+    def __init__(self, formats):
+        self.formats = formats
+
+    def EnumClipboardFormats(self, fmt):
+        order = list(self.formats)
+        index = order.index(fmt) + 1 if fmt else 0
+        return order[index] if index < len(order) else 0
+
+    def GetClipboardData(self, fmt):
+        return self.formats[fmt]
+
+
+def test_win32_snapshot_keeps_file_lists_and_refuses_partial(monkeypatch):
+    files = ("C:\\a.txt", "C:\\b\u00e9.txt")
+    monkeypatch.setattr(clipboard_module, "win32clipboard", FakeWin32Clipboard({13: "text", CF_HDROP: files}))
+    snapshot = clipboard_module.Win32Clipboard().snapshot(1 << 20)
+    assert snapshot == [(13, "text"), (CF_HDROP, drop_files(files))]
+    with pytest.raises(ClipboardTooLarge):
+        clipboard_module.Win32Clipboard().snapshot(10)
+
+
+def test_drop_files_layout():
+    block = drop_files(["C:\\a", "D:\\b"])
+    assert block[:4] == (20).to_bytes(4, "little")  # paths start after the header
+    assert block[16:20] == (1).to_bytes(4, "little")  # wide characters
+    assert block[20:].decode("utf-16-le") == "C:\\a\0D:\\b\0\0"
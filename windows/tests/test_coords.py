@@ -0,0 +1,47 @@
+import pytest
+
+from winuse.core.coords import FrameMapping, FrameMappings, rect_point, scaled_size
+
+
+def test_scaled_size_never_upscales():
+    assert scaled_size(1920, 1080) == (1920, 1080)
+    assert scaled_size(1920, 1080, max_width=4000) == (1920, 1080)
+
+
+def test_scaled_size_uses_smallest_factor():
+    assert scaled_size(3840, 2160, max_width=1280) == (1280, 720)
+    assert scaled_size(3840, 2160, scale=0.25) == (960, 540)
+    assert scaled_size(3840, 2160, scale=0.5, max_width=1280) == (1280, 720)
+
+
+def test_mapping_translates_scaled_coordinates_to_screen():
+    mapping = FrameMapping(frame_id=1, left=-1920, top=0, scale_x=0.5, scale_y=0.5)
+    assert mapping.to_screen(100, 50) == (-1720, 100)
+
+
+def test_registry_is_bounded_and_reports_unknown_frames():
+    mappings = FrameMappings(capacity=2)
+    for frame_id in (1, 2, 3):
+        mappings.record(FrameMapping(frame_id, 0, 0, 1.0, 1.0))
+    assert mappings.get(1) is None
+    assert mappings.to_screen(3, 10, 20) == (10, 20)
+    with pytest.raises(KeyError):
+        mappings.to_screen(1, 0, 0)
+
+
+def test_rect_point_offsets_and_fractions():
+    rect = {"x": -1900, "y": 100, "width": 800, "height": 600}
+    assert rect_point(rect, 10, 20) == (-1890, 120)
+    assert rect_point(rect, 0.5, 0.5, normalized=True) == (-1500, 400)
+    assert rect_point(rect, 1.0, 1.0, normalized=True) == (-1101, 699)
+    assert rect_point(rect, 0, 0, normalized=True) == (-1900, 100)
+
+
+def test_rect_point_rejects_points_outside_the_rect():
+    rect = {"x": 0, "y": 0, "width": 100, "height": 50}
+    with pytest.raises(ValueError):
+        rect_point(rect, 100, 10)
+    with pytest.raises(ValueError):
+        rect_point(rect, -1, 10)
+    with pytest.raises(ValueError):
+        rect_point(rect, 1.5, 0.5, normalized=True)
@@ -0,0 +1,87 @@
+import numpy as np
+
+from winuse.core.capture import Frame
+from winuse.core.delta import DeltaTracker, changed_rects, tile_hashes
+
+
+def make_frame(frame_id, pixels, left=0, top=0):
+    height, width = pixels.shape[:2]
+    return Frame(frame_id, 0.0, left, top, width, height, np.ascontiguousarray(pixels).tobytes())
+
+
+def base_pixels(width=200, height=130):
+    rng = np.random.default_rng(1)
+    return rng.integers(0, 255, size=(height, width, 4), dtype=np.uint8)
+
+
+def test_identical_frames_have_identical_hashes():
+    px = base_pixels()
+    assert np.array_equal(tile_hashes(make_frame(1, px), 32), tile_hashes(make_frame(2, px.copy()), 32))
+
+
+def test_hash_grid_covers_partial_edge_tiles():
+    assert tile_hashes(make_frame(1, base_pixels(200, 130)), 64).shape == (3, 4)
+
+
+def test_single_pixel_change_marks_one_tile():
+    px = base_pixels()
+    changed = px.copy()
+    changed[70, 150, 0] ^= 0xFF
+    mask = tile_hashes(make_frame(1, px), 32) != tile_hashes(make_frame(2, changed), 32)
+    assert mask.sum() == 1
+    assert mask[2, 4]
+
+
+def test_swapped_pixels_within_tile_are_detected():
+    px = base_pixels()
+    swapped = px.copy()
+    swapped[0, 0], swapped[0, 1] = px[0, 1].copy(), px[0, 0].copy()
+    assert (tile_hashes(make_frame(1, px), 32) != tile_hashes(make_frame(2, swapped), 32)).any()
+
+
+def test_changed_rects_merge_runs_and_clip_edges():
+    mask = np.array([[False, True, True, False], [False, False, False, True]])
+    rects = changed_rects(mask, 64, 200, 100)
+    assert rects == [
+        {"x": 64, "y": 0, "width": 128, "height": 64},
+        {"x": 192, "y": 64, "width": 8, "height": 36},
+    ]
+
+
+def test_tracker_reports_only_changed_region():
+    tracker = DeltaTracker()
+    px = base_pixels()
+    first = make_frame(1, px)
+    changed = px.copy()
+    changed[5:10, 5:10] = 0
+    full, rects = tracker.diff(first, None, 64)
+    assert full
+    full, rects = tracker.diff(make_frame(2, changed), 1, 64)
+    assert not full
+    assert rects == [{"x": 0, "y": 0, "width": 64, "height": 64}]
+
+
+def test_tracker_hashes_reference_frame_on_demand():
+    tracker = DeltaTracker()
+    px = base_pixels()
+    full, rects = tracker.diff(make_frame(2, px), 1, 64, reference=make_frame(1, px))
+    assert not full
+    assert rects == []
+
+
+def test_tracker_falls_back_to_full_on_geometry_change():
+    tracker = DeltaTracker()
+    px = base_pixels()
+    tracker.diff(make_frame(1, px), None, 64)
+    full, rects = tracker.diff(make_frame(2, px, left=10), 1, 64)
+    assert full
+    assert rects == [{"x": 0, "y": 0, "width": 200, "height": 130}]
+
+
+def test_tracker_history_is_bounded():
+    tracker = DeltaTracker(history=2)
+    px = base_pixels()
+    for frame_id in range(1, 4):
+        tracker.diff(make_frame(frame_id, px), None, 64)
+    full, _ = tracker.diff(make_frame(4, px), 1, 64)
+    assert full
@@ -0,0 +1,117 @@
+import threading
+
+import pytest
+
+from winuse.core.dispatch import InputDispatcher, InputOverloaded
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def blocked(dispatcher):
+    """Occupy the input thread until the returned event is set."""
+    release = threading.Event()
+    running = threading.Event()
+
+    def hold():
+        running.set()
+        release.wait(5)
+
+    future = dispatcher.submit(hold)
+    assert running.wait(5)
+    return release, future
+
+
+def test_run_returns_value_and_timings():
+    dispatcher = InputDispatcher()
+    try:
+        done = dispatcher.run(lambda: 42)
+        assert done.value == 42
+        assert done.queue_ms >= 0 and done.run_ms >= 0
+        assert dispatcher.stats()["completed"] == 1
+    finally:
+        dispatcher.stop()
+
+
+def test_errors_propagate_to_the_caller():
+    dispatcher = InputDispatcher()
+    try:
+        with pytest.raises(ZeroDivisionError):
+            dispatcher.run(lambda: 1 / 0)
+        assert dispatcher.stats()["failed"] == 1
+    finally:
+        dispatcher.stop()
+
+
+def test_sessions_keep_order_and_take_turns():
+    dispatcher = InputDispatcher()
+    order = []
+    try:
+        release, first = blocked(dispatcher)
+        futures = [dispatcher.submit(lambda n=n: order.append(("a", n)), "a") for n in range(3)]
+        futures += [dispatcher.submit(lambda n=n: order.append(("b", n)), "b") for n in range(2)]
+        release.set()
+        for future in [first, *futures]:
+            future.result(5)
+        assert order == [("a", 0), ("b", 0), ("a", 1), ("b", 1), ("a", 2)]
+    finally:
+        dispatcher.stop()
+
+
+def test_full_queue_is_rejected():
+    dispatcher = InputDispatcher(max_queue=3, max_per_session=2)
+    try:
+        release, first = blocked(dispatcher)
+        dispatcher.submit(lambda: None, "a")
+        dispatcher.submit(lambda: None, "a")
+        with pytest.raises(InputOverloaded, match="Session 'a'"):
+            dispatcher.submit(lambda: None, "a")
+        dispatcher.submit(lambda: None, "b")
+        with pytest.raises(InputOverloaded, match="full"):
+            dispatcher.submit(lambda: None, "c")
+        stats = dispatcher.stats()
+        assert stats["rejected"] == 2 and stats["depth"] == 3 and stats["sessions"] == 2
+        release.set()
+        first.result(5)
+    finally:
+        dispatcher.stop()
+
+
+def test_stale_actions_are_dropped():
+    clock = FakeClock()
+    dispatcher = InputDispatcher(max_wait_s=1.0, clock=clock)
+    ran = []
+    try:
+        release, first = blocked(dispatcher)
+        late = dispatcher.submit(lambda: ran.append(1))
+        clock.now += 2.0
+        release.set()
+        first.result(5)
+        with pytest.raises(InputOverloaded, match="waited"):
+            late.result(5)
+        assert ran == []
+        assert dispatcher.stats()["expired"] == 1
+    finally:
+        dispatcher.stop()
+
+
+def test_nested_run_executes_inline():
+    dispatcher = InputDispatcher()
+    try:
+        done = dispatcher.run(lambda: dispatcher.run(lambda: threading.current_thread().name).value)
+        assert done.value == "winuse-input"
+    finally:
+        dispatcher.stop()
+
+
+def test_stopped_dispatcher_rejects():
+    dispatcher = InputDispatcher()
+    dispatcher.run(lambda: None)
+    dispatcher.stop()
+    with pytest.raises(InputOverloaded):
+        dispatcher.submit(lambda: None)
@@ -0,0 +1,100 @@
+import io
+import threading
+
+import pytest
+from PIL import Image
+
+from winuse.core.capture import Frame
+from winuse.core.encode import Encoder, EncoderProfile, encode_image, frame_image, rect_image
+
+
+def make_frame(width=32, height=16):
+    raw = bytes([10, 20, 30, 255]) * (width * height)
+    return Frame(1, 0.0, 0, 0, width, height, raw)
+
+
+def test_frame_image_converts_bgra_to_rgb():
+    img = frame_image(make_frame())
+    assert img.mode == "RGB"
+    assert img.getpixel((0, 0)) == (30, 20, 10)
+
+
+@pytest.mark.parametrize(
+    "profile, pil_format",
+    [
+        (EncoderProfile("png", png_compress_level=0), "PNG"),
+        (EncoderProfile("jpg", quality=50), "JPEG"),
+        (EncoderProfile("webp", lossless=True), "WEBP"),
+    ],
+)
+def test_encode_image_formats(profile, pil_format):
+    encoded = encode_image(frame_image(make_frame()), profile)
+    assert Image.open(io.BytesIO(encoded.data)).format == pil_format
+    assert encoded.encode_ms >= 0
+
+
+def test_png_compress_level_changes_output_size():
+    img = Image.effect_noise((128, 128), 40).convert("RGB")
+    fast = encode_image(img, EncoderProfile("png", png_compress_level=0)).data
+    small = encode_image(img, EncoderProfile("png", png_compress_level=9)).data
+    assert len(small) < len(fast)
+
+
+def test_profile_validation_and_overrides():
+    with pytest.raises(ValueError):
+        EncoderProfile("gif")
+    with pytest.raises(ValueError):
+        EncoderProfile(quality=0)
+    base = EncoderProfile("JPEG")
+    assert base.format == "jpeg"
+    assert base.extension == "jpg"
+    assert base.media_type == "image/jpeg"
+    assert base.with_overrides(quality=None) is base
+    assert base.with_overrides(format="webp", quality=60) == EncoderProfile("webp", quality=60)
+
+
+def test_encoder_runs_on_worker_threads():
+    encoder = Encoder(EncoderProfile("png"), workers=2)
+    try:
+        caller = threading.get_ident()
+        seen = []
+        original = encoder._pool.submit
+
+        def submit(fn, *args):
+            return original(lambda: (seen.append(threading.get_ident()), fn(*args))[1])
+
+        encoder._pool.submit = submit
+        encoded = encoder.encode(make_frame())
+        assert encoded.data[:4] == b"\x89PNG"
+        assert seen and seen[0] != caller
+    finally:
+        encoder.shutdown()
+
+
+def test_encode_rects_preserves_order():
+    encoder = Encoder(EncoderProfile("png"))
+    try:
+        rects = [{"x": 0, "y": 0, "width": 4, "height": 4}, {"x": 8, "y": 2, "width": 10, "height": 6}]
+        sizes = [Image.open(io.BytesIO(e.data)).size for e in encoder.encode_rects(make_frame(), rects)]
+        assert sizes == [(4, 4), (10, 6)]
+    finally:
+        encoder.shutdown()
+
+
+def test_save_writes_file(tmp_path):
+    encoder = Encoder(EncoderProfile("jpg"))
+    try:
+        path = tmp_path / "out.jpg"
+        encoded = encoder.save(make_frame(), str(path))
+        assert path.read_bytes() == encoded.data
+    finally:
+        encoder.shutdown()
+
+
+def test_rect_image_matches_full_decode_crop():
+    width, height = 12, 9
+    raw = bytes(b for i in range(width * height) for b in (i % 251, (i * 7) % 251, (i * 13) % 251, 255))
+    frame = Frame(1, 0.0, 0, 0, width, height, raw)
+    rect = {"x": 3, "y": 2, "width": 5, "height": 4}
+    expected = frame_image(frame).crop((3, 2, 8, 6))
+    assert rect_image(frame, rect).tobytes() == expected.tobytes()
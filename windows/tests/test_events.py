@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from test_registry import FakeBackend
+from winuse.core.events import EventLog, WindowEventHub, parse_kinds
+from winuse.core.registry import WindowRegistry
+
+
+@pytest.fixture
+def desktop():
+    backend = FakeBackend()
+    backend.add(1, "Notepad", emit=False)
+    backend.add(2, "Terminal", emit=False)
+    return backend
+
+
+def attached(backend, **kwargs):
+    registry = WindowRegistry(backend, ttl_s=0.0)
+    registry.start()
+    hub = WindowEventHub(registry, **kwargs)
+    hub.attach()
+    return hub
+
+
+def kinds_of(events):
+    return [(e.kind, e.hwnd) for e in events]
+
+
+def test_log_resumes_from_cursor():
+    log = EventLog(capacity=8)
+    for hwnd in (1, 2, 3):
+        log.append("create", hwnd, None)
+    events, gap, cursor = log.read(1)
+    assert [e.seq for e in events] == [2, 3]
+    assert not gap and cursor == 3
+    assert log.read(cursor)[0] == []
+
+
+def test_log_reports_gap_after_overflow_or_restart():
+    log = EventLog(capacity=2)
+    for hwnd in range(5):
+        log.append("create", hwnd, None)
+    events, gap, _ = log.read(1)
+    assert gap and [e.seq for e in events] == [4, 5]
+    assert log.read(3)[1:] == (False, 5)
+    assert log.read(99)[1]
+
+
+def test_log_kind_filter_still_advances_cursor():
+    log = EventLog()
+    log.append("location", 1, None)
+    log.append("foreground", 1, None)
+    log.append("location", 1, None)
+    events, _, cursor = log.read(0, frozenset({"foreground"}))
+    assert [e.seq for e in events] == [2]
+    assert cursor == 3
+
+
+def test_log_limit_stops_cursor_at_last_returned():
+    log = EventLog()
+    for hwnd in range(4):
+        log.append("create", hwnd, None)
+    events, _, cursor = log.read(0, limit=2)
+    assert [e.seq for e in events] == [1, 2] and cursor == 2
+
+
+def test_parse_kinds():
+    assert parse_kinds(None) is None
+    assert parse_kinds("create, foreground") == {"create", "foreground"}
+    with pytest.raises(ValueError):
+        parse_kinds("create,resize")
+
+
+def test_hook_events_are_described_and_published(desktop):
+    hub = attached(desktop)
+    desktop.add(3, "Browser")
+    desktop.emit("foreground", 3)
+    assert hub.process() == 2
+    events, _, _ = hub.read()
+    assert kinds_of(events) == [("create", 3), ("foreground", 3)]
+    assert events[1].window["title"] == "Browser"
+
+
+def test_bursts_are_coalesced(desktop):
+    hub = attached(desktop)
+    for _ in range(50):
+        desktop.emit("location", 1)
+    desktop.emit("foreground", 2)
+    assert hub.process() == 2
+    assert kinds_of(hub.read()[0]) == [("location", 1), ("foreground", 2)]
+    assert hub.stats()["coalesced"] == 49
+
+
+def test_unlisted_windows_are_not_reported(desktop):
+    hub = attached(desktop)
+    desktop.emit("create", 99)  # e.g. an untitled helper window
+    desktop.emit("destroy", 98)
+    desktop.remove(1)
+    assert hub.process() == 1
+    assert kinds_of(hub.read()[0]) == [("destroy", 1)]
+
+
+def test_one_hook_serves_every_hub_and_the_registry(desktop):
+    registry = WindowRegistry(desktop)
+    registry.start()
+    hubs = [WindowEventHub(registry) for _ in range(2)]
+    for hub in hubs:
+        hub.attach()
+    desktop.add(3, "Browser")
+    assert [hub.process() for hub in hubs] == [1, 1]
+    assert registry.get(3)["title"] == "Browser"
+    assert registry.stats()["events"] == 1
+
+
+def test_polling_fallback_diffs_while_subscribed():
+    backend = FakeBackend(supports_events=False)
+    backend.add(1, "Notepad", emit=False)
+    fg = {"hwnd": 1}
+    hub = attached(backend, foreground=lambda: fg["hwnd"], poll_s=0.05)
+    backend.add(2, "Terminal", emit=False)
+    assert hub.poll() == 0  # nobody listening
+
+    async def scenario():
+        sub = hub.subscribe(asyncio.get_running_loop())
+        backend.windows[1]["title"] = "Notes"
+        fg["hwnd"] = 2
+        return sub, hub.poll(), await sub.wait(1.0)
+
+    sub, published, woken = asyncio.run(scenario())
+    assert woken
+    assert published == 3
+    assert sorted(kinds_of(hub.read()[0])) == [("create", 2), ("foreground", 2), ("name", 1)]
+
+
+def test_polling_fallback_serves_batch_readers():
+    backend = FakeBackend(supports_events=False)
+    backend.add(1, "Notepad", emit=False)
+    now = {"t": 0.0}
+    hub = attached(backend, reader_idle_s=10.0, clock=lambda: now["t"])
+    backend.add(2, "Terminal", emit=False)
+    assert hub.poll() == 0  # nobody listening
+
+    hub.catch_up()
+    assert kinds_of(hub.read()[0]) == [("create", 2)]
+    backend.windows[1]["title"] = "Notes"
+    now["t"] = 5.0
+    assert hub.poll() == 1  # still polled between a reader's requests
+
+    now["t"] = 20.0
+    backend.remove(2)
+    assert hub.poll() == 0  # reader went away
@@ -0,0 +1,99 @@
+import pytest
+
+from winuse.core.focus import STRATEGIES, FocusManager
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeDesktop:
+    """Foreground only moves for the strategies listed in ``works``, after ``lag_s``."""
+
+    def __init__(self, clock, works=("attach",), lag_s=0.0, foreground=1):
+        self.clock = clock
+        self.works = set(works)
+        self.lag_s = lag_s
+        self.foreground = foreground
+        self.pending = None
+        self.applied = []
+        self.prepared = 0
+
+    def is_foreground(self, hwnd):
+        if self.pending is not None and self.clock() >= self.pending[1]:
+            self.foreground, self.pending = self.pending[0], None
+        return self.foreground == hwnd
+
+    def prepare(self, hwnd):
+        self.prepared += 1
+
+    def apply(self, strategy, hwnd):
+        self.applied.append(strategy)
+        if strategy in self.works:
+            self.pending = (hwnd, self.clock() + self.lag_s)
+
+    def last_error(self):
+        return "5: Access is denied."
+
+
+def manager(desktop, clock, **kwargs):
+    return FocusManager(desktop, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_already_foreground_does_nothing():
+    clock = Clock()
+    desktop = FakeDesktop(clock, foreground=7)
+    result = manager(desktop, clock).focus(7, "app.exe")
+    assert result["strategy"] == "already_foreground"
+    assert result["attempts"] == [] and desktop.applied == [] and desktop.prepared == 0
+
+
+def test_learns_winning_strategy_per_process():
+    clock = Clock()
+    desktop = FakeDesktop(clock, works=("alt",))
+    focus = manager(desktop, clock)
+    first = focus.focus(2, "game.exe")
+    assert first["strategy"] == "alt"
+    assert first["attempts"] == list(STRATEGIES)
+    assert focus.order("game.exe")[0] == "alt"
+    assert focus.order("other.exe") == list(STRATEGIES)
+
+    desktop.foreground, desktop.applied = 1, []
+    second = focus.focus(2, "game.exe")
+    assert desktop.applied == ["alt"]
+    assert second["attempts"] == ["alt"]
+    assert second["elapsed_ms"] < first["elapsed_ms"]
+    assert focus.stats()["learned_hits"] == 1
+
+
+def test_confirmation_polls_instead_of_failing_on_lag():
+    clock = Clock()
+    desktop = FakeDesktop(clock, works=STRATEGIES, lag_s=0.03)
+    result = manager(desktop, clock, confirm_ms=100).focus(2, "slow.exe")
+    assert result["strategy"] == "direct"
+    assert 30 <= result["elapsed_ms"] < 100
+
+
+def test_failure_is_bounded_and_explained():
+    clock = Clock()
+    desktop = FakeDesktop(clock, works=())
+    with pytest.raises(RuntimeError, match="direct, attach, alt.*Access is denied"):
+        manager(desktop, clock, confirm_ms=100).focus(2, "locked.exe", timeout_ms=250)
+    assert clock.now <= 0.25 + 1e-9
+
+
+def test_stale_learning_falls_back_and_relearns():
+    clock = Clock()
+    desktop = FakeDesktop(clock, works=("attach",))
+    focus = manager(desktop, clock)
+    focus.focus(2, "app.exe")
+    desktop.works, desktop.foreground = {"direct"}, 1
+    assert focus.focus(2, "app.exe")["attempts"] == ["attach", "direct"]
+    assert focus.order("app.exe")[0] == "direct"
@@ -0,0 +1,84 @@
+import pytest
+
+from winuse.core.gesture import GesturePlayer, Sample, plan_path, split_amount
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_plan_hits_every_vertex_in_order():
+    samples = plan_path([(0, 0), (100, 0), (100, 50)], duration_s=0.2, rate_hz=50, easing="ease_in_out")
+    vertices = [(s.x, s.y) for s in samples if s.vertex]
+    assert vertices == [(0, 0), (100, 0), (100, 50)]
+    times = [s.t for s in samples]
+    assert times == sorted(times)
+    assert samples[-1].t == pytest.approx(0.2)
+
+
+def test_plan_respects_rate_and_drops_duplicate_pixels():
+    fast = plan_path([(0, 0), (1000, 0)], duration_s=0.5, rate_hz=100)
+    assert len(fast) == 51  # start + one per 10 ms tick
+    slow = plan_path([(0, 0), (3, 0)], duration_s=1.0, rate_hz=100)
+    assert [(s.x, s.y) for s in slow] == [(0, 0), (1, 0), (2, 0), (3, 0)]
+
+
+def test_plan_without_duration_is_just_the_vertices():
+    samples = plan_path([(0, 0), (0, 0), (5, 5.4), (0, 0)], duration_s=0)
+    assert samples == [Sample(0.0, 0, 0, True), Sample(0.0, 5, 5, True), Sample(0.0, 0, 0, True)]
+
+
+def test_plan_rejects_unknown_easing_and_empty_path():
+    with pytest.raises(ValueError, match="easing"):
+        plan_path([(0, 0), (1, 1)], duration_s=1, easing="bounce")
+    with pytest.raises(ValueError):
+        plan_path([], duration_s=1)
+
+
+def test_split_amount():
+    assert split_amount(-7, 3) == [-3, -2, -2]
+    assert split_amount(2, 4) == [1, 1, 0, 0]
+    assert sum(split_amount(360, 7)) == 360
+
+
+def test_player_follows_schedule():
+    clock = FakeClock()
+    player = GesturePlayer(clock=clock, sleep=clock.sleep)
+    sent = []
+    samples = plan_path([(0, 0), (100, 0)], duration_s=0.1, rate_hz=100)
+    stats = player.play(samples, lambda x, y: sent.append((x, y, round(clock.now, 3))))
+    assert stats["sent"] == len(samples) and stats["skipped"] == 0
+    assert sent[-1] == (100, 0, 0.1)
+
+
+def test_player_coalesces_late_samples_but_keeps_vertices():
+    clock = FakeClock()
+    player = GesturePlayer(clock=clock, sleep=clock.sleep)
+    samples = [Sample(i * 0.01, i, 0, i in (0, 5, 10)) for i in range(11)]
+    sent = []
+
+    def slow_move(x, y):
+        sent.append(x)
+        clock.now += 0.035  # each move takes longer than three ticks
+
+    stats = player.play(samples, slow_move)
+    assert 5 in sent and sent[-1] == 10
+    assert stats["skipped"] > 0
+    assert stats["sent"] + stats["skipped"] == len(samples)
+    assert stats["max_lag_ms"] > 0
+
+
+def test_spread_sends_everything_evenly():
+    clock = FakeClock()
+    player = GesturePlayer(clock=clock, sleep=clock.sleep)
+    times = []
+    stats = player.spread([1, 2, 3], 0.2, lambda _: times.append(round(clock.now, 3)))
+    assert times == [0.0, 0.1, 0.2]
+    assert stats["steps"] == 3
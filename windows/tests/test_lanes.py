@@ -0,0 +1,109 @@
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from winuse.core.lanes import DEFAULT_LANES, Lane, LaneLimits, LaneSaturated, lane_limits
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def test_limits_validate_and_merge_overrides():
+    limits = lane_limits({"capture": {"workers": 2}})
+    assert limits["capture"] == LaneLimits(workers=2, max_pending=DEFAULT_LANES["capture"].max_pending)
+    assert limits["input"] == DEFAULT_LANES["input"]
+    with pytest.raises(ValueError, match="Unknown executor lane"):
+        lane_limits({"gpu": {"workers": 1}})
+    with pytest.raises(ValueError, match="threads"):
+        lane_limits({"capture": {"threads": 1}})
+    with pytest.raises(ValueError):
+        LaneLimits(workers=4, max_pending=2)
+
+
+def test_run_uses_lane_threads_and_caller_context():
+    lane = Lane("test", LaneLimits(workers=2, max_pending=4))
+
+    async def scenario():
+        request_id.set("abc")
+        return await lane.run(lambda: (threading.current_thread().name, request_id.get()))
+
+    try:
+        name, seen = asyncio.run(scenario())
+        assert name.startswith("winuse-test")
+        assert seen == "abc"
+        stats = lane.stats()
+        assert stats["completed"] == 1 and stats["active"] == 0 and stats["queued"] == 0
+    finally:
+        lane.shutdown()
+
+
+def test_saturated_lane_rejects_and_reports():
+    lane = Lane("test", LaneLimits(workers=1, max_pending=2))
+    release = threading.Event()
+    try:
+        running = lane.submit(lambda: release.wait(5))
+        queued = lane.submit(lambda: None)
+        with pytest.raises(LaneSaturated):
+            lane.submit(lambda: None)
+        stats = lane.stats()
+        assert stats["rejected"] == 1 and stats["queued"] == 1 and stats["active"] == 1
+        assert not lane.idle.is_set()
+        release.set()
+        running.result(5)
+        queued.result(5)
+        assert lane.idle.wait(5)
+        stats = lane.stats()
+        assert stats["saturated_ms"] > 0 and stats["peak_pending"] == 2
+    finally:
+        lane.shutdown()
+
+
+def test_failures_and_cancellations_are_counted():
+    lane = Lane("test", LaneLimits(workers=1, max_pending=4))
+    release = threading.Event()
+    try:
+        blocker = lane.submit(lambda: release.wait(5))
+        doomed = lane.submit(lambda: None)
+        assert doomed.cancel()
+        release.set()
+        blocker.result(5)
+        with pytest.raises(ZeroDivisionError):
+            lane.submit(lambda: 1 / 0).result(5)
+        stats = lane.stats()
+        assert stats["cancelled"] == 1 and stats["failed"] == 1
+        assert lane.idle.is_set()
+    finally:
+        lane.shutdown()
+
+
+def test_low_priority_lane_defers_to_busy_high_priority_lane():
+    high = Lane("high", LaneLimits(workers=1, max_pending=2))
+    low = Lane("low", LaneLimits(workers=1, max_pending=2), defer_to=high, max_defer_s=5.0)
+    release = threading.Event()
+    order = []
+    try:
+        busy = high.submit(lambda: (release.wait(5), order.append("high")))
+        waiting = low.submit(lambda: order.append("low"))
+        assert not waiting.done()
+        release.set()
+        busy.result(5)
+        waiting.result(5)
+        assert order == ["high", "low"]
+        assert low.stats()["deferred"] == 1
+    finally:
+        high.shutdown()
+        low.shutdown()
+
+
+def test_deferral_is_bounded():
+    high = Lane("high", LaneLimits(workers=1, max_pending=2))
+    low = Lane("low", LaneLimits(workers=1, max_pending=2), defer_to=high, max_defer_s=0.01)
+    release = threading.Event()
+    try:
+        high.submit(lambda: release.wait(5))
+        assert low.submit(lambda: "done").result(5) == "done"
+    finally:
+        release.set()
+        high.shutdown()
+        low.shutdown()
@@ -0,0 +1,97 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from winuse.core.capture import Frame
+from winuse.core.match import TemplateCache, decode_template, find_template, ncc_map
+
+
+def png(rgb: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    Image.fromarray(rgb).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def icon() -> np.ndarray:
+    img = Image.new("RGB", (40, 32), (200, 220, 240))
+    draw = ImageDraw.Draw(img)
+    draw.ellipse((4, 4, 28, 28), fill=(20, 120, 30))
+    draw.rectangle((30, 6, 36, 26), fill=(0, 0, 0))
+    return np.asarray(img)
+
+
+def screen(width=320, height=200, at=((123, 57),), left=0, top=0, patch=None):
+    rng = np.random.default_rng(3)
+    px = np.full((height, width, 4), 235, dtype=np.uint8)
+    px[40:52, 10:300, :3] = rng.integers(0, 255, size=(12, 290, 3), dtype=np.uint8)
+    patch = icon() if patch is None else patch
+    h, w = patch.shape[:2]
+    for x, y in at:
+        px[y : y + h, x : x + w, :3] = patch[:, :, ::-1]
+    return Frame(1, 0.0, left, top, width, height, px.tobytes())
+
+
+def test_ncc_map_peaks_at_exact_offset():
+    rng = np.random.default_rng(0)
+    img = rng.random((60, 80)).astype(np.float32)
+    tpl = img[17:29, 31:47].copy()
+    scores = ncc_map(img, tpl)
+    assert scores.shape == (60 - 12 + 1, 80 - 16 + 1)
+    assert np.unravel_index(np.argmax(scores), scores.shape) == (17, 31)
+    assert scores[17, 31] == pytest.approx(1.0, abs=1e-4)
+
+
+def test_find_template_returns_screen_rects():
+    template = decode_template(png(icon()))
+    matches = find_template(screen(left=-320, top=10), template)
+    assert len(matches) == 1
+    m = matches[0]
+    assert (m["x"], m["y"], m["width"], m["height"]) == (123 - 320, 57 + 10, 40, 32)
+    assert (m["center_x"], m["center_y"]) == (123 - 320 + 20, 57 + 10 + 16)
+    assert m["score"] > 0.99
+
+
+def test_coarse_to_fine_matches_exhaustive_search():
+    template = decode_template(png(icon()))
+    frame = screen(at=((123, 57), (31, 141), (250, 101)))
+    fast = find_template(frame, template, max_results=10)
+    exhaustive = find_template(frame, template, max_results=10, levels=1)
+    assert sorted((m["x"], m["y"]) for m in fast) == sorted((m["x"], m["y"]) for m in exhaustive)
+    assert len(fast) == 3
+
+
+def test_noisy_template_is_found_off_grid():
+    rng = np.random.default_rng(5)
+    noise = rng.integers(0, 255, size=(16, 24, 3), dtype=np.uint8)
+    matches = find_template(screen(at=((77, 121),), patch=noise), decode_template(png(noise)))
+    assert [(m["x"], m["y"]) for m in matches] == [(77, 121)]
+
+
+def test_no_match_below_threshold():
+    template = decode_template(png(icon()))
+    frame = screen(at=())
+    assert find_template(frame, template) == []
+
+
+def test_template_larger_than_frame():
+    template = decode_template(png(icon()))
+    frame = Frame(1, 0.0, 0, 0, 30, 20, bytes(30 * 20 * 4))
+    assert find_template(frame, template) == []
+
+
+def test_flat_template_rejected():
+    with pytest.raises(ValueError):
+        decode_template(png(np.full((8, 8, 3), 7, dtype=np.uint8)))
+
+
+def test_template_cache_lru():
+    cache = TemplateCache(capacity=2)
+    rng = np.random.default_rng(1)
+    ids = [cache.add(png(rng.integers(0, 255, size=(8, 8, 3), dtype=np.uint8))).template_id for _ in range(3)]
+    with pytest.raises(KeyError):
+        cache.get(ids[0])
+    assert cache.get(ids[2]).template_id == ids[2]
+    stats = cache.stats()
+    assert (stats["templates"], stats["evictions"], stats["hits"], stats["misses"]) == (2, 1, 1, 1)
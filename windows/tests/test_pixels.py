@@ -0,0 +1,44 @@
+import pytest
+
+from winuse.core.capture import Frame
+from winuse.core.pixels import bounding_region, sample
+
+
+def make_frame(left=10, top=20, width=4, height=3):
+    # Pixel (x, y) has BGRA (x, y, 100, 255).
+    raw = bytes(b for y in range(height) for x in range(width) for b in (x, y, 100, 255))
+    return Frame(1, 0.0, left, top, width, height, raw)
+
+
+def test_bounding_region_covers_points_and_rects():
+    region = bounding_region([{"x": 5, "y": 7}, {"x": 9, "y": 3}], [{"x": 2, "y": 4, "width": 3, "height": 10}])
+    assert region == {"left": 2, "top": 3, "width": 8, "height": 11}
+
+
+def test_bounding_region_is_clipped_to_bounds():
+    bounds = {"left": 0, "top": 0, "width": 100, "height": 100}
+    assert bounding_region([{"x": 99, "y": 99}], [{"x": 90, "y": 90, "width": 50, "height": 5}], bounds) == {
+        "left": 90,
+        "top": 90,
+        "width": 10,
+        "height": 10,
+    }
+    with pytest.raises(ValueError):
+        bounding_region([{"x": 200, "y": 5}], bounds=bounds)
+    with pytest.raises(ValueError):
+        bounding_region([])
+
+
+def test_sample_points_use_screen_coordinates():
+    out = sample(make_frame(), [{"x": 12, "y": 21}])
+    assert out["points"] == [{"x": 12, "y": 21, "r": 100, "g": 1, "b": 2, "hex": "#640102"}]
+
+
+def test_sample_rect_returns_mean_color():
+    out = sample(make_frame(), [], [{"x": 10, "y": 20, "width": 4, "height": 2}])
+    assert (out["rects"][0]["r"], out["rects"][0]["g"], out["rects"][0]["b"]) == (100, 0, 2)
+
+
+def test_sample_point_outside_frame_raises():
+    with pytest.raises(ValueError):
+        sample(make_frame(), [{"x": 0, "y": 0}])
@@ -0,0 +1,144 @@
+import pytest
+
+from winuse.core.processes import ProcessCache
+
+
+class FakePsutil:
+    """Minimal psutil stand-in: pid -> (create_time, name), with call counting."""
+
+    class NoSuchProcess(Exception):
+        pass
+
+    class AccessDenied(Exception):
+        pass
+
+    def __init__(self):
+        self.procs = {}
+        self.calls = {"create_time": 0, "name": 0, "exe": 0, "ppid": 0}
+
+    def pids(self):
+        return list(self.procs)
+
+    def Process(self, pid):
+        if pid not in self.procs:
+            raise self.NoSuchProcess(pid)
+        fake = self
+
+        class Proc:
+            def create_time(self):
+                fake.calls["create_time"] += 1
+                return fake.procs[pid][0]
+
+            def name(self):
+                fake.calls["name"] += 1
+                return fake.procs[pid][1]
+
+            def exe(self):
+                fake.calls["exe"] += 1
+                return f"C:/Windows/{fake.procs[pid][1]}"
+
+            def ppid(self):
+                fake.calls["ppid"] += 1
+                return 4
+
+        return Proc()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def ps():
+    fake = FakePsutil()
+    fake.procs = {100: (1.0, "notepad.exe"), 200: (2.0, "cmd.exe")}
+    return fake
+
+
+def test_names_are_cached(ps):
+    cache = ProcessCache(backend=ps, clock=Clock())
+    assert [cache.name(100) for _ in range(5)] == ["notepad.exe"] * 5
+    assert ps.calls["name"] == 1
+    assert cache.stats()["hits"] == 4
+
+
+def test_revalidation_uses_create_time_only(ps):
+    clock = Clock()
+    cache = ProcessCache(backend=ps, revalidate_s=5, clock=clock)
+    cache.name(100)
+    clock.now = 6
+    assert cache.name(100) == "notepad.exe"
+    assert ps.calls == {"create_time": 2, "name": 1, "exe": 0, "ppid": 0}
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_pid_reuse_is_detected(ps):
+    clock = Clock()
+    cache = ProcessCache(backend=ps, revalidate_s=5, clock=clock)
+    assert cache.name(100) == "notepad.exe"
+    ps.procs[100] = (50.0, "malware.exe")
+    clock.now = 6
+    assert cache.name(100) == "malware.exe"
+    assert cache.stats()["reused_pids"] == 1
+
+
+def test_exited_process_is_evicted(ps):
+    clock = Clock()
+    cache = ProcessCache(backend=ps, revalidate_s=5, clock=clock)
+    cache.name(100)
+    del ps.procs[100]
+    clock.now = 6
+    assert cache.name(100) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_prune_drops_dead_pids(ps):
+    clock = Clock()
+    cache = ProcessCache(backend=ps, revalidate_s=1000, prune_s=60, clock=clock)
+    cache.name(100)
+    cache.name(200)
+    del ps.procs[200]
+    clock.now = 61
+    cache.name(100)
+    assert cache.stats()["entries"] == 1
+
+
+def test_capacity_bound(ps):
+    ps.procs = {pid: (float(pid), f"p{pid}.exe") for pid in range(1, 11)}
+    cache = ProcessCache(capacity=4, backend=ps, clock=Clock())
+    for pid in range(1, 11):
+        cache.name(pid)
+    stats = cache.stats()
+    assert stats["entries"] == 4
+    assert stats["evictions"] == 6
+
+
+def test_details_fetched_on_demand(ps):
+    cache = ProcessCache(backend=ps, clock=Clock())
+    cache.name(100)
+    assert ps.calls["exe"] == 0
+    assert cache.details(100) == {"exe": "C:/Windows/notepad.exe", "ppid": 4}
+    cache.details(100)
+    assert ps.calls["exe"] == 1
+    assert cache.details(999) == {"exe": None, "ppid": None}
+
+
+def test_access_denied_create_time(ps):
+    def denied(pid):
+        proc = FakePsutil.Process(ps, pid)
+        proc.create_time = lambda: (_ for _ in ()).throw(ps.AccessDenied())
+        return proc
+
+    ps.Process = denied
+    cache = ProcessCache(backend=ps, clock=Clock())
+    assert cache.name(100) == "notepad.exe"
+
+
+def test_without_psutil():
+    cache = ProcessCache(clock=Clock())
+    cache._psutil = None  # as when psutil is not installed
+    assert cache.name(100) is None
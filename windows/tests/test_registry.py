@@ -0,0 +1,186 @@
+import re
+
+import pytest
+
+from winuse.core.registry import WindowRegistry, parse_fields, project, window_filter
+
+
+class FakeBackend:
+    """Simulated desktop: a dict of windows plus a manual event source."""
+
+    def __init__(self, supports_events=True):
+        self.windows = {}
+        self.order = []
+        self.supports_events = supports_events
+        self.callback = None
+        self.snapshots = 0
+        self.describes = 0
+
+    def add(self, hwnd, title, emit=True):
+        self.windows[hwnd] = {"hwnd": hwnd, "title": title, "pid": hwnd * 10, "process": "app.exe", "rect": {}}
+        self.order.insert(0, hwnd)
+        if emit:
+            self.emit("create", hwnd)
+
+    def remove(self, hwnd, emit=True):
+        self.windows.pop(hwnd)
+        self.order.remove(hwnd)
+        if emit:
+            self.emit("destroy", hwnd)
+
+    def emit(self, kind, hwnd):
+        if self.callback is not None:
+            self.callback(kind, hwnd)
+
+    def snapshot(self):
+        self.snapshots += 1
+        return [dict(self.windows[h]) for h in self.order]
+
+    def describe(self, hwnd):
+        self.describes += 1
+        info = self.windows.get(hwnd)
+        return dict(info) if info else None
+
+    def start_events(self, callback):
+        if not self.supports_events:
+            return False
+        self.callback = callback
+        return True
+
+    def stop_events(self):
+        self.callback = None
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def desktop():
+    backend = FakeBackend()
+    backend.add(1, "Notepad", emit=False)
+    backend.add(2, "Terminal", emit=False)
+    return backend
+
+
+def titles(registry):
+    return [w["title"] for w in registry.list()]
+
+
+def test_reads_are_served_from_memory(desktop):
+    clock = Clock()
+    registry = WindowRegistry(desktop, ttl_s=1.0, resync_s=30.0, clock=clock)
+    registry.start()
+    assert titles(registry) == ["Terminal", "Notepad"]
+    clock.now = 10.0
+    assert titles(registry) == ["Terminal", "Notepad"]
+    assert desktop.snapshots == 1
+    assert registry.stats()["hooked"] is True
+
+
+def test_events_update_only_affected_windows(desktop):
+    registry = WindowRegistry(desktop, clock=Clock())
+    registry.start()
+    registry.list()
+    desktop.add(3, "Dialog")
+    desktop.windows[1]["title"] = "Notepad - notes.txt"
+    desktop.emit("name", 1)
+    desktop.remove(2)
+    assert titles(registry) == ["Dialog", "Notepad - notes.txt"]
+    assert desktop.snapshots == 1
+    assert desktop.describes == 2
+
+
+def test_foreground_moves_window_to_front(desktop):
+    registry = WindowRegistry(desktop, clock=Clock())
+    registry.start()
+    registry.list()
+    desktop.emit("foreground", 1)
+    assert titles(registry) == ["Notepad", "Terminal"]
+
+
+def test_event_for_unlistable_window_is_ignored(desktop):
+    registry = WindowRegistry(desktop, clock=Clock())
+    registry.start()
+    registry.list()
+    desktop.emit("create", 99)  # e.g. an untitled or invisible window
+    assert registry.get(99) is None
+    assert len(registry.list()) == 2
+
+
+def test_ttl_fallback_without_events(desktop):
+    desktop.supports_events = False
+    clock = Clock()
+    registry = WindowRegistry(desktop, ttl_s=1.0, clock=clock)
+    registry.start()
+    registry.list()
+    desktop.add(3, "Dialog")
+    assert "Dialog" not in titles(registry)
+    clock.now = 1.5
+    assert titles(registry)[0] == "Dialog"
+    assert registry.stats()["hooked"] is False
+
+
+def test_periodic_resync_with_events(desktop):
+    clock = Clock()
+    registry = WindowRegistry(desktop, ttl_s=1.0, resync_s=30.0, clock=clock)
+    registry.start()
+    registry.list()
+    desktop.add(3, "Missed", emit=False)  # the hook never saw it
+    clock.now = 31.0
+    assert "Missed" in titles(registry)
+    assert desktop.snapshots == 2
+
+
+def test_events_disabled_by_config(desktop):
+    registry = WindowRegistry(desktop, use_events=False, clock=Clock())
+    registry.start()
+    assert desktop.callback is None
+    assert registry.hooked is False
+
+
+def test_hook_failure_falls_back(desktop):
+    def broken(_callback):
+        raise OSError("no hook")
+
+    desktop.start_events = broken
+    registry = WindowRegistry(desktop, clock=Clock())
+    registry.start()
+    assert registry.hooked is False
+    assert len(registry.list()) == 2
+
+
+def test_stop_unhooks(desktop):
+    registry = WindowRegistry(desktop, clock=Clock())
+    registry.start()
+    registry.stop()
+    assert desktop.callback is None
+
+
+def test_list_with_filter_and_limit(desktop):
+    desktop.add(3, "notes - Notepad", emit=False)
+    registry = WindowRegistry(desktop, clock=Clock())
+    assert [w["hwnd"] for w in registry.list(window_filter(title="NOTEPAD"))] == [3, 1]
+    assert [w["hwnd"] for w in registry.list(window_filter(title="notepad"), limit=1)] == [3]
+    assert [w["hwnd"] for w in registry.list(window_filter(title_regex="^term"))] == [2]
+    assert [w["hwnd"] for w in registry.list(window_filter(pid=20, process="APP"))] == [2]
+    assert registry.list(window_filter(title="notepad", pid=20)) == []
+
+
+def test_window_filter_without_options():
+    assert window_filter() is None
+    with pytest.raises(re.error):
+        window_filter(title_regex="(")
+
+
+def test_fields_projection():
+    assert parse_fields(None) is None
+    assert parse_fields("title, rect") == ["hwnd", "title", "rect"]
+    with pytest.raises(ValueError):
+        parse_fields("title,colour")
+    info = {"hwnd": 1, "title": "a", "pid": 2, "rect": {}}
+    assert project(info, ["hwnd", "title"]) == {"hwnd": 1, "title": "a"}
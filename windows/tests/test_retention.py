@@ -0,0 +1,68 @@
+import os
+import time
+
+from winuse.core.retention import RetentionManager
+
+
+def make_files(directory, count, size=10, start=1_000_000.0):
+    paths = []
+    for i in range(count):
+        path = directory / f"capture_{i:03d}.png"
+        path.write_bytes(b"x" * size)
+        os.utime(path, (start + i, start + i))
+        paths.append(path)
+    return paths
+
+
+def test_max_files_evicts_oldest(tmp_path):
+    paths = make_files(tmp_path, 5)
+    manager = RetentionManager(str(tmp_path), max_files=3)
+    removed = manager.sweep(now=1_000_010.0)
+    assert sorted(removed) == sorted(str(p) for p in paths[:2])
+    assert manager.stats()["files"] == 3
+    assert manager.stats()["evicted_files"] == 2
+
+
+def test_max_bytes(tmp_path):
+    make_files(tmp_path, 4, size=100)
+    manager = RetentionManager(str(tmp_path), max_bytes=250)
+    manager.sweep(now=1_000_010.0)
+    stats = manager.stats()
+    assert stats["bytes"] == 200
+    assert stats["evicted_bytes"] == 200
+
+
+def test_max_age(tmp_path):
+    paths = make_files(tmp_path, 4)
+    manager = RetentionManager(str(tmp_path), max_age_s=5)
+    removed = manager.sweep(now=1_000_007.5)
+    assert sorted(removed) == sorted(str(p) for p in paths[:3])
+
+
+def test_foreign_files_are_kept(tmp_path):
+    make_files(tmp_path, 2)
+    keep = tmp_path / "notes.txt"
+    keep.write_text("mine")
+    os.utime(keep, (0, 0))
+    RetentionManager(str(tmp_path), max_files=1, max_age_s=1).sweep(now=1_000_010.0)
+    assert keep.exists()
+
+
+def test_disabled_without_limits(tmp_path):
+    manager = RetentionManager(str(tmp_path))
+    assert not manager.enabled
+    manager.start()
+    assert manager.stats()["sweeps"] == 0
+
+
+def test_background_sweep(tmp_path):
+    make_files(tmp_path, 5)
+    manager = RetentionManager(str(tmp_path), max_files=2, interval_s=1)
+    manager.start()
+    try:
+        deadline = time.monotonic() + 3
+        while manager.stats()["sweeps"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(list(tmp_path.iterdir())) == 2
+    finally:
+        manager.stop()
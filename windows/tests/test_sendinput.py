@@ -0,0 +1,89 @@
+import ctypes
+
+import pytest
+
+from winuse.core.sendinput import (
+    KEYEVENTF_KEYUP,
+    KEYEVENTF_UNICODE,
+    MOUSEEVENTF_HWHEEL,
+    MOUSEEVENTF_WHEEL,
+    VK_RETURN,
+    KeyInput,
+    UnicodeTyper,
+    batches,
+    char_events,
+    to_input_array,
+    wheel_input,
+)
+
+
+def typed(events):
+    """Decode key-down Unicode events back to text, the way Windows would."""
+    units = [e.scan if e.flags == KEYEVENTF_UNICODE else 0x0A for e in events if not e.flags & KEYEVENTF_KEYUP]
+    return b"".join(u.to_bytes(2, "little") for u in units).decode("utf-16-le")
+
+
+def test_ascii_and_non_ascii_are_unicode_pairs():
+    assert char_events("é") == [
+        KeyInput(0, 0xE9, KEYEVENTF_UNICODE),
+        KeyInput(0, 0xE9, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP),
+    ]
+
+
+def test_astral_characters_use_surrogate_pairs():
+    events = char_events("😀")
+    assert [e.scan for e in events] == [0xD83D, 0xD83D, 0xDE00, 0xDE00]
+
+
+def test_newlines_become_enter_keys():
+    events = [e for batch in batches("a\r\nb\rc", 100) for e in batch]
+    assert [e.vk for e in events if e.vk] == [VK_RETURN] * 4
+    assert typed(events) == "a\nb\nc"
+
+
+def test_batches_never_split_a_character():
+    text = "ab😀" * 50
+    chunks = list(batches(text, 7))
+    assert all(len(c) <= 7 for c in chunks)
+    assert typed([e for c in chunks for e in c]) == text
+    for chunk in chunks:
+        downs = [e for e in chunk if not e.flags & KEYEVENTF_KEYUP]
+        assert not (0xD800 <= downs[-1].scan <= 0xDBFF)
+
+
+def test_typer_sends_whole_batches():
+    calls = []
+    typer = UnicodeTyper(lambda events: calls.append(list(events)) or len(events), batch_events=1000)
+    text = "Grüße, мир! 👋\n" * 100
+    result = typer.type(text)
+    assert result["batches"] == len(calls) < 10
+    assert typed([e for c in calls for e in c]) == text
+
+
+def test_interval_sends_one_character_per_call():
+    calls, sleeps = [], []
+    typer = UnicodeTyper(lambda events: calls.append(events) or len(events), sleep=sleeps.append)
+    typer.type("ab😀", interval=0.01)
+    assert [len(c) for c in calls] == [2, 2, 4]
+    assert sleeps == [0.01] * 3
+
+
+def test_blocked_input_raises():
+    typer = UnicodeTyper(lambda events: 0)
+    with pytest.raises(RuntimeError, match="inserted 0 of"):
+        typer.type("x")
+
+
+def test_input_array_layout():
+    array = to_input_array(char_events("A"))
+    assert len(array) == 2
+    assert array[0].type == 1 and array[0].ki.wScan == ord("A")
+    assert array[1].ki.dwFlags == KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
+    assert ctypes.sizeof(array[0]) >= ctypes.sizeof(array[0].ki) + 4
+
+
+def test_wheel_input_carries_signed_delta():
+    down = wheel_input(-120)
+    assert down[0].type == 0 and down[0].mi.dwFlags == MOUSEEVENTF_WHEEL
+    assert ctypes.c_int32(down[0].mi.mouseData).value == -120
+    assert wheel_input(60, horizontal=True)[0].mi.dwFlags == MOUSEEVENTF_HWHEEL
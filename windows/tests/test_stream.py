@@ -0,0 +1,132 @@
+import asyncio
+import time
+
+from winuse.core.capture import CaptureEngine
+from winuse.core.encode import Encoder, EncoderProfile
+from winuse.core.stream import StreamFrame, StreamHub, Subscriber
+
+REGION = {"left": 0, "top": 0, "width": 16, "height": 8}
+
+
+class CountingSource:
+    def __init__(self, changing=True):
+        self.changing = changing
+        self.grabs = 0
+
+    def full_region(self):
+        return dict(REGION)
+
+    def monitors(self):
+        return [dict(REGION)]
+
+    def grab(self, region):
+        self.grabs += 1
+        value = (self.grabs if self.changing else 1) % 256
+        return bytes([value, 0, 0, 255]) * (region["width"] * region["height"])
+
+    def close(self):
+        pass
+
+
+def make_hub(source, fps=50.0):
+    engine = CaptureEngine(lambda: source)
+    encoder = Encoder(EncoderProfile("jpg"))
+    return engine, encoder, StreamHub(engine, encoder, fps=fps, profile=EncoderProfile("jpg"))
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+def test_viewers_share_one_capture_and_encode_pass():
+    source = CountingSource()
+    engine, encoder, hub = make_hub(source)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        a = hub.subscribe(loop)
+        b = hub.subscribe(loop)
+        fa = [await a.next() for _ in range(3)]
+        fb = await b.next()
+        hub.unsubscribe(a)
+        hub.unsubscribe(b)
+        return fa, fb
+
+    try:
+        fa, fb = run(scenario())
+        assert fa[0].data[:2] == b"\xff\xd8"
+        assert [f.seq for f in fa] == sorted(f.seq for f in fa)
+        stats = hub.stats()
+        assert stats["frames_encoded"] <= source.grabs
+    finally:
+        hub.stop()
+        engine.stop()
+        encoder.shutdown()
+
+
+def test_unchanged_frames_are_skipped():
+    source = CountingSource(changing=False)
+    engine, encoder, hub = make_hub(source)
+
+    async def scenario():
+        sub = hub.subscribe(asyncio.get_running_loop())
+        await sub.next()
+        await asyncio.sleep(0.2)
+        hub.unsubscribe(sub)
+
+    try:
+        run(scenario())
+        stats = hub.stats()
+        assert stats["frames_encoded"] == 1
+        assert stats["frames_unchanged"] >= 1
+    finally:
+        hub.stop()
+        engine.stop()
+        encoder.shutdown()
+
+
+def test_slow_subscriber_only_keeps_latest_frame():
+    async def scenario():
+        sub = Subscriber(asyncio.get_running_loop())
+        for seq in range(1, 6):
+            sub.offer(StreamFrame(seq, seq, b"x"))
+        frame = await sub.next()
+        return sub, frame
+
+    sub, frame = run(scenario())
+    assert frame.seq == 5
+    assert sub.dropped == 4
+
+
+def test_per_viewer_fps_cap():
+    async def scenario():
+        sub = Subscriber(asyncio.get_running_loop(), fps=10)
+        sub.offer(StreamFrame(1, 1, b"x"))
+        await sub.next()
+        start = time.monotonic()
+        sub.offer(StreamFrame(2, 2, b"x"))
+        await sub.next()
+        return time.monotonic() - start
+
+    assert run(scenario()) >= 0.08
+
+
+def test_loop_stops_without_viewers():
+    source = CountingSource()
+    engine, encoder, hub = make_hub(source)
+
+    async def scenario():
+        sub = hub.subscribe(asyncio.get_running_loop())
+        await sub.next()
+        hub.unsubscribe(sub)
+
+    try:
+        run(scenario())
+        deadline = time.monotonic() + 2
+        while hub.stats()["running"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not hub.stats()["running"]
+    finally:
+        hub.stop()
+        engine.stop()
+        encoder.shutdown()
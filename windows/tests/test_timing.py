@@ -0,0 +1,35 @@
+import pytest
+
+from winuse.core.timing import PROFILES, InputTiming, input_timing, percentile
+
+
+def test_profiles_resolve_by_name():
+    assert input_timing("fast") is PROFILES["fast"]
+    assert input_timing("fast").pause_s == 0.0
+    assert input_timing("safe").pause_s > 0.0
+
+
+def test_overrides_apply_on_top_of_profile():
+    timing = input_timing("safe", {"pause_s": 0, "key_delay_s": "0.02"})
+    assert timing.pause_s == 0.0
+    assert timing.key_delay_s == 0.02
+    assert timing.click_interval_s == PROFILES["safe"].click_interval_s
+
+
+def test_custom_starts_from_zero():
+    assert input_timing("custom", {"click_interval_s": 0.05}) == InputTiming(click_interval_s=0.05)
+
+
+def test_invalid_profile_and_keys_are_rejected():
+    with pytest.raises(ValueError, match="Unknown input profile"):
+        input_timing("turbo")
+    with pytest.raises(ValueError, match="pause"):
+        input_timing("fast", {"pause": 0.1})
+    with pytest.raises(ValueError):
+        InputTiming(pause_s=-1)
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 0.5) is None
+    assert percentile([3.0, 1.0, 2.0], 0.5) == 2.0
+    assert percentile(list(range(100)), 0.95) == 95
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from winuse.core.capture import Frame
+from winuse.core.wait import FrameWaiter, differs, signature
+
+
+def solid(frame_id, value, width=64, height=32, mark=None):
+    px = np.full((height, width, 4), value, dtype=np.uint8)
+    if mark is not None:
+        x, y = mark
+        px[y : y + 6, x : x + 4, :3] = 255 - value  # a "typed character"
+    return Frame(frame_id, 0.0, 0, 0, width, height, px.tobytes())
+
+
+class ScriptedEngine:
+    """Returns frames from ``script(t)`` where ``t`` is the fake clock time."""
+
+    def __init__(self, script):
+        self.script = script
+        self.now = 0.0
+        self.next_id = 0
+        self.frames = {}
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def grab(self, region=None):
+        self.next_id += 1
+        frame = self.script(self.now, self.next_id)
+        self.frames[frame.frame_id] = frame
+        return frame
+
+    def get(self, frame_id):
+        return self.frames.get(frame_id)
+
+
+def make_waiter(script):
+    engine = ScriptedEngine(script)
+    return engine, FrameWaiter(engine, clock=engine.clock, sleep=engine.sleep)
+
+
+def test_signature_sees_small_changes():
+    base = signature(solid(1, 40))
+    assert base.shape[0] >= 1
+    assert not differs(base, signature(solid(2, 40)), 6)
+    assert differs(base, signature(solid(3, 40, mark=(30, 10))), 6)
+
+
+def test_wait_for_change():
+    engine, waiter = make_waiter(lambda t, i: solid(i, 40, mark=(30, 10) if t >= 0.2 else None))
+    result = waiter.wait(until="change", interval_ms=50)
+    assert result["met"] is True
+    assert 200 <= result["elapsed_ms"] <= 260
+    assert result["frame_id"] == engine.next_id
+
+
+def test_wait_for_change_times_out():
+    _, waiter = make_waiter(lambda t, i: solid(i, 40))
+    result = waiter.wait(until="change", timeout_ms=300)
+    assert result["met"] is False
+    assert result["timed_out"] is True
+    assert result["elapsed_ms"] == pytest.approx(300, abs=1)
+    assert waiter.stats()["timed_out"] == 1
+
+
+def test_change_since_earlier_frame_returns_immediately():
+    # The change happened between the previous wait and this one.
+    state = {"changed": False}
+    _, waiter = make_waiter(lambda t, i: solid(i, 40, mark=(30, 10) if state["changed"] else None))
+    first = waiter.wait(until="stable", stable_ms=0)
+    state["changed"] = True
+    result = waiter.wait(until="change", since=first["frame_id"])
+    assert result["met"] is True
+    assert result["samples"] == 1
+
+
+def test_wait_for_stable_after_animation():
+    # The mark moves every 50 ms until t=0.4, then stays put.
+    def script(t, i):
+        x = min(int(t / 0.05), 8) * 6
+        return solid(i, 40, mark=(x, 10))
+
+    _, waiter = make_waiter(script)
+    result = waiter.wait(until="stable", stable_ms=200, interval_ms=50)
+    assert result["met"] is True
+    assert result["changes"] >= 7
+    assert 600 <= result["elapsed_ms"] <= 700
+
+
+def test_unknown_condition_raises():
+    _, waiter = make_waiter(lambda t, i: solid(i, 40))
+    with pytest.raises(ValueError):
+        waiter.wait(until="gone")
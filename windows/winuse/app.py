@@ -1,43 +1,186 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
-
-from fastapi import FastAPI
+import asyncio
+import base64
+import functools
+import json
+import math
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import FastAPI, Header, Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 import pyautogui
 
 from winuse.config import Settings, load_settings
 from winuse.core import keyboard as kb
 from winuse.core import mouse, screenshot, windows
+from winuse.core.capture import CaptureEngine
+from winuse.core.coords import FrameMapping, FrameMappings
+from winuse.core.delta import DeltaTracker
+from winuse.core.dispatch import Dispatched, InputDispatcher, InputOverloaded, input_session
+from winuse.core.encode import Encoded, Encoder, EncoderProfile
+from winuse.core.events import WindowEventHub, parse_kinds
+from winuse.core.gesture import Sample, plan_path
+from winuse.core.lanes import Lane, LaneSaturated
+from winuse.core.match import TemplateCache
+from winuse.core.registry import WindowRegistry, parse_fields, project, window_filter
+from winuse.core.retention import RetentionManager
+from winuse.core.sendinput import WHEEL_DELTA
+from winuse.core.stream import StreamHub
+from winuse.core.wait import FrameWaiter
 
 
 class MouseMoveRequest(BaseModel):
-    x: int
-    y: int
+    x: float
+    y: float
     duration: float = 0.0
+    frame_id: Optional[int] = None
+    hwnd: Optional[int] = None
+    relative_to: str = Field(default="window", pattern="^(window|client)$")
+    normalized: bool = False
 
 
 class MouseClickRequest(BaseModel):
-    x: Optional[int] = None
-    y: Optional[int] = None
+    x: Optional[float] = None
+    y: Optional[float] = None
     button: str = Field(default="left", pattern="^(left|right|middle)$")
     clicks: int = 1
+    frame_id: Optional[int] = None
+    hwnd: Optional[int] = None
+    relative_to: str = Field(default="window", pattern="^(window|client)$")
+    normalized: bool = False
+
+
+class PathPoint(BaseModel):
+    x: float
+    y: float
+
+
+class MousePathRequest(BaseModel):
+    points: list[PathPoint] = Field(min_length=1, max_length=1000)
+    duration_ms: float = Field(default=300, ge=0, le=60000)
+    rate_hz: float = Field(default=120, ge=1, le=1000)
+    easing: str = Field(default="ease_in_out", pattern="^(linear|ease_in|ease_out|ease_in_out)$")
+    frame_id: Optional[int] = None
+
+
+class MouseDragRequest(MousePathRequest):
+    points: list[PathPoint] = Field(min_length=2, max_length=1000)
+    button: str = Field(default="left", pattern="^(left|right|middle)$")
+    hold_ms: float = Field(default=50, ge=0, le=5000)
+
+
+class MouseScrollRequest(BaseModel):
+    dy: float = Field(default=0, ge=-100, le=100)
+    dx: float = Field(default=0, ge=-100, le=100)
+    x: Optional[float] = None
+    y: Optional[float] = None
+    steps: Optional[int] = Field(default=None, ge=1, le=500)
+    duration_ms: float = Field(default=0, ge=0, le=10000)
+    frame_id: Optional[int] = None
 
 
 class KeyboardTypeRequest(BaseModel):
     text: str
-    interval: float = 0.0
+    interval: Optional[float] = Field(default=None, ge=0)
     mode: str = Field(default="paste", pattern="^(paste|type)$")
     paste_keys: Optional[list[str]] = None
+    chunk_chars: Optional[int] = Field(default=None, ge=0)
+    restore_clipboard: Optional[bool] = None
 
 
 class KeyboardPressRequest(BaseModel):
     keys: list[str]
 
 
+class Rect(BaseModel):
+    x: int
+    y: int
+    width: int = Field(gt=0)
+    height: int = Field(gt=0)
+
+
+class PixelPoint(BaseModel):
+    x: int
+    y: int
+
+
+class PixelsRequest(BaseModel):
+    points: list[PixelPoint] = Field(default_factory=list, max_length=1024)
+    rects: list[Rect] = Field(default_factory=list, max_length=256)
+    max_age_ms: Optional[float] = Field(default=None, ge=0)
+
+
+class FindRequest(BaseModel):
+    template: Optional[str] = None
+    template_id: Optional[str] = None
+    hwnd: Optional[int] = None
+    monitor: Optional[int] = Field(default=None, ge=0)
+    region: Optional[Rect] = None
+    threshold: float = Field(default=0.9, gt=0, le=1)
+    max_results: int = Field(default=5, ge=1, le=100)
+    max_age_ms: Optional[float] = Field(default=None, ge=0)
+
+
+class WaitRequest(BaseModel):
+    until: str = Field(default="stable", pattern="^(change|stable)$")
+    hwnd: Optional[int] = None
+    monitor: Optional[int] = Field(default=None, ge=0)
+    region: Optional[Rect] = None
+    since: Optional[int] = None
+    timeout_ms: float = Field(default=5000, gt=0, le=60000)
+    stable_ms: float = Field(default=300, ge=0)
+    interval_ms: float = Field(default=50, ge=10)
+    tolerance: float = Field(default=6, ge=0)
+
+
+class FocusRequest(BaseModel):
+    hwnd: int
+    timeout_ms: float = Field(default=1000, gt=0, le=10000)
+
+
+class ActionStep(BaseModel):
+    """One ``/actions`` step: ``type`` plus that endpoint's request fields."""
+
+    model_config = ConfigDict(extra="allow")
+
+    type: str = Field(pattern="^(focus|click|move|path|drag|scroll|type|paste|press|wait|screenshot)$")
+    delay_ms: Optional[float] = Field(default=None, ge=0, le=10000)
+
+
+class ActionsRequest(BaseModel):
+    actions: list[ActionStep] = Field(min_length=1, max_length=100)
+    stop_on_error: bool = True
+    delay_ms: float = Field(default=0, ge=0, le=10000)
+
+
 class ScreenshotRequest(BaseModel):
     hwnd: Optional[int] = None
+    monitor: Optional[int] = Field(default=None, ge=0)
+    region: Optional[Rect] = None
+    max_age_ms: Optional[float] = Field(default=None, ge=0)
+    inline: bool = False
+    format: Optional[str] = Field(default=None, pattern="^(png|jpg|jpeg|webp|bmp)$")
+    png_compress_level: Optional[int] = Field(default=None, ge=0, le=9)
+    quality: Optional[int] = Field(default=None, ge=1, le=100)
+    lossless: Optional[bool] = None
+    scale: Optional[float] = Field(default=None, gt=0, le=1)
+    max_width: Optional[int] = Field(default=None, ge=16)
+
+
+def _strict(model: type[BaseModel]) -> type[BaseModel]:
+    """``model`` rejecting unknown fields, for ``/actions`` steps.
+
+    The endpoints stay lenient, but a step's fields arrive as ``ActionStep``
+    extras, so a typo (``"X": 5``) would otherwise silently fall back to
+    the default (e.g. click at the current cursor position).
+    """
+    return type(model.__name__, (model,), {"model_config": ConfigDict(extra="forbid"), "__module__": __name__})
 
 
 def _ok(data: Any) -> Dict[str, Any]:
@@ -48,10 +191,157 @@ def _err(code: str, message: str) -> Dict[str, Any]:
     return {"success": False, "data": None, "error": {"code": code, "message": message}}
 
 
+def _remember(mappings: FrameMappings, info: Dict[str, Any]) -> None:
+    mappings.record(
+        FrameMapping(
+            frame_id=int(info["frame_id"]),
+            left=int(info["left"]),
+            top=int(info["top"]),
+            scale_x=info["image_width"] / info["width"],
+            scale_y=info["image_height"] / info["height"],
+        )
+    )
+
+
+def _screen_point(mappings: FrameMappings, frame_id: Optional[int], x: float, y: float) -> tuple[int, int]:
+    """Translate coordinates given in a served frame's image space to screen pixels."""
+    if frame_id is None:
+        return int(round(x)), int(round(y))
+    return mappings.to_screen(frame_id, x, y)
+
+
+# /actions step types that send input; see ``actions`` for how they are grouped.
+_INPUT_STEPS = frozenset({"focus", "click", "move", "path", "drag", "scroll", "type", "paste", "press"})
+
+
+class _InputSessionMiddleware:
+    """Tags each request with its input session (see ``InputDispatcher``).
+
+    ``X-WinUse-Session`` names it explicitly, e.g. per agent behind one
+    proxy; otherwise the client address is the session.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        session = dict(scope.get("headers") or ()).get(b"x-winuse-session", b"").decode("latin-1")
+        if not session and scope.get("client"):
+            session = str(scope["client"][0])
+        token = input_session.set(session or "default")
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            input_session.reset(token)
+
+
 def create_app(settings: Settings | None = None) -> FastAPI:
     settings = settings or load_settings()
-    app = FastAPI(title="WinUse")
+    engine = CaptureEngine(ring_size=settings.capture_ring_size, refresh_ms=settings.capture_refresh_ms)
+    deltas = DeltaTracker()
+    encoder = Encoder(settings.encoder, workers=settings.encode_workers)
+    mappings = FrameMappings()
+    templates = TemplateCache()
+    waiter = FrameWaiter(engine)
+    window_backend = windows.Win32WindowBackend()
+    registry = WindowRegistry(
+        window_backend,
+        ttl_s=settings.windows_cache_ttl_s,
+        resync_s=settings.windows_resync_s,
+        use_events=settings.windows_event_hooks,
+    )
+    window_events = WindowEventHub(
+        registry,
+        foreground=window_backend.foreground,
+        capacity=settings.windows_event_history,
+        poll_s=settings.windows_cache_ttl_s,
+    )
+    retention = RetentionManager(
+        settings.output_dir,
+        max_bytes=settings.retention_max_bytes,
+        max_files=settings.retention_max_files,
+        max_age_s=settings.retention_max_age_s,
+        interval_s=settings.retention_interval_s,
+    )
+    dispatcher = InputDispatcher(
+        max_queue=settings.input_queue,
+        max_per_session=settings.input_queue_per_session,
+        max_wait_s=settings.input_max_wait_ms / 1000.0,
+    )
+    input_lane = Lane("input", settings.lanes["input"])
+    capture_lane = Lane(
+        "capture",
+        settings.lanes["capture"],
+        defer_to=input_lane,
+        max_defer_s=settings.capture_defer_ms / 1000.0,
+    )
+    windows_lane = Lane("windows", settings.lanes["windows"])
+    wait_lane = Lane("wait", settings.lanes["wait"])
+    lanes = (input_lane, capture_lane, windows_lane, wait_lane)
+    hub = StreamHub(
+        engine,
+        encoder,
+        fps=settings.stream_fps,
+        profile=EncoderProfile("jpg", quality=settings.stream_quality),
+        max_width=settings.stream_max_width,
+        skip_unchanged=settings.stream_skip_unchanged,
+    )
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        if settings.capture_refresh_ms:
+            engine.start()
+        retention.start()
+        registry.start()
+        window_events.start()
+        dispatcher.start()
+        yield
+        dispatcher.stop()
+        if paster is not None:
+            paster.flush()
+        window_events.stop()
+        registry.stop()
+        retention.stop()
+        hub.stop()
+        engine.stop()
+        encoder.shutdown()
+        for lane in lanes:
+            lane.shutdown()
+
+    app = FastAPI(title="WinUse", lifespan=lifespan)
+    app.add_middleware(_InputSessionMiddleware)
     pyautogui.FAILSAFE = settings.failsafe
+    pyautogui.PAUSE = settings.input_timing.pause_s
+    timing = settings.input_timing
+
+    paster = kb.paste_engine(
+        timing.key_delay_s,
+        settle_s=settings.paste_settle_ms / 1000.0,
+        restore_timeout_s=settings.paste_restore_timeout_ms / 1000.0,
+        chunk_chars=settings.paste_chunk_chars,
+        restore=settings.paste_restore_clipboard,
+    )
+
+    def on_lane(route: Callable[..., Any], lane: Lane) -> Callable[..., Any]:
+        """Register sync handler ``fn`` with ``route`` so it runs on ``lane``.
+
+        Returns ``fn`` itself, so ``/actions`` can call it synchronously.
+        """
+
+        def register(fn: Callable[..., Any]) -> Callable[..., Any]:
+            @functools.wraps(fn)
+            async def handler(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await lane.run(fn, *args, **kwargs)
+                except LaneSaturated as exc:
+                    return _err("SERVER_BUSY", str(exc))
+
+            route(handler)
+            return fn
+
+        return register
 
     app.mount("/files", StaticFiles(directory=settings.output_dir), name="files")
 
@@ -59,29 +349,132 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     def health():
         return _ok({"status": "ok"})
 
-    @app.get("/windows")
-    def list_windows():
+    @app.get("/metrics")
+    def metrics():
+        return _ok(
+            {
+                "capture": engine.stats(),
+                "stream": hub.stats(),
+                "retention": retention.stats(),
+                "templates": templates.stats(),
+                "wait": waiter.stats(),
+                "windows": registry.stats(),
+                "window_events": window_events.stats(),
+                "processes": windows.process_cache.stats(),
+                "focus": windows.focus_manager.stats(),
+                "paste": paster.stats() if paster is not None else None,
+                "input": dispatcher.stats(),
+                "lanes": {lane.name: lane.stats() for lane in lanes},
+            }
+        )
+
+    def _with_details(item: Dict[str, Any], details: bool, fields: Optional[list[str]]) -> Dict[str, Any]:
+        if details or (fields and ("exe" in fields or "ppid" in fields)):
+            item.update(windows.process_cache.details(int(item["pid"])))
+        return project(item, fields)
+
+    @on_lane(app.get("/windows"), windows_lane)
+    def list_windows(
+        title: Optional[str] = None,
+        title_regex: Optional[str] = None,
+        process: Optional[str] = None,
+        pid: Optional[int] = None,
+        limit: Optional[int] = Query(default=None, ge=1),
+        fields: Optional[str] = None,
+        details: bool = False,
+    ):
+        try:
+            match = window_filter(title=title, title_regex=title_regex, process=process, pid=pid)
+            wanted = parse_fields(fields)
+        except (re.error, ValueError) as exc:
+            return _err("WINDOW_QUERY_INVALID", str(exc))
         try:
-            return _ok(windows.list_windows())
+            return _ok([_with_details(w, details, wanted) for w in registry.list(match, limit)])
         except Exception as exc:
             return _err("WINDOW_LIST_FAILED", str(exc))
 
-    @app.get("/windows/active")
+    @on_lane(app.get("/windows/active"), windows_lane)
     def active_window():
         try:
             return _ok(windows.get_active_window())
         except Exception as exc:
             return _err("WINDOW_ACTIVE_FAILED", str(exc))
 
-    @app.post("/windows/{hwnd}/focus")
-    def focus_window(hwnd: int):
+    @on_lane(app.get("/windows/events"), windows_lane)
+    def window_events_poll(
+        since: Optional[int] = Query(default=None, ge=0),
+        kinds: Optional[str] = None,
+        limit: int = Query(default=256, ge=1, le=1024),
+    ):
         try:
-            windows.focus_window(hwnd)
-            return _ok({"hwnd": hwnd})
+            wanted = parse_kinds(kinds)
+        except ValueError as exc:
+            return _err("WINDOW_QUERY_INVALID", str(exc))
+        window_events.catch_up()
+        events, gap, cursor = window_events.read(since, wanted, limit)
+        return _ok({"events": [e.as_dict() for e in events], "gap": gap, "cursor": cursor})
+
+    @app.get("/windows/events/stream")
+    async def window_events_stream(
+        since: Optional[int] = Query(default=None, ge=0),
+        kinds: Optional[str] = None,
+        last_event_id: Optional[str] = Header(default=None),
+    ):
+        try:
+            wanted = parse_kinds(kinds)
+        except ValueError as exc:
+            return _err("WINDOW_QUERY_INVALID", str(exc))
+        # Browsers' EventSource resends the last id on reconnect.
+        if since is None and last_event_id and last_event_id.isdigit():
+            since = int(last_event_id)
+        cursor = since if since is not None else window_events.log.last_seq
+        sub = window_events.subscribe(asyncio.get_running_loop())
+
+        async def messages():
+            nonlocal cursor
+            try:
+                while True:
+                    events, gap, cursor = window_events.read(cursor, wanted)
+                    if gap:
+                        yield f"event: gap\ndata: {json.dumps({'cursor': cursor})}\n\n"
+                    for event in events:
+                        yield f"id: {event.seq}\nevent: {event.kind}\ndata: {json.dumps(event.as_dict())}\n\n"
+                    if not await sub.wait(15.0):
+                        yield ": keepalive\n\n"
+            finally:
+                window_events.unsubscribe(sub)
+
+        return StreamingResponse(
+            messages(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @on_lane(app.get("/windows/{hwnd}"), windows_lane)
+    def get_window(hwnd: int, fields: Optional[str] = None, details: bool = False):
+        try:
+            wanted = parse_fields(fields)
+        except ValueError as exc:
+            return _err("WINDOW_QUERY_INVALID", str(exc))
+        try:
+            info = registry.get(hwnd)
+            if info is None:
+                return _err("WINDOW_NOT_FOUND", f"No listed window with hwnd {hwnd}")
+            return _ok(_with_details(info, details, wanted))
+        except Exception as exc:
+            return _err("WINDOW_GET_FAILED", str(exc))
+
+    @on_lane(app.post("/windows/{hwnd}/focus"), input_lane)
+    def focus_window(hwnd: int, timeout_ms: float = Query(default=1000, gt=0, le=10000)):
+        try:
+            done = dispatcher.run(lambda: windows.focus_window(hwnd, timeout_ms=timeout_ms))
+            return _ok({**done.value, "queue_ms": done.queue_ms})
+        except InputOverloaded as exc:
+            return _err("INPUT_BUSY", str(exc))
         except Exception as exc:
             return _err("WINDOW_FOCUS_FAILED", str(exc))
 
-    @app.post("/windows/{hwnd}/minimize")
+    @on_lane(app.post("/windows/{hwnd}/minimize"), windows_lane)
     def minimize_window(hwnd: int):
         try:
             windows.minimize_window(hwnd)
@@ -89,7 +482,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         except Exception as exc:
             return _err("WINDOW_MINIMIZE_FAILED", str(exc))
 
-    @app.post("/windows/{hwnd}/maximize")
+    @on_lane(app.post("/windows/{hwnd}/maximize"), windows_lane)
     def maximize_window(hwnd: int):
         try:
             windows.maximize_window(hwnd)
@@ -97,7 +490,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         except Exception as exc:
             return _err("WINDOW_MAXIMIZE_FAILED", str(exc))
 
-    @app.post("/windows/{hwnd}/restore")
+    @on_lane(app.post("/windows/{hwnd}/restore"), windows_lane)
     def restore_window(hwnd: int):
         try:
             windows.restore_window(hwnd)
@@ -105,65 +498,481 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         except Exception as exc:
             return _err("WINDOW_RESTORE_FAILED", str(exc))
 
-    @app.post("/screenshot")
+    @on_lane(app.get("/monitors"), capture_lane)
+    def list_monitors():
+        try:
+            return _ok(screenshot.monitor_list(engine))
+        except Exception as exc:
+            return _err("MONITOR_LIST_FAILED", str(exc))
+
+    def _screenshot(req: ScreenshotRequest) -> tuple[Optional[Encoded], EncoderProfile, Dict[str, Any]]:
+        """Capture for ``req``: ``(encoded, profile, info)`` if inline, else ``(None, profile, payload)``."""
+        profile = settings.encoder.with_overrides(
+            format=req.format,
+            png_compress_level=req.png_compress_level,
+            quality=req.quality,
+            lossless=req.lossless,
+        )
+        region = screenshot.resolve_region(
+            engine,
+            hwnd=req.hwnd,
+            monitor=req.monitor,
+            rect=req.region.model_dump() if req.region else None,
+        )
+        if req.inline:
+            encoded, info = screenshot.capture_bytes(
+                engine,
+                encoder,
+                region,
+                profile,
+                max_age_ms=req.max_age_ms,
+                scale=req.scale,
+                max_width=req.max_width,
+            )
+            _remember(mappings, info)
+            return encoded, profile, info
+        result = screenshot.capture_region(
+            settings.output_dir,
+            region,
+            profile,
+            engine=engine,
+            encoder=encoder,
+            max_age_ms=req.max_age_ms,
+            scale=req.scale,
+            max_width=req.max_width,
+        )
+        _remember(mappings, result)
+        retention.poke()
+        payload = {k: v for k, v in result.items() if k != "filename"}
+        payload["url"] = f"/files/{result['filename']}"
+        return None, profile, payload
+
+    @on_lane(app.post("/screenshot"), capture_lane)
     def take_screenshot(req: ScreenshotRequest | None = None):
         try:
-            if req and req.hwnd is not None:
-                result = screenshot.capture_window(settings.output_dir, req.hwnd, settings.image_format)
-            else:
-                result = screenshot.capture_full(settings.output_dir, settings.image_format)
-            url = f"/files/{result['filename']}"
-            return _ok({"path": result["path"], "url": url})
+            encoded, profile, info = _screenshot(req or ScreenshotRequest())
+            if encoded is not None:
+                headers = {f"X-WinUse-{k.replace('_', '-').title()}": str(v) for k, v in info.items()}
+                return Response(content=encoded.data, media_type=profile.media_type, headers=headers)
+            return _ok(info)
         except Exception as exc:
             return _err("SCREENSHOT_FAILED", str(exc))
 
-    @app.post("/mouse/move")
+    @on_lane(app.get("/screenshot/delta"), capture_lane)
+    def screenshot_delta(
+        since: Optional[int] = None,
+        tile: int = Query(default=64, ge=8, le=512),
+        hwnd: Optional[int] = None,
+        monitor: Optional[int] = Query(default=None, ge=0),
+        max_age_ms: Optional[float] = Query(default=None, ge=0),
+    ):
+        try:
+            region = screenshot.resolve_region(engine, hwnd=hwnd, monitor=monitor)
+            frame = engine.grab(region, max_age_ms=max_age_ms)
+            reference = engine.get(since) if since is not None else None
+            full, rects = deltas.diff(frame, since, tile, reference=reference)
+            info = screenshot.frame_info(frame)
+            _remember(mappings, info)
+            return _ok(
+                {
+                    **info,
+                    "since": since,
+                    "full": full,
+                    "tile": tile,
+                    "format": encoder.profile.format,
+                    "tiles": screenshot.encode_tiles(encoder, frame, rects),
+                }
+            )
+        except Exception as exc:
+            return _err("SCREENSHOT_DELTA_FAILED", str(exc))
+
+    @on_lane(app.post("/pixels"), capture_lane)
+    def pixels(req: PixelsRequest):
+        try:
+            return _ok(
+                screenshot.sample_pixels(
+                    engine,
+                    [p.model_dump() for p in req.points],
+                    [r.model_dump() for r in req.rects],
+                    max_age_ms=req.max_age_ms,
+                )
+            )
+        except Exception as exc:
+            return _err("PIXELS_FAILED", str(exc))
+
+    @on_lane(app.post("/find"), capture_lane)
+    def find(req: FindRequest):
+        try:
+            if req.template is not None:
+                template = templates.add(base64.b64decode(req.template))
+            elif req.template_id is not None:
+                template = templates.get(req.template_id)
+            else:
+                return _err("FIND_FAILED", "Provide template (base64 image) or template_id")
+            region = screenshot.resolve_region(
+                engine,
+                hwnd=req.hwnd,
+                monitor=req.monitor,
+                rect=req.region.model_dump() if req.region else None,
+            )
+            return _ok(
+                screenshot.find_on_screen(
+                    engine,
+                    template,
+                    region,
+                    threshold=req.threshold,
+                    max_results=req.max_results,
+                    max_age_ms=req.max_age_ms,
+                )
+            )
+        except KeyError as exc:
+            return _err("TEMPLATE_UNKNOWN", str(exc.args[0]))
+        except Exception as exc:
+            return _err("FIND_FAILED", str(exc))
+
+    @on_lane(app.post("/wait"), wait_lane)
+    def wait(req: WaitRequest):
+        try:
+            region = screenshot.resolve_region(
+                engine,
+                hwnd=req.hwnd,
+                monitor=req.monitor,
+                rect=req.region.model_dump() if req.region else None,
+            )
+            return _ok(
+                waiter.wait(
+                    region,
+                    until=req.until,
+                    timeout_ms=req.timeout_ms,
+                    stable_ms=req.stable_ms,
+                    interval_ms=req.interval_ms,
+                    tolerance=req.tolerance,
+                    since=req.since,
+                )
+            )
+        except Exception as exc:
+            return _err("WAIT_FAILED", str(exc))
+
+    @app.get("/stream.mjpeg")
+    async def stream_mjpeg(fps: Optional[float] = Query(default=None, gt=0)):
+        sub = hub.subscribe(asyncio.get_running_loop(), fps)
+
+        async def parts():
+            try:
+                while True:
+                    frame = await sub.next()
+                    yield (
+                        b"--frame\r\nContent-Type: image/jpeg\r\n"
+                        + f"Content-Length: {len(frame.data)}\r\nX-WinUse-Frame-Id: {frame.frame_id}\r\n\r\n".encode()
+                        + frame.data
+                        + b"\r\n"
+                    )
+            finally:
+                hub.unsubscribe(sub)
+
+        return StreamingResponse(parts(), media_type="multipart/x-mixed-replace; boundary=frame")
+
+    def _timed(done: Dispatched, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return _ok({**payload, "input_ms": done.run_ms, "queue_ms": done.queue_ms})
+
+    def _target(req: MouseMoveRequest | MouseClickRequest) -> tuple[int, int]:
+        """Screen point for a mouse request; window-relative points use the window's current rect."""
+        if req.hwnd is None:
+            if req.normalized:
+                raise ValueError("normalized coordinates need an hwnd")
+            return _screen_point(mappings, req.frame_id, req.x, req.y)
+        if req.frame_id is not None:
+            raise ValueError("Give either frame_id or hwnd, not both")
+        return windows.window_point(req.hwnd, req.x, req.y, area=req.relative_to, normalized=req.normalized)
+
+    @on_lane(app.post("/mouse/move"), input_lane)
     def mouse_move(req: MouseMoveRequest):
         try:
-            mouse.move(req.x, req.y, duration=req.duration)
-            return _ok({"x": req.x, "y": req.y})
+
+            def move():
+                # Resolved on the input thread just before moving, so a
+                # window-relative point follows a window that moved meanwhile.
+                x, y = _target(req)
+                mouse.move(x, y, duration=req.duration)
+                return x, y
+
+            done = dispatcher.run(move)
+            x, y = done.value
+            payload = {"x": x, "y": y}
+            if req.hwnd is not None:
+                payload["hwnd"] = req.hwnd
+            return _timed(done, payload)
+        except KeyError as exc:
+            return _err("FRAME_UNKNOWN", str(exc.args[0]))
+        except LookupError as exc:
+            return _err("WINDOW_NOT_FOUND", str(exc))
+        except ValueError as exc:
+            return _err("MOUSE_TARGET_INVALID", str(exc))
+        except InputOverloaded as exc:
+            return _err("INPUT_BUSY", str(exc))
         except Exception as exc:
             return _err("MOUSE_MOVE_FAILED", str(exc))
 
-    @app.post("/mouse/click")
+    @on_lane(app.post("/mouse/click"), input_lane)
     def mouse_click(req: MouseClickRequest):
         try:
-            mouse.click(req.x, req.y, button=req.button, clicks=req.clicks)
-            return _ok({"x": req.x, "y": req.y, "button": req.button, "clicks": req.clicks})
+            has_point = req.x is not None and req.y is not None
+            if req.hwnd is not None and not has_point:
+                raise ValueError("hwnd needs x and y")
+
+            def click():
+                x, y = _target(req) if has_point else (None, None)
+                mouse.click(x, y, button=req.button, clicks=req.clicks, interval=timing.click_interval_s)
+                return x, y
+
+            done = dispatcher.run(click)
+            x, y = done.value
+            payload = {"x": x, "y": y, "button": req.button, "clicks": req.clicks}
+            if req.hwnd is not None:
+                payload["hwnd"] = req.hwnd
+            return _timed(done, payload)
+        except KeyError as exc:
+            return _err("FRAME_UNKNOWN", str(exc.args[0]))
+        except LookupError as exc:
+            return _err("WINDOW_NOT_FOUND", str(exc))
+        except ValueError as exc:
+            return _err("MOUSE_TARGET_INVALID", str(exc))
+        except InputOverloaded as exc:
+            return _err("INPUT_BUSY", str(exc))
         except Exception as exc:
             return _err("MOUSE_CLICK_FAILED", str(exc))
 
-    @app.post("/keyboard/type")
+    def _plan(req: MousePathRequest, start: Optional[tuple[int, int]] = None) -> list[Sample]:
+        points = [_screen_point(mappings, req.frame_id, p.x, p.y) for p in req.points]
+        if start is not None:
+            points.insert(0, start)
+        return plan_path(points, duration_s=req.duration_ms / 1000.0, rate_hz=req.rate_hz, easing=req.easing)
+
+    @on_lane(app.post("/mouse/path"), input_lane)
+    def mouse_path(req: MousePathRequest):
+        try:
+            def glide():
+                # The glide starts wherever the cursor is when its turn comes.
+                samples = _plan(req, start=mouse.position())
+                return samples[-1], mouse.glide(samples)
+
+            done = dispatcher.run(glide)
+            end, info = done.value
+            return _timed(done, {"x": end.x, "y": end.y, **info})
+        except KeyError as exc:
+            return _err("FRAME_UNKNOWN", str(exc.args[0]))
+        except InputOverloaded as exc:
+            return _err("INPUT_BUSY", str(exc))
+        except Exception as exc:
+            return _err("MOUSE_PATH_FAILED", str(exc))
+
+    @on_lane(app.post("/mouse/drag"), input_lane)
+    def mouse_drag(req: MouseDragRequest):
+        try:
+            samples = _plan(req)
+            done = dispatcher.run(lambda: mouse.drag(samples, button=req.button, hold=req.hold_ms / 1000.0))
+            start, end = samples[0], samples[-1]
+            return _timed(
+                done,
+                {
+                    "from": {"x": start.x, "y": start.y},
+                    "to": {"x": end.x, "y": end.y},
+                    "button": req.button,
+                    **done.value,
+                },
+            )
+        except KeyError as exc:
+            return _err("FRAME_UNKNOWN", str(exc.args[0]))
+        except InputOverloaded as exc:
+            return _err("INPUT_BUSY", str(exc))
+        except Exception as exc:
+            return _err("MOUSE_DRAG_FAILED", str(exc))
+
+    @on_lane(app.post("/mouse/scroll"), input_lane)
+    def mouse_scroll(req: MouseScrollRequest):
+        try:
+            x = y = None
+            if req.x is not None and req.y is not None:
+                x, y = _screen_point(mappings, req.frame_id, req.x, req.y)
+            # Notches in, wheel units out: positive dy scrolls down (the wheel
+            # turns towards the user), positive dx scrolls right.
+            vertical = -int(round(req.dy * WHEEL_DELTA))
+            horizontal = int(round(req.dx * WHEEL_DELTA))
+            steps = req.steps or max(1, math.ceil(max(abs(req.dy), abs(req.dx))))
+            done = dispatcher.run(
+                lambda: mouse.scroll(vertical, horizontal, x=x, y=y, steps=steps, duration=req.duration_ms / 1000.0)
+            )
+            return _timed(done, {"x": x, "y": y, "dy": req.dy, "dx": req.dx, **done.value})
+        except KeyError as exc:
+            return _err("FRAME_UNKNOWN", str(exc.args[0]))
+        except InputOverloaded as exc:
+            return _err("INPUT_BUSY", str(exc))
+        except Exception as exc:
+            return _err("MOUSE_SCROLL_FAILED", str(exc))
+
+    @on_lane(app.post("/keyboard/type"), input_lane)
     def keyboard_type(req: KeyboardTypeRequest):
         try:
             if req.mode == "paste":
-                pasted = kb.paste_text(req.text, keys=req.paste_keys, allow_fallback=True)
-                mode = "paste" if pasted else "type"
-                payload = {"text": req.text, "mode": mode}
-                if not pasted:
+                done = dispatcher.run(
+                    lambda: kb.paste_text(
+                        req.text,
+                        engine=paster,
+                        keys=req.paste_keys,
+                        allow_fallback=True,
+                        chunk_chars=req.chunk_chars,
+                        restore_clipboard=req.restore_clipboard,
+                        type_backend=settings.type_backend,
+                    )
+                )
+                payload = {"text": req.text, **done.value}
+                if done.value["mode"] != "paste":
                     payload["warning"] = "clipboard_unavailable_fallback"
-                return _ok(payload)
-            kb.type_text(req.text, interval=req.interval)
-            return _ok({"text": req.text, "mode": "type"})
+                return _timed(done, payload)
+            interval = timing.type_interval_s if req.interval is None else req.interval
+            done = dispatcher.run(lambda: kb.type_text(req.text, interval=interval, backend=settings.type_backend))
+            return _timed(done, {"text": req.text, "mode": "type", **done.value})
+        except InputOverloaded as exc:
+            return _err("INPUT_BUSY", str(exc))
         except Exception as exc:
             return _err("KEYBOARD_TYPE_FAILED", str(exc))
 
-    @app.post("/keyboard/paste")
+    @on_lane(app.post("/keyboard/paste"), input_lane)
     def keyboard_paste(req: KeyboardTypeRequest):
         try:
-            kb.paste_text(req.text, keys=req.paste_keys, allow_fallback=False)
-            return _ok({"text": req.text, "mode": "paste"})
+            done = dispatcher.run(
+                lambda: kb.paste_text(
+                    req.text,
+                    engine=paster,
+                    keys=req.paste_keys,
+                    allow_fallback=False,
+                    chunk_chars=req.chunk_chars,
+                    restore_clipboard=req.restore_clipboard,
+                )
+            )
+            return _timed(done, {"text": req.text, **done.value})
+        except InputOverloaded as exc:
+            return _err("INPUT_BUSY", str(exc))
         except Exception as exc:
             return _err("KEYBOARD_PASTE_FAILED", str(exc))
 
-    @app.post("/keyboard/press")
+    @on_lane(app.post("/keyboard/press"), input_lane)
     def keyboard_press(req: KeyboardPressRequest):
         try:
-            kb.press_keys(req.keys)
-            return _ok({"keys": req.keys})
+            done = dispatcher.run(lambda: kb.press_keys(req.keys, key_interval=timing.key_delay_s))
+            return _timed(done, {"keys": req.keys})
+        except InputOverloaded as exc:
+            return _err("INPUT_BUSY", str(exc))
         except Exception as exc:
             return _err("KEYBOARD_PRESS_FAILED", str(exc))
 
+    def _screenshot_step(req: ScreenshotRequest) -> Dict[str, Any]:
+        try:
+            encoded, profile, info = _screenshot(req)
+            if encoded is not None:
+                info = {**info, "media_type": profile.media_type, "image": base64.b64encode(encoded.data).decode("ascii")}
+            return _ok(info)
+        except Exception as exc:
+            return _err("SCREENSHOT_FAILED", str(exc))
+
+    # Each step runs through the same handler as its standalone endpoint.
+    action_handlers = {
+        "focus": (_strict(FocusRequest), lambda r: focus_window(r.hwnd, r.timeout_ms)),
+        "click": (_strict(MouseClickRequest), mouse_click),
+        "move": (_strict(MouseMoveRequest), mouse_move),
+        "path": (_strict(MousePathRequest), mouse_path),
+        "drag": (_strict(MouseDragRequest), mouse_drag),
+        "scroll": (_strict(MouseScrollRequest), mouse_scroll),
+        "type": (_strict(KeyboardTypeRequest), keyboard_type),
+        "paste": (_strict(KeyboardTypeRequest), keyboard_paste),
+        "press": (_strict(KeyboardPressRequest), keyboard_press),
+        "wait": (_strict(WaitRequest), wait),
+        "screenshot": (_strict(ScreenshotRequest), _screenshot_step),
+    }
+
+    @on_lane(app.post("/actions"), input_lane)
+    def actions(req: ActionsRequest):
+        # Validate every step before running any, so a typo in step 3 does
+        # not leave steps 1-2 half applied.
+        parsed = []
+        for index, step in enumerate(req.actions):
+            model, handler = action_handlers[step.type]
+            try:
+                parsed.append((step, model.model_validate(step.model_extra or {}), handler))
+            except ValidationError as exc:
+                errors = "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors())
+                return _err("ACTION_INVALID", f"Step {index} ({step.type}): {errors}")
+
+        def delay_after(index: int) -> float:
+            delay = parsed[index][0].delay_ms
+            return (req.delay_ms if delay is None else delay) / 1000.0
+
+        def run_steps(first: int, last: int) -> list[Dict[str, Any]]:
+            out = []
+            for index in range(first, last):
+                step, body, handler = parsed[index]
+                step_started = time.perf_counter()
+                result = handler(body)
+                out.append(
+                    {
+                        "index": index,
+                        "type": step.type,
+                        **result,
+                        "elapsed_ms": round((time.perf_counter() - step_started) * 1000.0, 1),
+                    }
+                )
+                if not result["success"] and req.stop_on_error:
+                    break
+            return out
+
+        started = time.perf_counter()
+        results: list[Dict[str, Any]] = []
+        failed = None
+        queue_ms = 0.0
+        index = 0
+        while index < len(parsed) and (failed is None or not req.stop_on_error):
+            if index and delay_after(index - 1):
+                time.sleep(delay_after(index - 1))
+            end = index + 1
+            if parsed[index][0].type in _INPUT_STEPS:
+                # Consecutive input steps run as one input action, so another
+                # session's input cannot land between e.g. a focus step and
+                # the keys meant for that window (their own dispatcher.run
+                # calls run inline). Delays and wait/screenshot steps run
+                # outside it, so other sessions are not held up by them.
+                while end < len(parsed) and parsed[end][0].type in _INPUT_STEPS and not delay_after(end - 1):
+                    end += 1
+                try:
+                    done = dispatcher.run(functools.partial(run_steps, index, end))
+                    queue_ms += done.queue_ms
+                    ran = done.value
+                except InputOverloaded as exc:
+                    busy = _err("INPUT_BUSY", str(exc))
+                    rejected = range(index, index + 1 if req.stop_on_error else end)
+                    ran = [{"index": i, "type": parsed[i][0].type, **busy, "elapsed_ms": 0.0} for i in rejected]
+            else:
+                ran = run_steps(index, end)
+            results.extend(ran)
+            if failed is None:
+                failed = next((r["index"] for r in ran if not r["success"]), None)
+            index = end
+        elapsed_ms = round((time.perf_counter() - started) * 1000.0, 1)
+        data = {
+            "steps": results,
+            "completed": sum(1 for r in results if r["success"]),
+            "total": len(parsed),
+            "elapsed_ms": elapsed_ms,
+            "queue_ms": round(queue_ms, 2),
+        }
+        if failed is None:
+            return _ok(data)
+        error = results[failed]["error"]
+        return {
+            "success": False,
+            "data": data,
+            "error": {"code": error["code"], "message": f"Step {failed} ({results[failed]['type']}): {error['message']}"},
+        }
+
     return app
 
 
@@ -4,6 +4,10 @@ from typing import Any, Dict
 
 import yaml
 
+from winuse.core.encode import EncoderProfile
+from winuse.core.lanes import LaneLimits, lane_limits
+from winuse.core.timing import InputTiming, input_timing
+
 
 DEFAULT_CONFIG = {
     "api": {
@@ -14,9 +18,51 @@ DEFAULT_CONFIG = {
     "screenshots": {
         "output_dir": r"C:\\winuse\\captures",
         "format": "png",
+        "png_compress_level": 1,
+        "quality": 80,
+        "lossless": False,
+        "encode_workers": 2,
+        "ring_size": 8,
+        "refresh_ms": 0,
+        # Off unless configured: turning it on deletes old capture_* files.
+        "retention": {
+            "max_bytes": None,
+            "max_files": None,
+            "max_age_s": None,
+            "interval_s": 60,
+        },
+    },
+    "stream": {
+        "fps": 5,
+        "quality": 70,
+        "max_width": None,
+        "skip_unchanged": True,
+    },
+    "windows": {
+        "cache_ttl_s": 1.0,
+        "resync_s": 30.0,
+        "event_hooks": True,
+        "event_history": 1024,
     },
     "behavior": {
         "failsafe": True,
+        "input_profile": "fast",
+        "input_timing": {},
+        "type_backend": "sendinput",
+        "paste_chunk_chars": 20000,
+        "paste_restore_clipboard": True,
+        "paste_settle_ms": 150,
+        "paste_restore_timeout_ms": 2000,
+        "input_queue": 64,
+        "input_queue_per_session": 16,
+        "input_max_wait_ms": 5000,
+    },
+    "executors": {
+        "capture": {"workers": 4, "max_pending": 32},
+        "input": {"workers": 64, "max_pending": 128},
+        "windows": {"workers": 4, "max_pending": 64},
+        "wait": {"workers": 16, "max_pending": 32},
+        "capture_defer_ms": 50,
     },
 }
 
@@ -27,17 +73,46 @@ class Settings:
     api_port: int
     api_key: str | None
     output_dir: str
-    image_format: str
+    encoder: EncoderProfile
+    encode_workers: int
+    capture_ring_size: int
+    capture_refresh_ms: int
+    retention_max_bytes: int | None
+    retention_max_files: int | None
+    retention_max_age_s: float | None
+    retention_interval_s: float
+    stream_fps: float
+    stream_quality: int
+    stream_max_width: int | None
+    stream_skip_unchanged: bool
+    windows_cache_ttl_s: float
+    windows_resync_s: float
+    windows_event_hooks: bool
+    windows_event_history: int
     failsafe: bool
+    input_timing: InputTiming
+    type_backend: str
+    paste_chunk_chars: int
+    paste_restore_clipboard: bool
+    paste_settle_ms: float
+    paste_restore_timeout_ms: float
+    input_queue: int
+    input_queue_per_session: int
+    input_max_wait_ms: float
+    lanes: Dict[str, LaneLimits]
+    capture_defer_ms: float
 
 
 def _merge_defaults(cfg: Dict[str, Any]) -> Dict[str, Any]:
     merged = {
         "api": dict(DEFAULT_CONFIG["api"]),
         "screenshots": dict(DEFAULT_CONFIG["screenshots"]),
+        "stream": dict(DEFAULT_CONFIG["stream"]),
+        "windows": dict(DEFAULT_CONFIG["windows"]),
         "behavior": dict(DEFAULT_CONFIG["behavior"]),
+        "executors": dict(DEFAULT_CONFIG["executors"]),
     }
-    for section in ("api", "screenshots", "behavior"):
+    for section in ("api", "screenshots", "stream", "windows", "behavior", "executors"):
         merged[section].update(cfg.get(section, {}))
     return merged
 
@@ -68,6 +143,13 @@ def _apply_env_overrides(cfg: Dict[str, Any]) -> Dict[str, Any]:
     return cfg
 
 
+def _type_backend(value: Any) -> str:
+    backend = str(value or "sendinput").lower()
+    if backend not in ("sendinput", "pyautogui"):
+        raise ValueError(f"Unknown type_backend {value!r} (valid: sendinput, pyautogui)")
+    return backend
+
+
 def load_settings(config_path: str = "config.yaml") -> Settings:
     cfg: Dict[str, Any] = {}
     if os.path.exists(config_path):
@@ -83,12 +165,47 @@ def load_settings(config_path: str = "config.yaml") -> Settings:
 
     output_dir = cfg["screenshots"]["output_dir"]
     os.makedirs(output_dir, exist_ok=True)
+    retention = {**DEFAULT_CONFIG["screenshots"]["retention"], **(cfg["screenshots"].get("retention") or {})}
 
     return Settings(
         api_host=str(cfg["api"]["host"]),
         api_port=int(cfg["api"]["port"]),
         api_key=cfg["api"].get("api_key") or None,
         output_dir=output_dir,
-        image_format=str(cfg["screenshots"].get("format", "png")),
+        encoder=EncoderProfile(
+            format=str(cfg["screenshots"].get("format", "png")),
+            png_compress_level=int(cfg["screenshots"].get("png_compress_level", 1)),
+            quality=int(cfg["screenshots"].get("quality", 80)),
+            lossless=bool(cfg["screenshots"].get("lossless", False)),
+        ),
+        encode_workers=int(cfg["screenshots"].get("encode_workers", 2)),
+        capture_ring_size=int(cfg["screenshots"].get("ring_size", 8)),
+        capture_refresh_ms=int(cfg["screenshots"].get("refresh_ms", 0)),
+        retention_max_bytes=int(retention["max_bytes"]) if retention.get("max_bytes") else None,
+        retention_max_files=int(retention["max_files"]) if retention.get("max_files") else None,
+        retention_max_age_s=float(retention["max_age_s"]) if retention.get("max_age_s") else None,
+        retention_interval_s=float(retention.get("interval_s") or 60),
+        stream_fps=float(cfg["stream"].get("fps", 5)),
+        stream_quality=int(cfg["stream"].get("quality", 70)),
+        stream_max_width=int(cfg["stream"]["max_width"]) if cfg["stream"].get("max_width") else None,
+        stream_skip_unchanged=bool(cfg["stream"].get("skip_unchanged", True)),
+        windows_cache_ttl_s=float(cfg["windows"].get("cache_ttl_s", 1.0)),
+        windows_resync_s=float(cfg["windows"].get("resync_s", 30.0)),
+        windows_event_hooks=bool(cfg["windows"].get("event_hooks", True)),
+        windows_event_history=int(cfg["windows"].get("event_history", 1024)),
         failsafe=bool(cfg["behavior"].get("failsafe", True)),
+        input_timing=input_timing(
+            str(cfg["behavior"].get("input_profile") or "fast"),
+            cfg["behavior"].get("input_timing") or {},
+        ),
+        type_backend=_type_backend(cfg["behavior"].get("type_backend")),
+        paste_chunk_chars=int(cfg["behavior"].get("paste_chunk_chars") or 0),
+        paste_restore_clipboard=bool(cfg["behavior"].get("paste_restore_clipboard", True)),
+        paste_settle_ms=float(cfg["behavior"].get("paste_settle_ms", 150)),
+        paste_restore_timeout_ms=float(cfg["behavior"].get("paste_restore_timeout_ms") or 2000),
+        input_queue=int(cfg["behavior"].get("input_queue") or 64),
+        input_queue_per_session=int(cfg["behavior"].get("input_queue_per_session") or 16),
+        input_max_wait_ms=float(cfg["behavior"].get("input_max_wait_ms") or 5000),
+        lanes=lane_limits({k: v for k, v in cfg["executors"].items() if k != "capture_defer_ms"}),
+        capture_defer_ms=float(cfg["executors"].get("capture_defer_ms") or 0),
     )
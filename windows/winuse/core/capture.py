@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Protocol, Tuple
+
+
+Region = Dict[str, int]
+
+
+def region_key(region: Region) -> Tuple[int, int, int, int]:
+    return (int(region["left"]), int(region["top"]), int(region["width"]), int(region["height"]))
+
+
+def clip_region(region: Region, bounds: Region) -> Region | None:
+    """Intersect ``region`` with ``bounds``; None when they do not overlap."""
+    left = max(region["left"], bounds["left"])
+    top = max(region["top"], bounds["top"])
+    right = min(region["left"] + region["width"], bounds["left"] + bounds["width"])
+    bottom = min(region["top"] + region["height"], bounds["top"] + bounds["height"])
+    if right <= left or bottom <= top:
+        return None
+    return {"left": left, "top": top, "width": right - left, "height": bottom - top}
+
+
+@dataclass(frozen=True)
+class Frame:
+    """A raw BGRA frame as grabbed from the screen."""
+
+    frame_id: int
+    timestamp: float
+    left: int
+    top: int
+    width: int
+    height: int
+    raw: bytes = field(repr=False)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return (self.width, self.height)
+
+    @property
+    def region(self) -> Region:
+        return {"left": self.left, "top": self.top, "width": self.width, "height": self.height}
+
+    def age_ms(self, now: float | None = None) -> float:
+        now = time.monotonic() if now is None else now
+        return max(0.0, (now - self.timestamp) * 1000.0)
+
+
+class FrameSource(Protocol):
+    """Something that can produce raw BGRA pixels for a screen region.
+
+    Sources are created and used on the capture thread only, so implementations
+    may hold thread-affine handles (GDI device contexts in the mss case).
+    """
+
+    def full_region(self) -> Region: ...
+
+    def monitors(self) -> List[Region]: ...
+
+    def grab(self, region: Region) -> bytes: ...
+
+    def close(self) -> None: ...
+
+
+class MssFrameSource:
+    def __init__(self) -> None:
+        import mss
+
+        self._sct = mss.mss()
+
+    def full_region(self) -> Region:
+        return self.monitors()[0]
+
+    def monitors(self) -> List[Region]:
+        return [{k: int(m[k]) for k in ("left", "top", "width", "height")} for m in self._sct.monitors]
+
+    def grab(self, region: Region) -> bytes:
+        return self._sct.grab(region).raw
+
+    def close(self) -> None:
+        self._sct.close()
+
+
+class _Job:
+    __slots__ = ("region", "call", "done", "frame", "result", "error")
+
+    def __init__(self, region: Region | None, call: Optional[Callable[[FrameSource], Any]] = None) -> None:
+        self.region = region
+        self.call = call
+        self.done = threading.Event()
+        self.frame: Frame | None = None
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class CaptureEngine:
+    """Long-lived capture thread with a ring buffer of recent frames.
+
+    All grabs happen on the engine thread so the frame source (and its OS
+    handles) is opened once and reused. Callers that can tolerate slightly
+    stale pixels pass ``max_age_ms`` and are answered from the ring buffer
+    without touching the screen at all.
+    """
+
+    def __init__(
+        self,
+        source_factory: Callable[[], FrameSource] = MssFrameSource,
+        ring_size: int = 8,
+        refresh_ms: int = 0,
+    ) -> None:
+        self._source_factory = source_factory
+        self._ring: Deque[Frame] = deque(maxlen=max(1, ring_size))
+        self._refresh_s = max(0, refresh_ms) / 1000.0
+        self._jobs: List[_Job] = []
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._full_key: Tuple[int, int, int, int] | None = None
+        self._next_id = 1
+        self._grabs = 0
+        self._hits = 0
+        self._grab_ms_total = 0.0
+
+    # -- lifecycle -----------------------------------------------------------
+
+    def start(self) -> None:
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="winuse-capture", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # -- public API ----------------------------------------------------------
+
+    def grab(self, region: Region | None = None, max_age_ms: float | None = None, timeout: float = 10.0) -> Frame:
+        """Return a frame for ``region`` (full virtual screen when None).
+
+        A buffered frame is reused when it covers the same region and is no
+        older than ``max_age_ms``; otherwise a fresh grab is made.
+        """
+        if max_age_ms:
+            frame = self.latest(region, max_age_ms)
+            if frame is not None:
+                with self._cond:
+                    self._hits += 1
+                return frame
+
+        job = self._submit(_Job(dict(region) if region is not None else None), timeout)
+        assert job.frame is not None
+        return job.frame
+
+    def run(self, call: Callable[[FrameSource], Any], timeout: float = 10.0) -> Any:
+        """Run ``call(source)`` on the engine thread and return its result."""
+        return self._submit(_Job(None, call), timeout).result
+
+    def monitors(self) -> List[Region]:
+        """Virtual screen first, then each physical monitor (mss ordering)."""
+        return self.run(lambda source: source.monitors())
+
+    def _submit(self, job: _Job, timeout: float) -> _Job:
+        self.start()
+        with self._cond:
+            self._jobs.append(job)
+            self._cond.notify_all()
+        if not job.done.wait(timeout):
+            raise TimeoutError("Capture engine did not respond")
+        if job.error is not None:
+            raise job.error
+        return job
+
+    def latest(self, region: Region | None = None, max_age_ms: float | None = None) -> Frame | None:
+        now = time.monotonic()
+        key = region_key(region) if region is not None else None
+        with self._cond:
+            frames = list(self._ring)
+            full = self._full_key
+        for frame in reversed(frames):
+            if max_age_ms is not None and frame.age_ms(now) > max_age_ms:
+                break
+            frame_key = region_key(frame.region)
+            if frame_key == (key if key is not None else full):
+                return frame
+        return None
+
+    def get(self, frame_id: int) -> Frame | None:
+        with self._cond:
+            for frame in self._ring:
+                if frame.frame_id == frame_id:
+                    return frame
+        return None
+
+    def stats(self) -> Dict[str, object]:
+        with self._cond:
+            grabs = self._grabs
+            return {
+                "running": self.is_running(),
+                "buffered": len(self._ring),
+                "ring_size": self._ring.maxlen,
+                "grabs": grabs,
+                "cache_hits": self._hits,
+                "avg_grab_ms": round(self._grab_ms_total / grabs, 3) if grabs else None,
+            }
+
+    # -- engine thread -------------------------------------------------------
+
+    def _run(self) -> None:
+        try:
+            source = self._source_factory()
+        except BaseException as exc:
+            self._fail_pending(exc)
+            with self._cond:
+                self._thread = None
+            return
+        try:
+            with self._cond:
+                self._full_key = region_key(source.full_region())
+            while True:
+                with self._cond:
+                    if not self._jobs and not self._stopping:
+                        self._cond.wait(self._refresh_s or None)
+                    if self._stopping:
+                        break
+                    jobs, self._jobs = self._jobs, []
+                if not jobs:
+                    # Idle refresh keeps a warm full-screen frame in the ring.
+                    if self._refresh_s:
+                        self._safe_grab(source, None)
+                    continue
+                self._serve(source, jobs)
+        finally:
+            source.close()
+            self._fail_pending(RuntimeError("Capture engine stopped"))
+
+    def _serve(self, source: FrameSource, jobs: List[_Job]) -> None:
+        # Concurrent requests for the same region share a single grab.
+        by_region: Dict[Tuple[int, int, int, int] | None, List[_Job]] = {}
+        for job in jobs:
+            if job.call is not None:
+                try:
+                    job.result = job.call(source)
+                except BaseException as exc:
+                    job.error = exc
+                job.done.set()
+                continue
+            key = region_key(job.region) if job.region is not None else None
+            by_region.setdefault(key, []).append(job)
+        for group in by_region.values():
+            try:
+                frame = self._grab(source, group[0].region)
+            except BaseException as exc:
+                for job in group:
+                    job.error = exc
+                    job.done.set()
+                continue
+            for job in group:
+                job.frame = frame
+                job.done.set()
+
+    def _safe_grab(self, source: FrameSource, region: Region | None) -> None:
+        try:
+            self._grab(source, region)
+        except Exception:
+            pass
+
+    def _grab(self, source: FrameSource, region: Region | None) -> Frame:
+        region = region if region is not None else source.full_region()
+        start = time.perf_counter()
+        raw = source.grab(region)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        with self._cond:
+            frame = Frame(
+                frame_id=self._next_id,
+                timestamp=time.monotonic(),
+                left=int(region["left"]),
+                top=int(region["top"]),
+                width=int(region["width"]),
+                height=int(region["height"]),
+                raw=raw,
+            )
+            self._next_id += 1
+            self._grabs += 1
+            self._grab_ms_total += elapsed_ms
+            self._ring.append(frame)
+        return frame
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        with self._cond:
+            jobs, self._jobs = self._jobs, []
+        for job in jobs:
+            job.error = exc
+            job.done.set()
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import struct
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Protocol, Sequence, Tuple
+
+try:
+    import pywintypes
+    import win32clipboard
+    import win32con
+except Exception:  # pragma: no cover - optional Windows-only dependency
+    pywintypes = None
+    win32clipboard = None
+    win32con = None
+
+Snapshot = List[Tuple[int, object]]
+
+# Formats whose data is a GDI handle rather than bytes; they cannot be
+# copied out and back. CF_DIB/CF_DIBV5 still carry bitmaps as bytes.
+_HANDLE_FORMATS = {2, 3, 9, 14, 0x80, 0x82, 0x83, 0x8E}
+_GDI_OBJECT_FIRST, _GDI_OBJECT_LAST = 0x0300, 0x03FF
+# A file list: pywin32 reads it as a tuple of paths but can only write it
+# back as a DROPFILES block.
+CF_HDROP = 15
+
+
+class ClipboardBusy(Exception):
+    """Another process holds the clipboard open."""
+
+
+class ClipboardTooLarge(Exception):
+    """The clipboard holds more than the snapshot limit; it cannot be restored."""
+
+
+class ClipboardBackend(Protocol):
+    def open(self) -> None:
+        """Open the clipboard; raise ClipboardBusy if another process has it."""
+
+    def close(self) -> None: ...
+
+    def snapshot(self, max_bytes: int) -> Snapshot:
+        """Copyable formats currently on the (open) clipboard.
+
+        Raise ClipboardTooLarge rather than return part of them.
+        """
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """Replace the (open) clipboard's contents with ``snapshot``."""
+
+    def set_text(self, text: str) -> None: ...
+
+    def sequence(self) -> int:
+        """The clipboard sequence number; it changes whenever anyone writes."""
+
+
+def drop_files(paths: Sequence[str]) -> bytes:
+    """A CF_HDROP ``DROPFILES`` block listing ``paths`` (wide, double-NUL terminated)."""
+    header = struct.pack("<IiiII", 20, 0, 0, 0, 1)  # pFiles, pt, fNC, fWide
+    return header + "".join(f"{p}\0" for p in paths).encode("utf-16-le") + b"\0\0"
+
+
+def split_chunks(text: str, chunk_chars: int) -> List[str]:
+    """Split ``text`` into pieces of at most ``chunk_chars``, preferring line ends."""
+    if chunk_chars <= 0 or len(text) <= chunk_chars:
+        return [text]
+    chunks: List[str] = []
+    start = 0
+    while start < len(text):
+        end = min(len(text), start + chunk_chars)
+        if end < len(text):
+            newline = text.rfind("\n", start + chunk_chars // 2, end)
+            if newline != -1:
+                end = newline + 1
+        chunks.append(text[start:end])
+        start = end
+    return chunks
+
+
+class _PendingRestore(NamedTuple):
+    snapshot: Snapshot
+    sequence: Optional[int]  # clipboard sequence number right after our last write
+
+
+def _start_timer(delay: float, fn: Callable[[], None]) -> None:
+    timer = threading.Timer(delay, fn)
+    timer.daemon = True
+    timer.start()
+
+
+class PasteEngine:
+    """Pastes text via the clipboard, then puts the user's clipboard back.
+
+    Large texts are pasted in chunks of ``chunk_chars``, ``settle_s`` apart
+    so the target has read one chunk before the clipboard changes again.
+    Clipboard contention (another process holding it open) is retried
+    with exponential backoff.
+
+    The snapshot taken up front is restored ``settle_s`` after the last
+    paste, on a timer thread rather than the caller's, so a paste costs
+    the caller about one keystroke. A paste that arrives before that takes
+    over the pending restore, and a restore is skipped if someone else has
+    written to the clipboard since our paste. If the clipboard stays busy,
+    the restore gives up after ``restore_timeout_s``.
+    """
+
+    def __init__(
+        self,
+        backend: ClipboardBackend,
+        press: Callable[[Sequence[str]], None],
+        *,
+        chunk_chars: int = 20000,
+        restore: bool = True,
+        settle_s: float = 0.15,
+        restore_timeout_s: float = 2.0,
+        max_snapshot_bytes: int = 64 * 1024 * 1024,
+        open_attempts: int = 8,
+        backoff_s: float = 0.005,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+        defer: Callable[[float, Callable[[], None]], None] = _start_timer,
+    ) -> None:
+        self._backend = backend
+        self._press = press
+        self._chunk_chars = chunk_chars
+        self._restore = restore
+        self._settle_s = max(0.0, settle_s)
+        self._restore_timeout_s = restore_timeout_s
+        self._max_snapshot_bytes = max_snapshot_bytes
+        self._open_attempts = max(1, open_attempts)
+        self._backoff_s = backoff_s
+        self._clock = clock
+        self._sleep = sleep
+        self._defer = defer
+        # One paste or restore at a time: interleaved, they would restore
+        # each other's text.
+        self._lock = threading.Lock()
+        self._pending: Optional[_PendingRestore] = None
+        self._stats = {
+            "pastes": 0,
+            "chunks": 0,
+            "chars": 0,
+            "open_retries": 0,
+            "restored": 0,
+            "restore_failed": 0,
+            "restore_skipped": 0,
+            "restore_superseded": 0,
+        }
+
+    def _with_clipboard(self, action: Callable[[], object]) -> object:
+        delay = self._backoff_s
+        for attempt in range(self._open_attempts):
+            try:
+                self._backend.open()
+            except ClipboardBusy:
+                if attempt == self._open_attempts - 1:
+                    raise
+                self._stats["open_retries"] += 1
+                self._sleep(delay)
+                delay *= 2
+                continue
+            try:
+                return action()
+            finally:
+                self._backend.close()
+        raise ClipboardBusy("Clipboard is busy")  # pragma: no cover - loop always returns or raises
+
+    def paste(
+        self,
+        text: str,
+        keys: Sequence[str] = ("ctrl", "v"),
+        *,
+        chunk_chars: Optional[int] = None,
+        restore: Optional[bool] = None,
+    ) -> Dict[str, object]:
+        chunk_chars = self._chunk_chars if chunk_chars is None else chunk_chars
+        restore = self._restore if restore is None else restore
+        chunks = split_chunks(text, chunk_chars)
+        with self._lock:
+            start = self._clock()
+            # A restore still pending from an earlier paste holds the user's
+            # clipboard; this paste takes it over (or, without restore, drops it).
+            snapshot = self._pending.snapshot if self._pending is not None else None
+            self._pending = None
+            restore_error: Optional[str] = None
+            if restore and snapshot is None:
+                try:
+                    snapshot = self._with_clipboard(lambda: self._backend.snapshot(self._max_snapshot_bytes))
+                except ClipboardTooLarge as exc:
+                    # Pasting anyway; restoring some formats but not others
+                    # would leave a clipboard the user never had.
+                    restore_error = str(exc)
+                    self._stats["restore_skipped"] += 1
+            elif not restore:
+                snapshot = None
+            sequence: Optional[int] = None
+
+            def write(chunk: str) -> int:
+                self._backend.set_text(chunk)
+                return self._backend.sequence()
+
+            try:
+                for index, chunk in enumerate(chunks):
+                    if index:
+                        self._sleep(self._settle_s)
+                    sequence = self._with_clipboard(lambda: write(chunk))
+                    self._press(keys)
+            finally:
+                if snapshot is not None:
+                    pending = self._pending = _PendingRestore(snapshot, sequence)
+                    self._defer(self._settle_s, lambda: self._restore_pending(pending))
+            elapsed = max(self._clock() - start, 1e-9)
+            self._stats["pastes"] += 1
+            self._stats["chunks"] += len(chunks)
+            self._stats["chars"] += len(text)
+        result: Dict[str, object] = {
+            "chars": len(text),
+            "chunks": len(chunks),
+            "restore_pending": snapshot is not None,
+            "elapsed_ms": round(elapsed * 1000.0, 1),
+            "chars_per_s": round(len(text) / elapsed),
+        }
+        if restore_error is not None:
+            result["restore_error"] = restore_error
+        return result
+
+    def _restore_pending(self, pending: _PendingRestore) -> None:
+        deadline = self._clock() + self._restore_timeout_s
+        delay = self._backoff_s
+        while True:
+            with self._lock:
+                if self._pending is not pending:
+                    return  # taken over by a later paste
+                try:
+                    self._backend.open()
+                except ClipboardBusy:
+                    if self._clock() >= deadline:
+                        self._pending = None
+                        self._stats["restore_failed"] += 1
+                        return
+                else:
+                    self._pending = None
+                    try:
+                        if pending.sequence is not None and self._backend.sequence() != pending.sequence:
+                            # Someone copied something after our paste; keep theirs.
+                            self._stats["restore_superseded"] += 1
+                        else:
+                            self._backend.restore(pending.snapshot)
+                            self._stats["restored"] += 1
+                    except Exception:
+                        self._stats["restore_failed"] += 1
+                    finally:
+                        self._backend.close()
+                    return
+            self._stats["open_retries"] += 1
+            self._sleep(delay)
+            delay = min(delay * 2, 0.1)
+
+    def flush(self) -> None:
+        """Restore a pending snapshot now, e.g. before shutting down."""
+        with self._lock:
+            pending = self._pending
+        if pending is not None:
+            self._restore_pending(pending)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+class Win32Clipboard:
+    """``ClipboardBackend`` over pywin32's win32clipboard."""
+
+    def open(self) -> None:
+        try:
+            win32clipboard.OpenClipboard()
+        except pywintypes.error as exc:
+            raise ClipboardBusy(str(exc)) from exc
+
+    def close(self) -> None:
+        win32clipboard.CloseClipboard()
+
+    def snapshot(self, max_bytes: int) -> Snapshot:
+        out: Snapshot = []
+        total = 0
+        fmt = win32clipboard.EnumClipboardFormats(0)
+        while fmt:
+            if fmt not in _HANDLE_FORMATS and not _GDI_OBJECT_FIRST <= fmt <= _GDI_OBJECT_LAST:
+                try:
+                    data = win32clipboard.GetClipboardData(fmt)
+                except pywintypes.error:
+                    data = None
+                if fmt == CF_HDROP and isinstance(data, tuple):
+                    data = drop_files(data)
+                if isinstance(data, (bytes, str)):
+                    total += len(data)
+                    if total > max_bytes:
+                        raise ClipboardTooLarge(f"Clipboard holds more than {max_bytes} bytes; not restored")
+                    out.append((fmt, data))
+            fmt = win32clipboard.EnumClipboardFormats(fmt)
+        return out
+
+    def restore(self, snapshot: Snapshot) -> None:
+        win32clipboard.EmptyClipboard()
+        for fmt, data in snapshot:
+            win32clipboard.SetClipboardData(fmt, data)
+
+    def set_text(self, text: str) -> None:
+        win32clipboard.EmptyClipboard()
+        win32clipboard.SetClipboardData(win32con.CF_UNICODETEXT, text)
+
+    def sequence(self) -> int:
+        return win32clipboard.GetClipboardSequenceNumber()
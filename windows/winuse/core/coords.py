@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class FrameMapping:
+    """How pixel coordinates in a served image relate to the screen."""
+
+    frame_id: int
+    left: int
+    top: int
+    scale_x: float
+    scale_y: float
+
+    def to_screen(self, x: float, y: float) -> Tuple[int, int]:
+        return (
+            int(round(self.left + x / self.scale_x)),
+            int(round(self.top + y / self.scale_y)),
+        )
+
+
+def scaled_size(
+    width: int,
+    height: int,
+    *,
+    scale: Optional[float] = None,
+    max_width: Optional[int] = None,
+) -> Tuple[int, int]:
+    """Output size for a frame; never upscales and keeps the aspect ratio."""
+    factor = 1.0
+    if scale is not None:
+        factor = min(factor, scale)
+    if max_width is not None and width > max_width:
+        factor = min(factor, max_width / width)
+    if factor >= 1.0:
+        return width, height
+    return max(1, int(round(width * factor))), max(1, int(round(height * factor)))
+
+
+def rect_point(rect: Mapping[str, int], x: float, y: float, *, normalized: bool = False) -> Tuple[int, int]:
+    """Screen pixel for a point given relative to ``rect`` (``x``/``y``/``width``/``height``).
+
+    ``x``/``y`` are pixel offsets from the rect's top-left corner, or with
+    ``normalized`` fractions of its size (0.5, 0.5 is the center). Points
+    outside the rect are rejected rather than clicked next to it.
+    """
+    width, height = int(rect["width"]), int(rect["height"])
+    if normalized:
+        if not (0.0 <= x <= 1.0 and 0.0 <= y <= 1.0):
+            raise ValueError(f"Normalized coordinates must be within 0..1, got ({x}, {y})")
+        # 1.0 is the last pixel, not one past it.
+        dx, dy = min(width - 1, x * width), min(height - 1, y * height)
+    else:
+        if not (0 <= x < width and 0 <= y < height):
+            raise ValueError(f"({x}, {y}) is outside the {width}x{height} area")
+        dx, dy = x, y
+    return int(round(rect["x"] + dx)), int(round(rect["y"] + dy))
+
+
+class FrameMappings:
+    """Bounded registry of frame_id -> FrameMapping for coordinate translation."""
+
+    def __init__(self, capacity: int = 256) -> None:
+        self._capacity = max(1, capacity)
+        self._items: "OrderedDict[int, FrameMapping]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, mapping: FrameMapping) -> FrameMapping:
+        frame_id = mapping.frame_id
+        with self._lock:
+            self._items[frame_id] = mapping
+            self._items.move_to_end(frame_id)
+            while len(self._items) > self._capacity:
+                self._items.popitem(last=False)
+        return mapping
+
+    def get(self, frame_id: int) -> FrameMapping | None:
+        with self._lock:
+            return self._items.get(frame_id)
+
+    def to_screen(self, frame_id: int, x: float, y: float) -> Tuple[int, int]:
+        mapping = self.get(frame_id)
+        if mapping is None:
+            raise KeyError(f"Unknown or expired frame_id {frame_id}")
+        return mapping.to_screen(x, y)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from winuse.core.capture import Frame
+
+
+def frame_array(frame: Frame) -> np.ndarray:
+    """View a frame's BGRA buffer as an (height, width, 4) uint8 array without copying."""
+    return np.frombuffer(frame.raw, dtype=np.uint8).reshape(frame.height, frame.width, 4)
+
+
+def _weights(tile: int) -> np.ndarray:
+    # Fixed odd multipliers make the weighted sum position-sensitive, so a
+    # tile whose pixels merely moved around still hashes differently.
+    rng = np.random.default_rng(0x5EED + tile)
+    return (rng.integers(1, 2**62, size=(tile, tile), dtype=np.uint64) | np.uint64(1))
+
+
+def tile_hashes(frame: Frame, tile: int) -> np.ndarray:
+    """Return a (rows, cols) uint64 array with one hash per ``tile``x``tile`` block.
+
+    The frame buffer is viewed (not copied) as packed 32-bit pixels and hashed
+    one band of tile rows at a time, so the widened uint64 temporaries stay
+    at ``tile`` rows instead of the whole frame. Partial edge tiles are zero
+    padded.
+    """
+    pixels = np.frombuffer(frame.raw, dtype=np.uint32).reshape(frame.height, frame.width)
+    rows = -(-frame.height // tile)
+    cols = -(-frame.width // tile)
+    weights = _weights(tile)[:, None, :]
+    band = np.zeros((tile, cols * tile), dtype=np.uint64)
+    out = np.empty((rows, cols), dtype=np.uint64)
+    for row in range(rows):
+        chunk = pixels[row * tile : (row + 1) * tile]
+        if chunk.shape[0] < tile or frame.width < cols * tile:
+            band.fill(0)
+        band[: chunk.shape[0], : frame.width] = chunk
+        blocks = band.reshape(tile, cols, tile)
+        out[row] = (blocks * weights).sum(axis=(0, 2), dtype=np.uint64)
+    return out
+
+
+def changed_rects(changed: np.ndarray, tile: int, width: int, height: int) -> List[Dict[str, int]]:
+    """Turn a boolean tile mask into pixel rects, merging horizontal runs per row."""
+    rects: List[Dict[str, int]] = []
+    for row, cols in enumerate(changed):
+        idx = np.flatnonzero(cols)
+        if not idx.size:
+            continue
+        # Split column indices into contiguous runs.
+        breaks = np.flatnonzero(np.diff(idx) > 1) + 1
+        for run in np.split(idx, breaks):
+            x = int(run[0]) * tile
+            y = row * tile
+            rects.append(
+                {
+                    "x": x,
+                    "y": y,
+                    "width": min((int(run[-1]) + 1) * tile, width) - x,
+                    "height": min(y + tile, height) - y,
+                }
+            )
+    return rects
+
+
+class DeltaTracker:
+    """Remembers per-frame tile hashes so deltas survive ring-buffer eviction."""
+
+    def __init__(self, history: int = 64) -> None:
+        self._history = max(1, history)
+        self._hashes: "OrderedDict[Tuple[int, int], Tuple[Tuple[int, int, int, int], np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, frame_id: int, tile: int):
+        with self._lock:
+            entry = self._hashes.get((frame_id, tile))
+            if entry is not None:
+                self._hashes.move_to_end((frame_id, tile))
+            return entry
+
+    def _put(self, frame: Frame, tile: int) -> np.ndarray:
+        entry = self._get(frame.frame_id, tile)
+        if entry is not None:
+            return entry[1]
+        hashes = tile_hashes(frame, tile)
+        geometry = (frame.left, frame.top, frame.width, frame.height)
+        with self._lock:
+            self._hashes[(frame.frame_id, tile)] = (geometry, hashes)
+            while len(self._hashes) > self._history:
+                self._hashes.popitem(last=False)
+        return hashes
+
+    def diff(
+        self,
+        frame: Frame,
+        since: int | None,
+        tile: int = 64,
+        reference: Frame | None = None,
+    ) -> Tuple[bool, List[Dict[str, int]]]:
+        """Return ``(full, rects)`` describing what changed in ``frame`` since frame ``since``.
+
+        ``reference`` is the ``since`` frame itself, if still available, and is
+        hashed on demand. ``full`` is True when the reference is unknown or has
+        different geometry; the single rect then covers the whole frame.
+        """
+        hashes = self._put(frame, tile)
+        previous = None
+        if since is not None:
+            previous = self._get(since, tile)
+            if previous is None and reference is not None and reference.frame_id == since:
+                self._put(reference, tile)
+                previous = self._get(since, tile)
+        geometry = (frame.left, frame.top, frame.width, frame.height)
+        if previous is None or previous[0] != geometry:
+            return True, [{"x": 0, "y": 0, "width": frame.width, "height": frame.height}]
+        return False, changed_rects(hashes != previous[1], tile, frame.width, frame.height)
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, NamedTuple, Optional, Tuple, TypeVar
+
+from winuse.core.timing import percentile
+
+T = TypeVar("T")
+
+# Who is sending input; set per HTTP request (``X-WinUse-Session`` header or
+# the client address) so each agent's actions keep their order.
+input_session: ContextVar[str] = ContextVar("input_session", default="default")
+
+
+class InputOverloaded(Exception):
+    """The input queue is full, or an action waited in it for too long."""
+
+
+class Dispatched(NamedTuple):
+    value: Any
+    queue_ms: float
+    run_ms: float
+
+
+class _Job(NamedTuple):
+    fn: Callable[[], object]
+    future: Future
+    queued_at: float
+
+
+class InputDispatcher:
+    """Runs every input action on one thread, one at a time.
+
+    Synthesized input is global state: two requests handled concurrently
+    can interleave the keys of a hotkey or overwrite each other's clipboard.
+    Callers block in :meth:`run` while their action waits in a bounded
+    queue. Each session's actions run in the order they were submitted;
+    sessions take turns, so one busy agent cannot starve another. A full
+    queue (overall or for one session) rejects new actions, and an action
+    that waited longer than ``max_wait_s`` is dropped instead of being
+    replayed late; both raise :class:`InputOverloaded`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = 64,
+        max_per_session: Optional[int] = None,
+        max_wait_s: float = 5.0,
+        history: int = 256,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._max_queue = max(1, max_queue)
+        self._max_per_session = max(1, max_per_session or self._max_queue)
+        self._max_wait_s = max_wait_s
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._queues: Dict[str, Deque[_Job]] = {}
+        # Sessions with queued jobs, in turn order; each appears once.
+        self._turns: Deque[str] = deque()
+        self._depth = 0
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._waits: Deque[float] = deque(maxlen=history)
+        self._runs: Deque[float] = deque(maxlen=history)
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0, "expired": 0, "max_depth": 0}
+
+    def start(self) -> None:
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._loop, name="winuse-input", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+        self._thread = None
+
+    def submit(self, fn: Callable[[], T], session: str = "default") -> Future:
+        future: Future = Future()
+        with self._cond:
+            if self._stopping:
+                raise InputOverloaded("Input dispatcher is shutting down")
+            queue = self._queues.get(session)
+            if self._depth >= self._max_queue:
+                self._stats["rejected"] += 1
+                raise InputOverloaded(f"Input queue is full ({self._depth} pending)")
+            if queue is not None and len(queue) >= self._max_per_session:
+                self._stats["rejected"] += 1
+                raise InputOverloaded(f"Session {session!r} has {len(queue)} input actions pending")
+            if queue is None:
+                queue = self._queues[session] = deque()
+                self._turns.append(session)
+            queue.append(_Job(fn, future, self._clock()))
+            self._depth += 1
+            self._stats["submitted"] += 1
+            self._stats["max_depth"] = max(self._stats["max_depth"], self._depth)
+            self._cond.notify()
+        self.start()
+        return future
+
+    def run(self, fn: Callable[[], T], session: Optional[str] = None) -> Dispatched:
+        """Queue ``fn``, wait for it and return its result with queue and run times."""
+        if threading.current_thread() is self._thread:
+            # Already on the input thread (an action that triggers another).
+            start = self._clock()
+            value = fn()
+            return Dispatched(value, 0.0, round((self._clock() - start) * 1000.0, 2))
+        return self.submit(fn, session or input_session.get()).result()
+
+    def _next(self) -> Optional[_Job]:
+        with self._cond:
+            while not self._turns and not self._stopping:
+                self._cond.wait()
+            if not self._turns:
+                return None
+            session = self._turns.popleft()
+            queue = self._queues[session]
+            job = queue.popleft()
+            if queue:
+                self._turns.append(session)
+            else:
+                del self._queues[session]
+            self._depth -= 1
+            return job
+
+    def _loop(self) -> None:
+        while True:
+            job = self._next()
+            if job is None:
+                return
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            started = self._clock()
+            waited = started - job.queued_at
+            if waited > self._max_wait_s:
+                with self._cond:
+                    self._stats["expired"] += 1
+                job.future.set_exception(
+                    InputOverloaded(f"Input action waited {waited * 1000.0:.0f} ms in the queue; dropped")
+                )
+                continue
+            try:
+                value = job.fn()
+            except BaseException as exc:
+                ran = self._clock() - started
+                self._record(waited, ran, failed=True)
+                job.future.set_exception(exc)
+            else:
+                ran = self._clock() - started
+                self._record(waited, ran, failed=False)
+                job.future.set_result(Dispatched(value, round(waited * 1000.0, 2), round(ran * 1000.0, 2)))
+
+    def _record(self, waited: float, ran: float, *, failed: bool) -> None:
+        with self._cond:
+            self._stats["failed" if failed else "completed"] += 1
+            self._waits.append(waited * 1000.0)
+            self._runs.append(ran * 1000.0)
+
+    def stats(self) -> Dict[str, object]:
+        with self._cond:
+            waits: Tuple[float, ...] = tuple(self._waits)
+            runs: Tuple[float, ...] = tuple(self._runs)
+            return {
+                **self._stats,
+                "depth": self._depth,
+                "sessions": len(self._queues),
+                "max_queue": self._max_queue,
+                "max_per_session": self._max_per_session,
+                "wait_ms_p50": percentile(waits, 0.5),
+                "wait_ms_p95": percentile(waits, 0.95),
+                "wait_ms_max": round(max(waits), 2) if waits else None,
+                "run_ms_p50": percentile(runs, 0.5),
+                "run_ms_p95": percentile(runs, 0.95),
+            }
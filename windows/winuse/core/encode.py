@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from winuse.core.capture import Frame
+
+
+_PIL_FORMATS = {"png": "PNG", "jpg": "JPEG", "jpeg": "JPEG", "webp": "WEBP", "bmp": "BMP"}
+
+MEDIA_TYPES = {"png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg", "webp": "image/webp", "bmp": "image/bmp"}
+
+
+@dataclass(frozen=True)
+class EncoderProfile:
+    """How captured frames are turned into image files."""
+
+    format: str = "png"
+    png_compress_level: int = 1
+    quality: int = 80
+    lossless: bool = False
+
+    def __post_init__(self) -> None:
+        fmt = self.format.lower()
+        if fmt not in _PIL_FORMATS:
+            raise ValueError(f"Unsupported image format: {self.format}")
+        object.__setattr__(self, "format", fmt)
+        if not 0 <= self.png_compress_level <= 9:
+            raise ValueError("png_compress_level must be between 0 and 9")
+        if not 1 <= self.quality <= 100:
+            raise ValueError("quality must be between 1 and 100")
+
+    @property
+    def extension(self) -> str:
+        return "jpg" if self.format == "jpeg" else self.format
+
+    @property
+    def media_type(self) -> str:
+        return MEDIA_TYPES[self.format]
+
+    def with_overrides(self, **overrides: Any) -> "EncoderProfile":
+        """Return a copy with every non-None override applied."""
+        changes = {k: v for k, v in overrides.items() if v is not None}
+        return replace(self, **changes) if changes else self
+
+    def save_options(self) -> Dict[str, Any]:
+        fmt = _PIL_FORMATS[self.format]
+        if fmt == "PNG":
+            return {"format": fmt, "compress_level": self.png_compress_level}
+        if fmt == "JPEG":
+            return {"format": fmt, "quality": self.quality}
+        if fmt == "WEBP":
+            # method 0 is the fastest WebP effort level; quality still applies.
+            return {"format": fmt, "quality": self.quality, "lossless": self.lossless, "method": 0}
+        return {"format": fmt}
+
+
+@dataclass(frozen=True)
+class Encoded:
+    data: bytes
+    profile: EncoderProfile
+    encode_ms: float
+
+
+def frame_image(frame: Frame, size: Optional[Tuple[int, int]] = None) -> Image.Image:
+    # The raw BGRX decoder reads mss's BGRA buffer in place and writes RGB in
+    # one C pass; going through ``ScreenShot.rgb`` would build two extra
+    # full-frame copies in Python first.
+    img = Image.frombytes("RGB", frame.size, frame.raw, "raw", "BGRX")
+    if size is not None and size != frame.size:
+        # reducing_gap lets Pillow box-reduce by an integer factor first, which
+        # is far cheaper than a full bilinear pass over a 4K frame.
+        img = img.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+    return img
+
+
+def rect_image(frame: Frame, rect: Dict[str, int]) -> Image.Image:
+    """Decode only ``rect`` of ``frame``, slicing rows out of the raw buffer via memoryview."""
+    x, y, width, height = rect["x"], rect["y"], rect["width"], rect["height"]
+    if (x, y, width, height) == (0, 0, frame.width, frame.height):
+        return frame_image(frame)
+    view = memoryview(frame.raw)
+    stride = frame.width * 4
+    start = y * stride + x * 4
+    rows = b"".join(view[start + row * stride : start + row * stride + width * 4] for row in range(height))
+    return Image.frombytes("RGB", (width, height), rows, "raw", "BGRX")
+
+
+def encode_image(img: Image.Image, profile: EncoderProfile) -> Encoded:
+    start = time.perf_counter()
+    buf = io.BytesIO()
+    img.save(buf, **profile.save_options())
+    return Encoded(buf.getvalue(), profile, (time.perf_counter() - start) * 1000.0)
+
+
+class Encoder:
+    """Encodes frames on a small worker pool.
+
+    Pillow releases the GIL inside its zlib/libjpeg/libwebp encoders, so a
+    thread pool encodes concurrent screenshots in parallel without pickling
+    multi-megabyte frames across process boundaries.
+    """
+
+    def __init__(self, profile: EncoderProfile | None = None, workers: int = 2) -> None:
+        self.profile = profile or EncoderProfile()
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="winuse-encode")
+
+    def encode(
+        self,
+        frame: Frame,
+        profile: EncoderProfile | None = None,
+        size: Optional[Tuple[int, int]] = None,
+    ) -> Encoded:
+        """Encode ``frame``, resized to ``size`` first when given."""
+        profile = profile or self.profile
+        return self._pool.submit(lambda: encode_image(frame_image(frame, size), profile)).result()
+
+    def encode_rects(
+        self,
+        frame: Frame,
+        rects: List[Dict[str, int]],
+        profile: EncoderProfile | None = None,
+    ) -> List[Encoded]:
+        """Encode several rects of one frame in parallel, in input order."""
+        profile = profile or self.profile
+        return list(self._pool.map(lambda rect: encode_image(rect_image(frame, rect), profile), rects))
+
+    def save(
+        self,
+        frame: Frame,
+        path: str,
+        profile: Optional[EncoderProfile] = None,
+        size: Optional[Tuple[int, int]] = None,
+    ) -> Encoded:
+        encoded = self.encode(frame, profile, size)
+        with open(path, "wb") as f:
+            f.write(encoded.data)
+        return encoded
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from winuse.core.registry import EVENTS, WindowInfo, WindowRegistry
+
+# Kinds that fire in bursts (dragging a window, a ticking title); only the
+# latest one per window is kept when several are pending.
+_COALESCED = ("location", "name")
+_GONE = ("destroy", "hide")
+
+
+def parse_kinds(kinds: Optional[str]) -> Optional[frozenset]:
+    """Parse ``kinds=foreground,create`` into a validated set (None = all kinds)."""
+    if not kinds:
+        return None
+    names = {k.strip() for k in kinds.split(",") if k.strip()}
+    unknown = sorted(names - set(EVENTS))
+    if unknown:
+        raise ValueError(f"Unknown event kind(s): {', '.join(unknown)} (valid: {', '.join(EVENTS)})")
+    return frozenset(names)
+
+
+@dataclass(frozen=True)
+class WindowEvent:
+    seq: int
+    kind: str
+    hwnd: int
+    time: float
+    window: Optional[WindowInfo]
+
+    def as_dict(self) -> Dict[str, object]:
+        return {"seq": self.seq, "kind": self.kind, "hwnd": self.hwnd, "time": self.time, "window": self.window}
+
+
+class EventLog:
+    """Bounded, sequence-numbered history of window events.
+
+    Sequence numbers start at 1 and never repeat within a server run, so a
+    client can resume with the last ``seq`` it saw. ``read`` reports a gap
+    when events after the cursor were already dropped (or the cursor is from
+    an earlier run); the client should then re-list windows.
+    """
+
+    def __init__(self, capacity: int = 1024, clock: Callable[[], float] = time.time) -> None:
+        self._items: Deque[WindowEvent] = deque(maxlen=max(1, capacity))
+        self._clock = clock
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def append(self, kind: str, hwnd: int, window: Optional[WindowInfo]) -> WindowEvent:
+        with self._lock:
+            self._seq += 1
+            event = WindowEvent(self._seq, kind, hwnd, round(self._clock(), 3), window)
+            self._items.append(event)
+            return event
+
+    def read(
+        self,
+        since: Optional[int] = None,
+        kinds: Optional[frozenset] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[WindowEvent], bool, int]:
+        """Events after ``since`` (all retained if None): ``(events, gap, cursor)``.
+
+        ``cursor`` is the seq to pass as the next ``since``; it advances past
+        events filtered out by ``kinds`` so they are not scanned again.
+        """
+        with self._lock:
+            last = self._seq
+            first = self._items[0].seq if self._items else last + 1
+            gap = since is not None and (since > last or since < first - 1)
+            start = 0 if since is None or gap else since
+            out: List[WindowEvent] = []
+            cursor = start
+            for event in self._items:
+                if event.seq <= start:
+                    continue
+                if limit is not None and len(out) >= limit:
+                    break
+                cursor = event.seq
+                if kinds is None or event.kind in kinds:
+                    out.append(event)
+            if limit is None or len(out) < limit:
+                cursor = max(cursor, last)
+            return out, gap, cursor
+
+
+class EventSubscriber:
+    """Wakes one streaming client when new events are logged.
+
+    Events are not queued per client: the subscriber only signals, and the
+    client reads from the shared log with its own cursor.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._event = asyncio.Event()
+
+    def notify(self) -> None:
+        """Called from the hub thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            pass
+
+    async def wait(self, timeout: float) -> bool:
+        """True if woken by new events, False after ``timeout`` seconds."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+
+class WindowEventHub:
+    """Turns the registry's raw window hooks into one shared event log.
+
+    The registry's hook callback only enqueues ``(kind, hwnd)``; a worker
+    thread coalesces bursts, describes windows through the registry (so the
+    describe also refreshes the cached list) and appends to the log. Only
+    windows the registry would list are reported. Without hooks, the worker
+    instead diffs the registry list every ``poll_s`` while clients are
+    subscribed or have read a batch (:meth:`catch_up`) within
+    ``reader_idle_s``, and tracks the foreground window with ``foreground``.
+    """
+
+    def __init__(
+        self,
+        registry: WindowRegistry,
+        *,
+        foreground: Optional[Callable[[], Optional[int]]] = None,
+        capacity: int = 1024,
+        poll_s: float = 1.0,
+        reader_idle_s: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._registry = registry
+        self._foreground = foreground
+        self._poll_s = max(0.05, poll_s)
+        self._reader_idle_s = reader_idle_s
+        self._clock = clock
+        self._read_at: Optional[float] = None
+        self._poll_lock = threading.Lock()
+        self.log = EventLog(capacity)
+        self._raw: "queue.Queue[Optional[Tuple[str, int]]]" = queue.Queue()
+        self._known: Dict[int, WindowInfo] = {}
+        self._fg: Optional[int] = None
+        self._subscribers: List[EventSubscriber] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._stats = {"raw": 0, "coalesced": 0, "published": 0, "polls": 0, "errors": 0}
+
+    def attach(self) -> None:
+        """Start receiving hook events, from the registry's current window list on."""
+        self._known = {int(w["hwnd"]): w for w in self._safe_list()}
+        self._registry.add_listener(self._on_raw)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self.attach()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="winuse-window-events", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._running = False
+        self._registry.remove_listener(self._on_raw)
+        self._raw.put(None)
+        thread.join(timeout=2)
+
+    def subscribe(self, loop: asyncio.AbstractEventLoop) -> EventSubscriber:
+        sub = EventSubscriber(loop)
+        with self._lock:
+            self._subscribers.append(sub)
+        self._raw.put(None)  # a polling worker starts diffing right away
+        return sub
+
+    def unsubscribe(self, sub: EventSubscriber) -> None:
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+
+    def catch_up(self) -> None:
+        """Before a batch read: without hooks, diff the window list now.
+
+        Polling also continues for ``reader_idle_s``, so a client polling
+        ``GET /windows/events`` sees changes between its reads as well.
+        """
+        if self._registry.hooked:
+            return
+        self._read_at = self._clock()
+        self.poll()
+
+    def read(
+        self,
+        since: Optional[int] = None,
+        kinds: Optional[frozenset] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[WindowEvent], bool, int]:
+        return self.log.read(since, kinds, limit)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            subscribers = len(self._subscribers)
+        return {
+            **self._stats,
+            "running": self._thread is not None,
+            "subscribers": subscribers,
+            "last_seq": self.log.last_seq,
+        }
+
+    def _on_raw(self, kind: str, hwnd: int) -> None:
+        self._raw.put((kind, hwnd))
+
+    def _run(self) -> None:
+        while self._running:
+            try:
+                if self._registry.hooked:
+                    self.process(timeout=1.0)
+                else:
+                    self.poll(timeout=self._poll_s)
+            except Exception:
+                self._stats["errors"] += 1
+
+    def _safe_list(self) -> List[WindowInfo]:
+        try:
+            return self._registry.list()
+        except Exception:
+            self._stats["errors"] += 1
+            return []
+
+    def _drain(self, timeout: float) -> "OrderedDict[Tuple[str, int], None]":
+        """Pending raw events in arrival order, bursts collapsed."""
+        pending: "OrderedDict[Tuple[str, int], None]" = OrderedDict()
+        try:
+            item = self._raw.get(timeout=timeout) if timeout > 0 else self._raw.get_nowait()
+        except queue.Empty:
+            return pending
+        while True:
+            if item is not None:
+                self._stats["raw"] += 1
+                if item in pending and item[0] in _COALESCED:
+                    pending.move_to_end(item)
+                    self._stats["coalesced"] += 1
+                else:
+                    pending[item] = None
+            try:
+                item = self._raw.get_nowait()
+            except queue.Empty:
+                return pending
+
+    def process(self, timeout: float = 0.0) -> int:
+        """Publish hook events received so far (waiting up to ``timeout``); returns the count."""
+        published = 0
+        for kind, hwnd in self._drain(timeout):
+            if kind in _GONE:
+                if self._known.pop(hwnd, None) is None:
+                    continue
+                window = None
+            else:
+                window = self._registry.get(hwnd)
+                if window is None:
+                    continue
+                self._known[hwnd] = window
+            self._publish(kind, hwnd, window)
+            published += 1
+        return published
+
+    def poll(self, timeout: float = 0.0) -> int:
+        """Publish changes found by diffing the window list (hook fallback)."""
+        self._drain(timeout)
+        with self._lock:
+            subscribed = bool(self._subscribers)
+        reading = self._read_at is not None and self._clock() - self._read_at < self._reader_idle_s
+        if not (subscribed or reading):
+            return 0
+        with self._poll_lock:
+            return self._diff()
+
+    def _diff(self) -> int:
+        self._stats["polls"] += 1
+        current = {int(w["hwnd"]): w for w in self._safe_list()}
+        changes: List[Tuple[str, int, Optional[WindowInfo]]] = []
+        for hwnd in self._known.keys() - current.keys():
+            changes.append(("destroy", hwnd, None))
+        for hwnd, window in current.items():
+            before = self._known.get(hwnd)
+            if before is None:
+                changes.append(("create", hwnd, window))
+            elif before.get("title") != window.get("title"):
+                changes.append(("name", hwnd, window))
+            elif before.get("rect") != window.get("rect"):
+                changes.append(("location", hwnd, window))
+        self._known = current
+        if self._foreground is not None:
+            try:
+                fg = self._foreground()
+            except Exception:
+                fg = None
+            if fg and fg != self._fg and fg in current:
+                changes.append(("foreground", fg, current[fg]))
+            self._fg = fg
+        for kind, hwnd, window in changes:
+            self._publish(kind, hwnd, window)
+        return len(changes)
+
+    def _publish(self, kind: str, hwnd: int, window: Optional[WindowInfo]) -> None:
+        self.log.append(kind, hwnd, window)
+        self._stats["published"] += 1
+        with self._lock:
+            subs = list(self._subscribers)
+        for sub in subs:
+            sub.notify()
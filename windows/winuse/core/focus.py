@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Protocol
+
+# Ways of bringing a window to the foreground, cheapest first.
+#   direct: SetForegroundWindow (works when we own the foreground lock)
+#   attach: attach to the foreground and target input queues, then set it
+#   alt:    synthesize an ALT tap, which releases the foreground lock
+STRATEGIES = ("direct", "attach", "alt")
+
+
+class FocusBackend(Protocol):
+    def is_foreground(self, hwnd: int) -> bool: ...
+
+    def prepare(self, hwnd: int) -> None:
+        """Restore if minimized and raise the window."""
+
+    def apply(self, strategy: str, hwnd: int) -> None:
+        """Try one strategy; success is checked with ``is_foreground``."""
+
+    def last_error(self) -> str: ...
+
+
+class FocusManager:
+    """Focuses windows, trying first whatever last worked for the process.
+
+    Foreground changes are asynchronous, so each strategy is followed by a
+    short confirmation poll (at most ``confirm_ms``) rather than a fixed
+    sleep, and the whole call is bounded by ``timeout_ms``. The winning
+    strategy per process name is kept in a bounded LRU table.
+    """
+
+    def __init__(
+        self,
+        backend: FocusBackend,
+        *,
+        confirm_ms: float = 100.0,
+        poll_ms: float = 10.0,
+        capacity: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._backend = backend
+        self._confirm_ms = confirm_ms
+        self._poll_ms = poll_ms
+        self._capacity = max(1, capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._learned: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, object] = {
+            "calls": 0,
+            "already_foreground": 0,
+            "failures": 0,
+            "learned_hits": 0,
+            "wins": {s: 0 for s in STRATEGIES},
+        }
+
+    def order(self, process: Optional[str]) -> List[str]:
+        with self._lock:
+            learned = self._learned.get(process) if process else None
+        if learned is None:
+            return list(STRATEGIES)
+        return [learned] + [s for s in STRATEGIES if s != learned]
+
+    def _confirm(self, hwnd: int, deadline: float) -> bool:
+        until = min(deadline, self._clock() + self._confirm_ms / 1000.0)
+        while True:
+            if self._backend.is_foreground(hwnd):
+                return True
+            now = self._clock()
+            if now >= until:
+                return False
+            self._sleep(min(self._poll_ms / 1000.0, until - now))
+
+    def _learn(self, process: Optional[str], strategy: str) -> None:
+        if not process:
+            return
+        with self._lock:
+            self._learned[process] = strategy
+            self._learned.move_to_end(process)
+            while len(self._learned) > self._capacity:
+                self._learned.popitem(last=False)
+
+    def focus(self, hwnd: int, process: Optional[str] = None, timeout_ms: float = 1000.0) -> Dict[str, object]:
+        """Bring ``hwnd`` to the foreground; raises RuntimeError if no strategy sticks."""
+        start = self._clock()
+        deadline = start + timeout_ms / 1000.0
+        with self._lock:
+            self._stats["calls"] += 1
+        if self._backend.is_foreground(hwnd):
+            with self._lock:
+                self._stats["already_foreground"] += 1
+            return self._result(hwnd, "already_foreground", [], start)
+
+        self._backend.prepare(hwnd)
+        order = self.order(process)
+        tried: List[str] = []
+        for strategy in order:
+            if tried and self._clock() >= deadline:
+                break
+            tried.append(strategy)
+            try:
+                self._backend.apply(strategy, hwnd)
+            except Exception:
+                continue
+            if self._confirm(hwnd, deadline):
+                with self._lock:
+                    self._stats["wins"][strategy] += 1
+                    if len(tried) == 1 and self._learned.get(process or "") == strategy:
+                        self._stats["learned_hits"] += 1
+                self._learn(process, strategy)
+                return self._result(hwnd, strategy, tried, start)
+
+        with self._lock:
+            self._stats["failures"] += 1
+        elapsed = (self._clock() - start) * 1000.0
+        raise RuntimeError(
+            f"SetForegroundWindow failed after {', '.join(tried)} in {elapsed:.0f} ms ({self._backend.last_error()})"
+        )
+
+    def _result(self, hwnd: int, strategy: str, tried: List[str], start: float) -> Dict[str, object]:
+        return {
+            "hwnd": hwnd,
+            "strategy": strategy,
+            "attempts": tried,
+            "elapsed_ms": round((self._clock() - start) * 1000.0, 1),
+        }
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {**self._stats, "wins": dict(self._stats["wins"]), "processes": len(self._learned)}
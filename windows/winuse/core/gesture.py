@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+Point = Tuple[float, float]
+
+EASINGS: Dict[str, Callable[[float], float]] = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t,
+    "ease_out": lambda t: 1.0 - (1.0 - t) * (1.0 - t),
+    "ease_in_out": lambda t: 3.0 * t * t - 2.0 * t * t * t,
+}
+
+
+class Sample(NamedTuple):
+    t: float  # seconds from the start of the gesture
+    x: int
+    y: int
+    vertex: bool  # a polyline corner; never skipped when running late
+
+
+def plan_path(
+    points: Sequence[Point],
+    *,
+    duration_s: float,
+    rate_hz: float = 120.0,
+    easing: str = "linear",
+) -> List[Sample]:
+    """Timed cursor positions along a polyline, about ``rate_hz`` per second.
+
+    Progress along the path is measured by length (so long segments are not
+    rushed) and shaped by ``easing``. Every vertex is included exactly;
+    positions are rounded to pixels and consecutive duplicates dropped, so a
+    slow gesture over a short distance only sends moves that change the
+    cursor. With ``duration_s`` 0 the vertices themselves are the plan.
+    """
+    ease = EASINGS.get(easing)
+    if ease is None:
+        raise ValueError(f"Unknown easing {easing!r} (valid: {', '.join(EASINGS)})")
+    if not points:
+        raise ValueError("Path needs at least one point")
+    pts = [(float(x), float(y)) for x, y in points]
+    samples: List[Sample] = []
+
+    def add(t: float, x: float, y: float, vertex: bool) -> None:
+        px, py = int(round(x)), int(round(y))
+        if samples and (samples[-1].x, samples[-1].y) == (px, py):
+            if vertex and not samples[-1].vertex:
+                samples[-1] = Sample(samples[-1].t, px, py, True)
+            return
+        samples.append(Sample(t, px, py, vertex))
+
+    cumulative = [0.0]
+    for (x0, y0), (x1, y1) in zip(pts, pts[1:]):
+        cumulative.append(cumulative[-1] + math.hypot(x1 - x0, y1 - y0))
+    total = cumulative[-1]
+    if duration_s <= 0 or total == 0:
+        for x, y in pts:
+            add(max(0.0, duration_s), x, y, True)
+        return samples
+
+    add(0.0, *pts[0], True)
+    steps = max(1, int(math.ceil(duration_s * rate_hz)))
+    segment = 1
+    prev_t = prev_d = 0.0
+    for i in range(1, steps + 1):
+        t = duration_s * i / steps
+        d = total * ease(i / steps)
+        # Vertices passed since the previous step, at interpolated times.
+        while segment < len(pts) and cumulative[segment] <= d:
+            f = 1.0 if d == prev_d else (cumulative[segment] - prev_d) / (d - prev_d)
+            add(prev_t + (t - prev_t) * f, *pts[segment], True)
+            segment += 1
+        if segment < len(pts):
+            (x0, y0), (x1, y1) = pts[segment - 1], pts[segment]
+            length = cumulative[segment] - cumulative[segment - 1]
+            f = (d - cumulative[segment - 1]) / length if length else 1.0
+            add(t, x0 + (x1 - x0) * f, y0 + (y1 - y0) * f, False)
+        prev_t, prev_d = t, d
+    if segment < len(pts):  # rounding in ``ease(1.0)``
+        add(duration_s, *pts[-1], True)
+    return samples
+
+
+def split_amount(total: int, steps: int) -> List[int]:
+    """Split ``total`` into ``steps`` integer parts that differ by at most one."""
+    steps = max(1, steps)
+    base, rem = divmod(abs(total), steps)
+    sign = -1 if total < 0 else 1
+    return [sign * (base + (1 if i < rem else 0)) for i in range(steps)]
+
+
+class GesturePlayer:
+    """Replays timed samples against an absolute schedule.
+
+    Each sample is sent when it is due. If the sender falls behind (a slow
+    input call, a descheduled thread), overdue samples are coalesced into
+    the newest one, except polyline vertices, so a gesture never stretches
+    out or builds a backlog of stale moves.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+
+    def play(self, samples: Sequence[Sample], move: Callable[[int, int], None]) -> Dict[str, object]:
+        start = self._clock()
+        sent = skipped = 0
+        max_lag = 0.0
+        i = 0
+        while i < len(samples):
+            now = self._clock() - start
+            j = i
+            while not samples[j].vertex and j + 1 < len(samples) and samples[j + 1].t <= now:
+                j += 1
+            skipped += j - i
+            sample = samples[j]
+            if sample.t > now:
+                self._sleep(sample.t - now)
+            else:
+                max_lag = max(max_lag, now - sample.t)
+            move(sample.x, sample.y)
+            sent += 1
+            i = j + 1
+        return {
+            "points": len(samples),
+            "sent": sent,
+            "skipped": skipped,
+            "elapsed_ms": round((self._clock() - start) * 1000.0, 1),
+            "max_lag_ms": round(max_lag * 1000.0, 1),
+        }
+
+    def spread(self, items: Sequence[T], duration_s: float, send: Callable[[T], None]) -> Dict[str, object]:
+        """Send ``items`` evenly over ``duration_s``; nothing is dropped when late."""
+        start = self._clock()
+        last = max(1, len(items) - 1)
+        for i, item in enumerate(items):
+            wait = duration_s * i / last - (self._clock() - start)
+            if wait > 0:
+                self._sleep(wait)
+            send(item)
+        return {"steps": len(items), "elapsed_ms": round((self._clock() - start) * 1000.0, 1)}
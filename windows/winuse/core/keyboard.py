@@ -1,40 +1,58 @@
 from __future__ import annotations
 
+from typing import Dict
+
 import pyautogui
 
-try:
-    import win32clipboard
-    import win32con
-except Exception:  # pragma: no cover - optional Windows-only dependency
-    win32clipboard = None
-    win32con = None
+from winuse.core import clipboard
+from winuse.core.clipboard import PasteEngine
+from winuse.core.sendinput import UnicodeTyper
 
 
-def type_text(text: str, interval: float = 0.0) -> None:
-    pyautogui.write(text, interval=interval)
+_typer = UnicodeTyper()
 
 
-def paste_text(text: str, *, keys: list[str] | None = None, allow_fallback: bool = True) -> bool:
-    if win32clipboard and win32con:
-        win32clipboard.OpenClipboard()
-        try:
-            win32clipboard.EmptyClipboard()
-            win32clipboard.SetClipboardData(win32con.CF_UNICODETEXT, text)
-        finally:
-            win32clipboard.CloseClipboard()
-        paste_keys = keys or ["ctrl", "v"]
-        pyautogui.hotkey(*paste_keys)
-        return True
+def type_text(text: str, interval: float = 0.0, backend: str = "sendinput") -> Dict[str, object]:
+    """Type ``text``; ``sendinput`` batches Unicode key events, ``pyautogui`` sends one key per call."""
+    if backend == "sendinput":
+        return {"backend": "sendinput", **_typer.type(text, interval=interval)}
+    pyautogui.write(text, interval=interval)
+    return {"backend": "pyautogui"}
+
+
+def paste_text(
+    text: str,
+    *,
+    engine: PasteEngine | None,
+    keys: list[str] | None = None,
+    allow_fallback: bool = True,
+    chunk_chars: int | None = None,
+    restore_clipboard: bool | None = None,
+    type_backend: str = "sendinput",
+) -> Dict[str, object]:
+    """Paste via ``engine``; without a clipboard, type instead (if allowed).
+
+    Returns the paste stats with ``mode`` set to the method actually used.
+    """
+    if engine is not None:
+        stats = engine.paste(text, keys or ["ctrl", "v"], chunk_chars=chunk_chars, restore=restore_clipboard)
+        return {"mode": "paste", **stats}
 
     if allow_fallback:
-        pyautogui.write(text)
-        return False
+        return {"mode": "type", **type_text(text, backend=type_backend)}
 
     raise RuntimeError("Clipboard unavailable (win32clipboard not loaded)")
 
 
-def press_keys(keys: list[str]) -> None:
+def paste_engine(key_interval: float = 0.0, **options) -> PasteEngine | None:
+    """A clipboard paste engine pressing the paste keys with ``key_interval``, or None without win32clipboard."""
+    if clipboard.win32clipboard is None:
+        return None
+    return PasteEngine(clipboard.Win32Clipboard(), lambda keys: press_keys(list(keys), key_interval), **options)
+
+
+def press_keys(keys: list[str], key_interval: float = 0.0) -> None:
     if len(keys) == 1:
         pyautogui.press(keys[0])
     else:
-        pyautogui.hotkey(*keys)
+        pyautogui.hotkey(*keys, interval=key_interval)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Deque, Dict, Optional
+
+from winuse.core.timing import percentile
+
+
+@dataclass(frozen=True)
+class LaneLimits:
+    """Size of one executor lane: worker threads, and requests admitted at once."""
+
+    workers: int = 4
+    max_pending: int = 64
+
+    def __post_init__(self) -> None:
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        if self.max_pending < self.workers:
+            raise ValueError("max_pending must be at least workers")
+
+
+DEFAULT_LANES: Dict[str, LaneLimits] = {
+    # Screenshot, delta, pixel and template requests: CPU heavy, so few at a time.
+    "capture": LaneLimits(workers=4, max_pending=32),
+    # Threads here mostly wait for the input dispatcher's single thread; as
+    # many as its queue holds, so the dispatcher (not this pool) decides
+    # which session goes next.
+    "input": LaneLimits(workers=64, max_pending=128),
+    "windows": LaneLimits(workers=4, max_pending=64),
+    # /wait long polls: mostly asleep between samples, so more threads than
+    # capture, but kept apart so waiting callers cannot block screenshots.
+    "wait": LaneLimits(workers=16, max_pending=32),
+}
+
+
+def lane_limits(overrides: Optional[Dict[str, Any]] = None) -> Dict[str, LaneLimits]:
+    """``DEFAULT_LANES`` with per-lane ``workers``/``max_pending`` from the ``executors`` config."""
+    unknown = sorted(set(overrides or {}) - set(DEFAULT_LANES))
+    if unknown:
+        raise ValueError(f"Unknown executor lane(s): {', '.join(unknown)} (valid: {', '.join(DEFAULT_LANES)})")
+    out = dict(DEFAULT_LANES)
+    for name, values in (overrides or {}).items():
+        fields = {k: int(v) for k, v in (values or {}).items() if v is not None}
+        bad = sorted(set(fields) - {"workers", "max_pending"})
+        if bad:
+            raise ValueError(f"Unknown key(s) for executor lane {name!r}: {', '.join(bad)}")
+        out[name] = replace(out[name], **fields)
+    return out
+
+
+class LaneSaturated(Exception):
+    """A lane already holds ``max_pending`` requests."""
+
+
+class Lane:
+    """A dedicated, sized thread pool for one class of endpoint.
+
+    Requests beyond ``max_pending`` (running plus queued) are rejected with
+    :class:`LaneSaturated` instead of queueing without bound. A lane can
+    ``defer_to`` a higher-priority lane: each of its jobs waits up to
+    ``max_defer_s`` for that lane to go idle before starting, so CPU-heavy
+    work does not compete with latency-critical work already in flight.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limits: LaneLimits = LaneLimits(),
+        *,
+        defer_to: Optional["Lane"] = None,
+        max_defer_s: float = 0.05,
+        history: int = 256,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.name = name
+        self.limits = limits
+        self._defer_to = defer_to
+        self._max_defer_s = max_defer_s
+        self._clock = clock
+        self._pool = ThreadPoolExecutor(max_workers=limits.workers, thread_name_prefix=f"winuse-{name}")
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._pending = 0
+        self._active = 0
+        self._created = clock()
+        self._saturated_since: Optional[float] = None
+        self._saturated_s = 0.0
+        self._waits: Deque[float] = deque(maxlen=history)
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "rejected": 0,
+            "deferred": 0,
+            "peak_pending": 0,
+        }
+
+    @property
+    def idle(self) -> threading.Event:
+        """Set while nothing is running or queued on this lane."""
+        return self._idle
+
+    def submit(self, fn: Callable[[], Any]) -> Future:
+        with self._lock:
+            if self._pending >= self.limits.max_pending:
+                self._stats["rejected"] += 1
+                raise LaneSaturated(f"The {self.name} lane is saturated ({self._pending} requests in progress)")
+            self._pending += 1
+            self._idle.clear()
+            self._stats["submitted"] += 1
+            self._stats["peak_pending"] = max(self._stats["peak_pending"], self._pending)
+        try:
+            future = self._pool.submit(self._call, fn, self._clock())
+        except RuntimeError:
+            self._finish("failed")
+            raise
+        # A request whose client went away is cancelled before it starts.
+        future.add_done_callback(lambda f: self._finish("cancelled") if f.cancelled() else None)
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``fn`` on this lane from the event loop, in the caller's context."""
+        # Thread pools do not carry contextvars (e.g. the input session) over.
+        context = contextvars.copy_context()
+        return await asyncio.wrap_future(self.submit(functools.partial(context.run, fn, *args, **kwargs)))
+
+    def _call(self, fn: Callable[[], Any], queued_at: float) -> Any:
+        if self._defer_to is not None and not self._defer_to.idle.is_set():
+            with self._lock:
+                self._stats["deferred"] += 1
+            self._defer_to.idle.wait(self._max_defer_s)
+        now = self._clock()
+        with self._lock:
+            self._waits.append((now - queued_at) * 1000.0)
+            self._active += 1
+            if self._active == self.limits.workers:
+                self._saturated_since = now
+        try:
+            value = fn()
+        except BaseException:
+            self._finish("failed", ran=True)
+            raise
+        self._finish("completed", ran=True)
+        return value
+
+    def _finish(self, outcome: str, *, ran: bool = False) -> None:
+        with self._lock:
+            if ran:
+                if self._saturated_since is not None:
+                    self._saturated_s += self._clock() - self._saturated_since
+                    self._saturated_since = None
+                self._active -= 1
+            self._pending -= 1
+            self._stats[outcome] += 1
+            if self._pending == 0:
+                self._idle.set()
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            now = self._clock()
+            saturated = self._saturated_s + (now - self._saturated_since if self._saturated_since is not None else 0.0)
+            waits = tuple(self._waits)
+            return {
+                **self._stats,
+                "workers": self.limits.workers,
+                "max_pending": self.limits.max_pending,
+                "active": self._active,
+                "queued": self._pending - self._active,
+                "saturated_ms": round(saturated * 1000.0, 1),
+                "saturated_pct": round(100.0 * saturated / max(now - self._created, 1e-9), 2),
+                "wait_ms_p50": percentile(waits, 0.5),
+                "wait_ms_p95": percentile(waits, 0.95),
+            }
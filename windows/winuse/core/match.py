@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from winuse.core.capture import Frame
+from winuse.core.delta import frame_array
+
+# ITU-R 601-2 luma, the same weights Pillow uses for mode "L".
+_LUMA_BGR = np.array([0.114, 0.587, 0.299], dtype=np.float32)
+
+# Coarse levels are allowed to score a little below the threshold, since
+# downsampling blurs fine detail that the full-resolution check restores.
+_COARSE_SLACK = 0.15
+_MIN_COARSE_SIDE = 8
+_REFINE_RADIUS = 2
+_MAX_LEVELS = 5
+
+
+def _downsample(img: np.ndarray) -> np.ndarray:
+    h, w = img.shape[0] // 2 * 2, img.shape[1] // 2 * 2
+    view = img[:h, :w]
+    return (view[0::2, 0::2] + view[1::2, 0::2] + view[0::2, 1::2] + view[1::2, 1::2]) * 0.25
+
+
+def _pyramid(img: np.ndarray, levels: int) -> List[np.ndarray]:
+    out = [img]
+    for _ in range(levels - 1):
+        out.append(_downsample(out[-1]))
+    return out
+
+
+@dataclass(frozen=True)
+class Template:
+    template_id: str
+    gray: np.ndarray
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.gray.shape[1], self.gray.shape[0]
+
+
+def decode_template(data: bytes) -> Template:
+    img = Image.open(io.BytesIO(data)).convert("L")
+    gray = np.asarray(img, dtype=np.float32)
+    if float(gray.std()) < 1e-3:
+        raise ValueError("Template is a flat color; use /pixels instead")
+    return Template(hashlib.sha1(data).hexdigest()[:16], gray)
+
+
+def frame_gray(frame: Frame) -> np.ndarray:
+    return frame_array(frame)[:, :, :3] @ _LUMA_BGR
+
+
+def _fast_len(n: int) -> int:
+    """Smallest 5-smooth integer >= n; FFTs of such sizes are much faster."""
+    best = 1 << max(0, (n - 1).bit_length())
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            m = p35
+            while m < n:
+                m *= 2
+            best = min(best, m)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def _window_sums(img: np.ndarray, h: int, w: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-window sum and sum of squares for every ``h``x``w`` window (valid positions)."""
+    sat = np.zeros((img.shape[0] + 1, img.shape[1] + 1), dtype=np.float64)
+    sat2 = np.zeros_like(sat)
+    np.cumsum(np.cumsum(img, axis=0, dtype=np.float64), axis=1, out=sat[1:, 1:])
+    np.cumsum(np.cumsum(np.square(img, dtype=np.float64), axis=0), axis=1, out=sat2[1:, 1:])
+
+    def box(s: np.ndarray) -> np.ndarray:
+        return s[h:, w:] - s[:-h, w:] - s[h:, :-w] + s[:-h, :-w]
+
+    return box(sat), box(sat2)
+
+
+def ncc_map(img: np.ndarray, tpl: np.ndarray) -> np.ndarray:
+    """Normalized cross-correlation of ``tpl`` at every valid offset in ``img``.
+
+    The numerator is computed with a real FFT and the per-window variance
+    with summed-area tables, so the cost does not depend on template size.
+    """
+    h, w = tpl.shape
+    H, W = img.shape
+    if h > H or w > W:
+        return np.empty((0, 0), dtype=np.float32)
+    # float64 throughout: numpy's FFT keeps float32 inputs in single
+    # precision, which is not enough to cancel a bright flat background.
+    img = img.astype(np.float64, copy=False)
+    t = tpl.astype(np.float64) - float(tpl.mean())
+    t_norm = float(np.sqrt(np.square(t).sum()))
+    shape = (_fast_len(H + h - 1), _fast_len(W + w - 1))
+    # Subtracting the image mean does not change the result (t sums to 0)
+    # but keeps the FFT's rounding error small relative to the signal.
+    corr = np.fft.irfft2(np.fft.rfft2(img - img.mean(), shape) * np.fft.rfft2(t[::-1, ::-1], shape), shape)
+    num = corr[h - 1 : H, w - 1 : W]
+    sums, sums2 = _window_sums(img, h, w)
+    var = np.maximum(sums2 - sums * sums / (h * w), 0.0)
+    denom = np.sqrt(var) * t_norm
+    out = np.zeros(num.shape, dtype=np.float32)
+    # Near-flat windows cannot match a textured template; skip them instead
+    # of dividing rounding noise by ~0.
+    np.divide(num, denom, out=out, where=var > 1e-2 * h * w)
+    return np.clip(out, -1.0, 1.0, out=out)
+
+
+def _peaks(scores: np.ndarray, threshold: float, limit: int, h: int, w: int) -> List[Tuple[int, int]]:
+    """Best offsets above ``threshold``, suppressing overlapping neighbours."""
+    scores = scores.copy()
+    found: List[Tuple[int, int]] = []
+    while len(found) < limit and scores.size:
+        idx = int(np.argmax(scores))
+        y, x = divmod(idx, scores.shape[1])
+        if scores[y, x] < threshold:
+            break
+        found.append((x, y))
+        scores[max(0, y - h // 2) : y + h // 2 + 1, max(0, x - w // 2) : x + w // 2 + 1] = -1.0
+    return found
+
+
+def _ncc(a: np.ndarray, b: np.ndarray) -> float:
+    a = a - a.mean()
+    b = b - b.mean()
+    denom = float(np.sqrt(np.square(a).sum() * np.square(b).sum()))
+    return float((a * b).sum()) / denom if denom > 1e-9 else 0.0
+
+
+def _usable_levels(tpl: np.ndarray, coarse_threshold: float) -> int:
+    """Deepest pyramid that still finds ``tpl`` when it is off the pixel grid.
+
+    A match at an arbitrary screen offset is misaligned with the coarse
+    grid by up to half a coarse pixel. Fine, noisy templates (small text)
+    decorrelate under that shift and need a shallow pyramid; smooth icons
+    can go deep.
+    """
+    levels = 1
+    while min(tpl.shape) >> levels >= _MIN_COARSE_SIDE and levels < _MAX_LEVELS:
+        shift = 1 << (levels - 1)
+        aligned = _pyramid(tpl[:-shift, :-shift], levels + 1)[-1]
+        shifted = _pyramid(tpl[shift:, shift:], levels + 1)[-1]
+        if _ncc(aligned, shifted) < coarse_threshold:
+            break
+        levels += 1
+    return levels
+
+
+def _refine(img: np.ndarray, tpl: np.ndarray, x: int, y: int, radius: int) -> Tuple[int, int, float]:
+    h, w = tpl.shape
+    x0, y0 = max(0, x - radius), max(0, y - radius)
+    x1 = min(img.shape[1] - w, x + radius)
+    y1 = min(img.shape[0] - h, y + radius)
+    if x1 < x0 or y1 < y0:
+        return x, y, -1.0
+    scores = ncc_map(img[y0 : y1 + h, x0 : x1 + w], tpl)
+    dy, dx = np.unravel_index(int(np.argmax(scores)), scores.shape)
+    return x0 + int(dx), y0 + int(dy), float(scores[dy, dx])
+
+
+def find_template(
+    frame: Frame,
+    template: Template,
+    *,
+    threshold: float = 0.9,
+    max_results: int = 5,
+    levels: Optional[int] = None,
+) -> List[Dict[str, object]]:
+    """Locate ``template`` in ``frame``; returns screen rects with NCC scores, best first.
+
+    Matching runs coarse-to-fine: a full search on the coarsest pyramid level
+    where the template is still recognisable, then each candidate is refined
+    within a couple of pixels on every finer level.
+    """
+    image = frame_gray(frame)
+    th, tw = template.gray.shape
+    if th > image.shape[0] or tw > image.shape[1]:
+        return []
+    coarse_threshold = threshold - _COARSE_SLACK
+    if levels is None:
+        levels = _usable_levels(template.gray, coarse_threshold)
+    images = _pyramid(image, levels)
+    templates = _pyramid(template.gray, levels)
+    if levels == 1:
+        coarse_threshold = threshold
+    top = levels - 1
+    ch, cw = templates[top].shape
+    candidates = _peaks(ncc_map(images[top], templates[top]), coarse_threshold, max_results * 4, ch, cw)
+
+    matches: List[Tuple[int, int, float]] = []
+    for x, y in candidates:
+        score = -1.0
+        for level in range(top - 1, -1, -1):
+            x, y, score = _refine(images[level], templates[level], x * 2, y * 2, _REFINE_RADIUS)
+        if top == 0:
+            x, y, score = _refine(images[0], templates[0], x, y, 0)
+        if score >= threshold:
+            matches.append((x, y, score))
+
+    matches.sort(key=lambda m: -m[2])
+    kept: List[Tuple[int, int, float]] = []
+    for x, y, score in matches:
+        # Distinct candidates can converge on the same spot while refining.
+        if any(abs(x - kx) < tw and abs(y - ky) < th for kx, ky, _ in kept):
+            continue
+        kept.append((x, y, score))
+        if len(kept) >= max_results:
+            break
+    return [
+        {
+            "x": frame.left + x,
+            "y": frame.top + y,
+            "width": tw,
+            "height": th,
+            "center_x": frame.left + x + tw // 2,
+            "center_y": frame.top + y + th // 2,
+            "score": round(score, 4),
+        }
+        for x, y, score in kept
+    ]
+
+
+class TemplateCache:
+    """LRU cache of decoded templates keyed by a content hash."""
+
+    def __init__(self, capacity: int = 32) -> None:
+        self._capacity = max(1, capacity)
+        self._items: "OrderedDict[str, Template]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def add(self, data: bytes) -> Template:
+        template = decode_template(data)
+        with self._lock:
+            self._items[template.template_id] = template
+            self._items.move_to_end(template.template_id)
+            while len(self._items) > self._capacity:
+                self._items.popitem(last=False)
+                self._evictions += 1
+        return template
+
+    def get(self, template_id: str) -> Template:
+        with self._lock:
+            template = self._items.get(template_id)
+            if template is None:
+                self._misses += 1
+                raise KeyError(f"Unknown or evicted template_id {template_id}")
+            self._items.move_to_end(template_id)
+            self._hits += 1
+            return template
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "templates": len(self._items),
+                "capacity": self._capacity,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
@@ -1,14 +1,96 @@
 from __future__ import annotations
 
+import time
+from typing import Dict, Optional, Sequence
+
 import pyautogui
 
+from winuse.core import sendinput
+from winuse.core.gesture import GesturePlayer, Sample, split_amount
+
 
 def move(x: int, y: int, duration: float = 0.0) -> None:
     pyautogui.moveTo(x, y, duration=duration)
 
 
-def click(x: int | None = None, y: int | None = None, button: str = "left", clicks: int = 1) -> None:
+def click(
+    x: int | None = None,
+    y: int | None = None,
+    button: str = "left",
+    clicks: int = 1,
+    interval: float = 0.0,
+) -> None:
     if x is not None and y is not None:
-        pyautogui.click(x=x, y=y, button=button, clicks=clicks)
+        pyautogui.click(x=x, y=y, button=button, clicks=clicks, interval=interval)
     else:
-        pyautogui.click(button=button, clicks=clicks)
+        pyautogui.click(button=button, clicks=clicks, interval=interval)
+
+
+def position() -> tuple[int, int]:
+    x, y = pyautogui.position()
+    return int(x), int(y)
+
+
+def _jump(x: int, y: int) -> None:
+    # The player does its own pacing; skip pyautogui.PAUSE between points.
+    pyautogui.moveTo(x, y, _pause=False)
+
+
+def glide(samples: Sequence[Sample], player: Optional[GesturePlayer] = None) -> Dict[str, object]:
+    """Move the cursor through ``samples`` (see ``gesture.plan_path``)."""
+    return (player or GesturePlayer()).play(samples, _jump)
+
+
+def drag(
+    samples: Sequence[Sample],
+    button: str = "left",
+    hold: float = 0.0,
+    player: Optional[GesturePlayer] = None,
+) -> Dict[str, object]:
+    """Press at the first sample, glide through the rest, release at the last.
+
+    ``hold`` pauses after the press and before the release; many drag
+    targets ignore a press that moves immediately. The button is released
+    even if a move fails (e.g. the pyautogui failsafe corner).
+    """
+    first = samples[0]
+    _jump(first.x, first.y)
+    pyautogui.mouseDown(button=button, _pause=False)
+    try:
+        if hold:
+            time.sleep(hold)
+        stats = (player or GesturePlayer()).play(samples[1:], _jump)
+        if hold:
+            time.sleep(hold)
+    finally:
+        pyautogui.mouseUp(button=button, _pause=False)
+    stats["points"] = len(samples)
+    stats["sent"] = int(stats["sent"]) + 1
+    return stats
+
+
+def scroll(
+    vertical: int,
+    horizontal: int = 0,
+    *,
+    x: int | None = None,
+    y: int | None = None,
+    steps: int = 1,
+    duration: float = 0.0,
+    player: Optional[GesturePlayer] = None,
+) -> Dict[str, object]:
+    """Scroll by wheel units (120 per notch; positive is up/right), optionally at ``x``, ``y``.
+
+    The amount is split into ``steps`` wheel events spread over ``duration``
+    for targets that animate or lazy-load per event.
+    """
+    if x is not None and y is not None:
+        _jump(x, y)
+    pairs = list(zip(split_amount(vertical, steps), split_amount(horizontal, steps)))
+
+    def send(pair: tuple[int, int]) -> None:
+        pyautogui.failSafeCheck()
+        sendinput.send_wheel(pair[0])
+        sendinput.send_wheel(pair[1], horizontal=True)
+
+    return (player or GesturePlayer()).spread(pairs, duration, send)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+
+from winuse.core.capture import Frame, Region, clip_region
+from winuse.core.delta import frame_array
+
+Point = Dict[str, int]
+Rect = Dict[str, int]
+
+
+def bounding_region(
+    points: Sequence[Point], rects: Sequence[Rect] = (), bounds: Optional[Region] = None
+) -> Region:
+    """Smallest screen region covering every point and rect, clipped to ``bounds``."""
+    xs = [p["x"] for p in points] + [r["x"] for r in rects]
+    ys = [p["y"] for p in points] + [r["y"] for r in rects]
+    xe = [p["x"] + 1 for p in points] + [r["x"] + r["width"] for r in rects]
+    ye = [p["y"] + 1 for p in points] + [r["y"] + r["height"] for r in rects]
+    if not xs:
+        raise ValueError("No points or rects to sample")
+    left, top = min(xs), min(ys)
+    region = {"left": left, "top": top, "width": max(xe) - left, "height": max(ye) - top}
+    if bounds is None:
+        return region
+    clipped = clip_region(region, bounds)
+    if clipped is None:
+        raise ValueError("Requested pixels are outside the screen")
+    return clipped
+
+
+def _color(bgr: Sequence[float]) -> Dict[str, object]:
+    b, g, r = (int(round(float(c))) for c in bgr)
+    return {"r": r, "g": g, "b": b, "hex": f"#{r:02x}{g:02x}{b:02x}"}
+
+
+def sample(frame: Frame, points: Sequence[Point], rects: Sequence[Rect] = ()) -> Dict[str, List[Dict[str, object]]]:
+    """Read point colors and rect mean colors (screen coordinates) from ``frame``."""
+    px = frame_array(frame)
+    out_points = []
+    for p in points:
+        x, y = p["x"] - frame.left, p["y"] - frame.top
+        if not (0 <= x < frame.width and 0 <= y < frame.height):
+            raise ValueError(f"Point ({p['x']}, {p['y']}) is outside the captured region")
+        out_points.append({"x": p["x"], "y": p["y"], **_color(px[y, x, :3])})
+    out_rects = []
+    for r in rects:
+        x, y = r["x"] - frame.left, r["y"] - frame.top
+        block = px[max(0, y) : y + r["height"], max(0, x) : x + r["width"], :3]
+        if block.size == 0:
+            raise ValueError(f"Rect at ({r['x']}, {r['y']}) is outside the captured region")
+        out_rects.append({**r, **_color(block.mean(axis=(0, 1)))})
+    return {"points": out_points, "rects": out_rects}
+
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+try:
+    import psutil
+except Exception:  # pragma: no cover - optional dependency at runtime
+    psutil = None
+
+
+@dataclass
+class ProcessInfo:
+    pid: int
+    create_time: Optional[float]
+    name: Optional[str]
+    exe: Optional[str] = None
+    ppid: Optional[int] = None
+    details: bool = False
+    checked: float = 0.0
+
+
+class ProcessCache:
+    """Bounded pid -> process info cache that survives PID reuse.
+
+    Entries are keyed by ``(pid, create_time)``: after ``revalidate_s`` an
+    entry is only trusted again if the pid still has the same creation
+    time, so a recycled pid gets a fresh lookup instead of a stale name.
+    Entries for exited processes are dropped when a revalidation fails and
+    by a sweep over the live pid set every ``prune_s``.
+
+    ``exe`` and ``ppid`` cost extra system calls and are fetched only when
+    asked for, then cached with the entry.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        *,
+        revalidate_s: float = 5.0,
+        prune_s: float = 60.0,
+        backend=None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._capacity = max(1, capacity)
+        self._revalidate_s = revalidate_s
+        self._prune_s = prune_s
+        self._psutil = backend if backend is not None else psutil
+        self._clock = clock
+        self._items: "OrderedDict[int, ProcessInfo]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_prune = clock()
+        self._stats = {"hits": 0, "misses": 0, "revalidations": 0, "reused_pids": 0, "evictions": 0}
+
+    def _create_time(self, proc) -> Optional[float]:
+        try:
+            return proc.create_time()
+        except self._psutil.AccessDenied:
+            return None
+
+    def lookup(self, pid: int, details: bool = False) -> Optional[ProcessInfo]:
+        if self._psutil is None or pid <= 0:
+            return None
+        now = self._clock()
+        self._maybe_prune(now)
+        with self._lock:
+            entry = self._items.get(pid)
+            if entry is not None:
+                self._items.move_to_end(pid)
+                if now - entry.checked < self._revalidate_s and (entry.details or not details):
+                    self._stats["hits"] += 1
+                    return entry
+        try:
+            proc = self._psutil.Process(pid)
+            create_time = self._create_time(proc)
+            if entry is not None and entry.create_time == create_time and (entry.details or not details):
+                with self._lock:
+                    entry.checked = now
+                    self._stats["revalidations"] += 1
+                return entry
+            if entry is not None and entry.create_time != create_time:
+                with self._lock:
+                    self._stats["reused_pids"] += 1
+            fresh = ProcessInfo(pid, create_time, self._safe(proc.name), checked=now)
+            if details:
+                fresh.exe = self._safe(proc.exe)
+                fresh.ppid = self._safe(proc.ppid)
+                fresh.details = True
+        except self._psutil.NoSuchProcess:
+            self._drop(pid)
+            return None
+        except Exception:
+            return None
+        with self._lock:
+            self._stats["misses"] += 1
+            self._items[pid] = fresh
+            self._items.move_to_end(pid)
+            while len(self._items) > self._capacity:
+                self._items.popitem(last=False)
+                self._stats["evictions"] += 1
+        return fresh
+
+    def name(self, pid: int) -> Optional[str]:
+        info = self.lookup(pid)
+        return info.name if info else None
+
+    def details(self, pid: int) -> Dict[str, object]:
+        info = self.lookup(pid, details=True)
+        if info is None:
+            return {"exe": None, "ppid": None}
+        return {"exe": info.exe, "ppid": info.ppid}
+
+    @staticmethod
+    def _safe(getter):
+        try:
+            return getter()
+        except Exception:
+            return None
+
+    def _drop(self, pid: int) -> None:
+        with self._lock:
+            if self._items.pop(pid, None) is not None:
+                self._stats["evictions"] += 1
+
+    def _maybe_prune(self, now: float) -> None:
+        if now - self._last_prune < self._prune_s:
+            return
+        self._last_prune = now
+        try:
+            alive = set(self._psutil.pids())
+        except Exception:
+            return
+        with self._lock:
+            dead = [pid for pid in self._items if pid not in alive]
+            for pid in dead:
+                del self._items[pid]
+            self._stats["evictions"] += len(dead)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._items), "capacity": self._capacity}
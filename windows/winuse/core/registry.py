@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Protocol
+
+WindowInfo = Dict[str, object]
+EventCallback = Callable[[str, int], None]
+
+# Event kinds a backend reports. "destroy" and "hide" drop the window,
+# "foreground" moves it to the front, everything else re-describes it.
+EVENTS = ("create", "destroy", "show", "hide", "name", "location", "foreground", "minimize", "restore")
+
+
+# Fields a client may request with ``fields=``; hwnd is always included.
+FIELDS = ("hwnd", "title", "pid", "process", "rect", "exe", "ppid")
+
+
+def window_filter(
+    *,
+    title: Optional[str] = None,
+    title_regex: Optional[str] = None,
+    process: Optional[str] = None,
+    pid: Optional[int] = None,
+) -> Optional[Callable[[WindowInfo], bool]]:
+    """Build a predicate from query options (None if nothing to filter).
+
+    ``title`` and ``process`` are case-insensitive substrings and
+    ``title_regex`` is a case-insensitive search; all given options must
+    match. Raises ``re.error`` for an invalid pattern.
+    """
+    checks: List[Callable[[WindowInfo], bool]] = []
+    if title:
+        needle = title.casefold()
+        checks.append(lambda w: needle in str(w.get("title") or "").casefold())
+    if title_regex:
+        pattern = re.compile(title_regex, re.IGNORECASE)
+        checks.append(lambda w: pattern.search(str(w.get("title") or "")) is not None)
+    if process:
+        proc = process.casefold()
+        checks.append(lambda w: proc in str(w.get("process") or "").casefold())
+    if pid is not None:
+        checks.append(lambda w: w.get("pid") == pid)
+    if not checks:
+        return None
+    return lambda w: all(check(w) for check in checks)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse ``fields=title,rect`` into a validated list (None = all fields)."""
+    if not fields:
+        return None
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in names if f not in FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)} (valid: {', '.join(FIELDS)})")
+    return ["hwnd"] + [f for f in names if f != "hwnd"]
+
+
+def project(info: WindowInfo, fields: Optional[Iterable[str]]) -> WindowInfo:
+    if fields is None:
+        return info
+    return {f: info.get(f) for f in fields}
+
+
+class WindowBackend(Protocol):
+    def snapshot(self) -> List[WindowInfo]:
+        """Every listable top-level window, front to back."""
+
+    def describe(self, hwnd: int) -> Optional[WindowInfo]:
+        """One window's info, or None if it is gone or not listable."""
+
+    def start_events(self, callback: EventCallback) -> bool:
+        """Start delivering ``callback(kind, hwnd)``; False if unsupported."""
+
+    def stop_events(self) -> None: ...
+
+
+class WindowRegistry:
+    """In-memory window list kept current by backend events.
+
+    Events only mark windows dirty (hook callbacks must return quickly);
+    dirty windows are re-described on the next read. Without events, or if
+    the hook fails to start, the list is re-enumerated when older than
+    ``ttl_s``. With events, a full resync still runs every ``resync_s`` to
+    recover from anything the hooks missed.
+
+    Order follows the backend snapshot (z-order); windows created or brought
+    to the foreground since then move to the front.
+    """
+
+    def __init__(
+        self,
+        backend: WindowBackend,
+        *,
+        ttl_s: float = 1.0,
+        resync_s: float = 30.0,
+        use_events: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._backend = backend
+        self._ttl_s = ttl_s
+        self._resync_s = resync_s
+        self._use_events = use_events
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._windows: "OrderedDict[int, WindowInfo]" = OrderedDict()
+        self._dirty: "OrderedDict[int, bool]" = OrderedDict()  # hwnd -> move to front
+        self._removed: set[int] = set()
+        self._loaded_at: float | None = None
+        self._hooked = False
+        self._listeners: List[EventCallback] = []
+        self._stats = {"refreshes": 0, "events": 0, "updates": 0, "hits": 0}
+
+    @property
+    def hooked(self) -> bool:
+        return self._hooked
+
+    def start(self) -> None:
+        if self._use_events and not self._hooked:
+            try:
+                self._hooked = bool(self._backend.start_events(self._on_event))
+            except Exception:
+                self._hooked = False
+
+    def stop(self) -> None:
+        if self._hooked:
+            self._hooked = False
+            self._backend.stop_events()
+
+    def add_listener(self, listener: EventCallback) -> None:
+        """Also forward raw backend events to ``listener`` (called on the hook thread)."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: EventCallback) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def _on_event(self, kind: str, hwnd: int) -> None:
+        with self._lock:
+            self._stats["events"] += 1
+            if kind in ("destroy", "hide"):
+                self._dirty.pop(hwnd, None)
+                self._removed.add(hwnd)
+            else:
+                self._removed.discard(hwnd)
+                front = kind in ("create", "show", "foreground") or self._dirty.get(hwnd, False)
+                self._dirty[hwnd] = front
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(kind, hwnd)
+
+    def _stale(self, now: float) -> bool:
+        if self._loaded_at is None:
+            return True
+        limit = self._resync_s if self._hooked else self._ttl_s
+        return now - self._loaded_at >= limit
+
+    def _refresh(self) -> None:
+        # Take the dirty marks first: events that arrive during the snapshot
+        # are re-applied afterwards instead of being lost.
+        with self._lock:
+            self._dirty.clear()
+            self._removed.clear()
+        snapshot = self._backend.snapshot()
+        with self._lock:
+            self._windows = OrderedDict((int(w["hwnd"]), w) for w in snapshot)
+            self._loaded_at = self._clock()
+            self._stats["refreshes"] += 1
+
+    def _apply_events(self) -> None:
+        with self._lock:
+            dirty, self._dirty = self._dirty, OrderedDict()
+            removed, self._removed = self._removed, set()
+            for hwnd in removed:
+                self._windows.pop(hwnd, None)
+        if not dirty and not removed:
+            with self._lock:
+                self._stats["hits"] += 1
+            return
+        described = {hwnd: self._backend.describe(hwnd) for hwnd in dirty}
+        with self._lock:
+            for hwnd, info in described.items():
+                if info is None:
+                    self._windows.pop(hwnd, None)
+                    continue
+                self._windows[hwnd] = info
+                if dirty[hwnd]:
+                    self._windows.move_to_end(hwnd, last=False)
+            self._stats["updates"] += len(described)
+
+    def _current(self) -> None:
+        if self._stale(self._clock()):
+            self._refresh()
+        self._apply_events()
+
+    def list(
+        self,
+        match: Optional[Callable[[WindowInfo], bool]] = None,
+        limit: Optional[int] = None,
+    ) -> List[WindowInfo]:
+        """Copies of the cached windows, optionally filtered and truncated.
+
+        Filtering happens under the lock on the cached entries, so only
+        matching windows are copied.
+        """
+        self._current()
+        out: List[WindowInfo] = []
+        with self._lock:
+            for w in self._windows.values():
+                if limit is not None and len(out) >= limit:
+                    break
+                if match is None or match(w):
+                    out.append(dict(w))
+        return out
+
+    def get(self, hwnd: int) -> Optional[WindowInfo]:
+        self._current()
+        with self._lock:
+            info = self._windows.get(hwnd)
+            return dict(info) if info is not None else None
+
+    def stats(self) -> Dict[str, object]:
+        now = self._clock()
+        with self._lock:
+            return {
+                **self._stats,
+                "hooked": self._hooked,
+                "windows": len(self._windows),
+                "age_ms": round((now - self._loaded_at) * 1000.0, 1) if self._loaded_at is not None else None,
+            }
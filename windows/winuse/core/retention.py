@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class RetentionManager:
+    """Keeps the capture directory within size, count and age limits.
+
+    A background thread sweeps ``directory`` every ``interval_s`` seconds (or
+    sooner after :meth:`poke`) and deletes the oldest ``capture_*`` files
+    until every configured limit holds. A limit of 0/None disables it.
+    Files not written by WinUse are never touched.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        max_bytes: Optional[int] = None,
+        max_files: Optional[int] = None,
+        max_age_s: Optional[float] = None,
+        interval_s: float = 60.0,
+        prefix: str = "capture_",
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes or None
+        self.max_files = max_files or None
+        self.max_age_s = max_age_s or None
+        self._interval_s = max(1.0, interval_s)
+        self._prefix = prefix
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, object] = {
+            "files": 0,
+            "bytes": 0,
+            "evicted_files": 0,
+            "evicted_bytes": 0,
+            "sweeps": 0,
+            "last_sweep_ms": None,
+            "errors": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return any((self.max_bytes, self.max_files, self.max_age_s))
+
+    def start(self) -> None:
+        if not self.enabled or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="winuse-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        self._thread = None
+
+    def poke(self) -> None:
+        """Request an early sweep, e.g. after writing a new capture."""
+        self._wake.set()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                **self._stats,
+                "max_bytes": self.max_bytes,
+                "max_files": self.max_files,
+                "max_age_s": self.max_age_s,
+            }
+
+    def sweep(self, now: float | None = None) -> List[str]:
+        """Evict files that break a limit, oldest first. Returns removed paths."""
+        started = time.perf_counter()
+        now = time.time() if now is None else now
+        entries = self._scan()
+        entries.sort(key=lambda e: e[1])  # oldest first
+        total_bytes = sum(size for _, _, size in entries)
+        count = len(entries)
+        removed: List[str] = []
+        evicted_bytes = 0
+        for path, mtime, size in entries:
+            too_old = self.max_age_s is not None and now - mtime > self.max_age_s
+            too_many = self.max_files is not None and count > self.max_files
+            too_big = self.max_bytes is not None and total_bytes > self.max_bytes
+            if not (too_old or too_many or too_big):
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Typically a file still open by a reader; retry next sweep.
+                with self._lock:
+                    self._stats["errors"] = int(self._stats["errors"]) + 1
+                continue
+            removed.append(path)
+            count -= 1
+            total_bytes -= size
+            evicted_bytes += size
+        with self._lock:
+            self._stats["files"] = count
+            self._stats["bytes"] = total_bytes
+            self._stats["evicted_files"] = int(self._stats["evicted_files"]) + len(removed)
+            self._stats["evicted_bytes"] = int(self._stats["evicted_bytes"]) + evicted_bytes
+            self._stats["sweeps"] = int(self._stats["sweeps"]) + 1
+            self._stats["last_sweep_ms"] = round((time.perf_counter() - started) * 1000.0, 2)
+        return removed
+
+    def _scan(self) -> List[Tuple[str, float, int]]:
+        entries: List[Tuple[str, float, int]] = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.startswith(self._prefix):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((entry.path, st.st_mtime, st.st_size))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                self.sweep()
+            except Exception:
+                with self._lock:
+                    self._stats["errors"] = int(self._stats["errors"]) + 1
+            self._wake.wait(self._interval_s)
+            self._wake.clear()
+            # Coalesce bursts of pokes (e.g. a polling client) into one sweep.
+            self._stopping.wait(1.0)
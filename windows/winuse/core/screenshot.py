@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import base64
 import os
+import time
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 import mss
 from PIL import Image
 
+from winuse.core.capture import CaptureEngine, Frame, Region, clip_region
+from winuse.core.coords import scaled_size
+from winuse.core.encode import Encoded, Encoder, EncoderProfile
+from winuse.core.match import Template, find_template
+from winuse.core.pixels import Point, Rect, bounding_region, sample
 from winuse.core.windows import get_window_rect
 
 
@@ -19,34 +26,217 @@ def _ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def _save_mss_image(grab, output_path: str) -> None:
-    img = Image.frombytes("RGB", grab.size, grab.rgb)
-    img.save(output_path)
+def _save_mss_image(grab, output_path: str, profile: EncoderProfile) -> None:
+    img = Image.frombytes("RGB", grab.size, grab.raw, "raw", "BGRX")
+    img.save(output_path, **profile.save_options())
 
 
-def capture_full(output_dir: str, fmt: str = "png") -> Dict[str, str]:
-    _ensure_dir(output_dir)
-    filename = _timestamp_name(fmt)
-    output_path = os.path.join(output_dir, filename)
-    with mss.mss() as sct:
-        monitor = sct.monitors[0]
-        grab = sct.grab(monitor)
-        _save_mss_image(grab, output_path)
-    return {"path": output_path, "filename": filename}
+def frame_info(frame: Frame, size: Optional[Tuple[int, int]] = None) -> Dict[str, object]:
+    image_width, image_height = size or frame.size
+    return {
+        "frame_id": frame.frame_id,
+        "age_ms": round(frame.age_ms(), 1),
+        "left": frame.left,
+        "top": frame.top,
+        "width": frame.width,
+        "height": frame.height,
+        "image_width": image_width,
+        "image_height": image_height,
+        "scale": round(image_width / frame.width, 6),
+    }
 
 
-def capture_window(output_dir: str, hwnd: int, fmt: str = "png") -> Dict[str, str]:
-    _ensure_dir(output_dir)
+def encode_info(encoded: Encoded) -> Dict[str, object]:
+    return {"format": encoded.profile.format, "encode_ms": round(encoded.encode_ms, 2), "bytes": len(encoded.data)}
+
+
+def window_region(hwnd: int) -> Region:
     rect = get_window_rect(hwnd)
-    filename = _timestamp_name(fmt)
+    return {
+        "left": rect["x"],
+        "top": rect["y"],
+        "width": rect["width"],
+        "height": rect["height"],
+    }
+
+
+def monitor_list(engine: CaptureEngine) -> List[Dict[str, int]]:
+    return [
+        {"index": i, "x": m["left"], "y": m["top"], "width": m["width"], "height": m["height"]}
+        for i, m in enumerate(engine.monitors())
+    ]
+
+
+def resolve_region(
+    engine: CaptureEngine,
+    *,
+    hwnd: Optional[int] = None,
+    monitor: Optional[int] = None,
+    rect: Optional[Dict[str, int]] = None,
+) -> Optional[Region]:
+    """Turn request targeting options into a capture region (None = whole virtual screen).
+
+    ``rect`` uses ``x``/``y``/``width``/``height``; it is relative to ``monitor``
+    when one is given and absolute virtual-screen coordinates otherwise. The
+    result is clipped to the monitor (or virtual screen) bounds.
+    """
+    if hwnd is not None:
+        return window_region(hwnd)
+    if monitor is None and rect is None:
+        return None
+    monitors = engine.monitors()
+    index = monitor or 0
+    if not 0 <= index < len(monitors):
+        raise ValueError(f"Unknown monitor {index} (have 0..{len(monitors) - 1})")
+    bounds = monitors[index]
+    if rect is None:
+        return bounds if index else None
+    region = {
+        "left": bounds["left"] + rect["x"] if index else rect["x"],
+        "top": bounds["top"] + rect["y"] if index else rect["y"],
+        "width": rect["width"],
+        "height": rect["height"],
+    }
+    clipped = clip_region(region, bounds)
+    if clipped is None:
+        raise ValueError("Region does not overlap the screen")
+    return clipped
+
+
+def _capture(
+    output_dir: str,
+    region: Optional[Region],
+    profile: Optional[EncoderProfile],
+    engine: Optional[CaptureEngine],
+    encoder: Optional[Encoder],
+    max_age_ms: Optional[float],
+    scale: Optional[float] = None,
+    max_width: Optional[int] = None,
+) -> Dict[str, object]:
+    _ensure_dir(output_dir)
+    profile = profile or (encoder.profile if encoder else EncoderProfile())
+    filename = _timestamp_name(profile.extension)
     output_path = os.path.join(output_dir, filename)
-    with mss.mss() as sct:
-        monitor = {
-            "left": rect["x"],
-            "top": rect["y"],
-            "width": rect["width"],
-            "height": rect["height"],
-        }
-        grab = sct.grab(monitor)
-        _save_mss_image(grab, output_path)
-    return {"path": output_path, "filename": filename}
+    if engine is None or encoder is None:
+        with mss.mss() as sct:
+            grab = sct.grab(region if region is not None else sct.monitors[0])
+            _save_mss_image(grab, output_path, profile)
+        return {"path": output_path, "filename": filename}
+
+    frame = engine.grab(region, max_age_ms=max_age_ms)
+    size = scaled_size(frame.width, frame.height, scale=scale, max_width=max_width)
+    encoded = encoder.save(frame, output_path, profile, size)
+    return {"path": output_path, "filename": filename, **frame_info(frame, size), **encode_info(encoded)}
+
+
+def capture_region(
+    output_dir: str,
+    region: Optional[Region],
+    profile: Optional[EncoderProfile] = None,
+    *,
+    engine: Optional[CaptureEngine] = None,
+    encoder: Optional[Encoder] = None,
+    max_age_ms: Optional[float] = None,
+    scale: Optional[float] = None,
+    max_width: Optional[int] = None,
+) -> Dict[str, object]:
+    return _capture(output_dir, region, profile, engine, encoder, max_age_ms, scale, max_width)
+
+
+def capture_full(
+    output_dir: str,
+    profile: Optional[EncoderProfile] = None,
+    *,
+    engine: Optional[CaptureEngine] = None,
+    encoder: Optional[Encoder] = None,
+    max_age_ms: Optional[float] = None,
+    scale: Optional[float] = None,
+    max_width: Optional[int] = None,
+) -> Dict[str, object]:
+    return _capture(output_dir, None, profile, engine, encoder, max_age_ms, scale, max_width)
+
+
+def capture_window(
+    output_dir: str,
+    hwnd: int,
+    profile: Optional[EncoderProfile] = None,
+    *,
+    engine: Optional[CaptureEngine] = None,
+    encoder: Optional[Encoder] = None,
+    max_age_ms: Optional[float] = None,
+    scale: Optional[float] = None,
+    max_width: Optional[int] = None,
+) -> Dict[str, object]:
+    return _capture(output_dir, window_region(hwnd), profile, engine, encoder, max_age_ms, scale, max_width)
+
+
+def capture_bytes(
+    engine: CaptureEngine,
+    encoder: Encoder,
+    region: Optional[Region] = None,
+    profile: Optional[EncoderProfile] = None,
+    *,
+    max_age_ms: Optional[float] = None,
+    scale: Optional[float] = None,
+    max_width: Optional[int] = None,
+) -> Tuple[Encoded, Dict[str, object]]:
+    """Grab and encode in memory, without writing anything to ``output_dir``."""
+    frame = engine.grab(region, max_age_ms=max_age_ms)
+    size = scaled_size(frame.width, frame.height, scale=scale, max_width=max_width)
+    encoded = encoder.encode(frame, profile, size)
+    return encoded, {**frame_info(frame, size), **encode_info(encoded)}
+
+
+def encode_tiles(
+    encoder: Encoder,
+    frame: Frame,
+    rects: List[Dict[str, int]],
+    profile: Optional[EncoderProfile] = None,
+) -> List[Dict[str, object]]:
+    """Encode each rect of ``frame`` separately, returning base64 image data per rect."""
+    encoded = encoder.encode_rects(frame, rects, profile)
+    return [
+        {**rect, "data": base64.b64encode(enc.data).decode("ascii")}
+        for rect, enc in zip(rects, encoded)
+    ]
+
+
+def sample_pixels(
+    engine: CaptureEngine,
+    points: List[Point],
+    rects: Optional[List[Rect]] = None,
+    *,
+    max_age_ms: Optional[float] = None,
+) -> Dict[str, object]:
+    """Sample screen colors from one grab of just the requested points' bounding box."""
+    rects = rects or []
+    region = bounding_region(points, rects, engine.monitors()[0])
+    frame = engine.grab(region, max_age_ms=max_age_ms)
+    return {
+        "frame_id": frame.frame_id,
+        "age_ms": round(frame.age_ms(), 1),
+        "region": {"x": frame.left, "y": frame.top, "width": frame.width, "height": frame.height},
+        **sample(frame, points, rects),
+    }
+
+
+def find_on_screen(
+    engine: CaptureEngine,
+    template: Template,
+    region: Optional[Region] = None,
+    *,
+    threshold: float = 0.9,
+    max_results: int = 5,
+    max_age_ms: Optional[float] = None,
+) -> Dict[str, object]:
+    """Search one grab of ``region`` for ``template``; match rects are in screen coordinates."""
+    frame = engine.grab(region, max_age_ms=max_age_ms)
+    started = time.perf_counter()
+    matches = find_template(frame, template, threshold=threshold, max_results=max_results)
+    return {
+        "template_id": template.template_id,
+        "frame_id": frame.frame_id,
+        "age_ms": round(frame.age_ms(), 1),
+        "search_ms": round((time.perf_counter() - started) * 1000.0, 2),
+        "matches": matches,
+    }
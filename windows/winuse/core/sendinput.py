@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import ctypes
+import time
+from ctypes import wintypes
+from typing import Callable, Dict, Iterator, List, NamedTuple, Sequence
+
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+MOUSEEVENTF_WHEEL = 0x0800
+MOUSEEVENTF_HWHEEL = 0x1000
+WHEEL_DELTA = 120
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+VK_TAB = 0x09
+VK_RETURN = 0x0D
+
+# Control characters that apps expect as real keys; a KEYEVENTF_UNICODE
+# "\n" is ignored by most edit controls.
+_VIRTUAL_KEYS = {"\n": VK_RETURN, "\t": VK_TAB}
+
+
+class KeyInput(NamedTuple):
+    vk: int
+    scan: int
+    flags: int
+
+
+def char_events(ch: str) -> List[KeyInput]:
+    """Key down/up events that type one character (two pairs for astral characters)."""
+    vk = _VIRTUAL_KEYS.get(ch)
+    if vk is not None:
+        return [KeyInput(vk, 0, 0), KeyInput(vk, 0, KEYEVENTF_KEYUP)]
+    data = ch.encode("utf-16-le")
+    units = [int.from_bytes(data[i : i + 2], "little") for i in range(0, len(data), 2)]
+    # Each UTF-16 code unit is its own down/up pair; Windows reassembles
+    # surrogate pairs into one WM_CHAR sequence.
+    out: List[KeyInput] = []
+    for unit in units:
+        out.append(KeyInput(0, unit, KEYEVENTF_UNICODE))
+        out.append(KeyInput(0, unit, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+    return out
+
+
+def normalize_newlines(text: str) -> str:
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def batches(text: str, max_events: int) -> Iterator[List[KeyInput]]:
+    """Events for ``text`` in lists of at most ``max_events``, split only between characters."""
+    batch: List[KeyInput] = []
+    for ch in normalize_newlines(text):
+        events = char_events(ch)
+        if batch and len(batch) + len(events) > max_events:
+            yield batch
+            batch = []
+        batch.extend(events)
+    if batch:
+        yield batch
+
+
+class _MouseInput(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _KeybdInput(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _InputUnion(ctypes.Union):
+    # MOUSEINPUT is the largest member and fixes sizeof(INPUT).
+    _fields_ = [("mi", _MouseInput), ("ki", _KeybdInput)]
+
+
+class _Input(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", wintypes.DWORD), ("u", _InputUnion)]
+
+
+def to_input_array(events: Sequence[KeyInput]) -> ctypes.Array:
+    array = (_Input * len(events))()
+    for item, event in zip(array, events):
+        item.type = INPUT_KEYBOARD
+        item.ki.wVk = event.vk
+        item.ki.wScan = event.scan
+        item.ki.dwFlags = event.flags
+    return array
+
+
+def wheel_input(delta: int, horizontal: bool = False) -> ctypes.Array:
+    """One wheel event of ``delta`` units (``WHEEL_DELTA`` per notch; positive is up/right)."""
+    array = (_Input * 1)()
+    array[0].type = INPUT_MOUSE
+    # mouseData is a DWORD carrying a signed value.
+    array[0].mi.mouseData = delta & 0xFFFFFFFF
+    array[0].mi.dwFlags = MOUSEEVENTF_HWHEEL if horizontal else MOUSEEVENTF_WHEEL
+    return array
+
+
+_send_input = None
+
+
+def _dispatch(array: ctypes.Array) -> int:
+    global _send_input
+    if _send_input is None:
+        fn = ctypes.WinDLL("user32", use_last_error=True).SendInput
+        fn.argtypes = [wintypes.UINT, ctypes.POINTER(_Input), ctypes.c_int]
+        fn.restype = wintypes.UINT
+        _send_input = fn
+    return int(_send_input(len(array), array, ctypes.sizeof(_Input)))
+
+
+def send_input(events: Sequence[KeyInput]) -> int:
+    """Submit ``events`` with one SendInput call; returns how many were inserted."""
+    if not events:
+        return 0
+    return _dispatch(to_input_array(events))
+
+
+def send_wheel(delta: int, horizontal: bool = False) -> None:
+    """Scroll by ``delta`` wheel units at the cursor.
+
+    pyautogui's ``scroll`` passes its argument through as raw units on
+    Windows and its ``hscroll`` scrolls vertically, so wheel input goes
+    through SendInput directly.
+    """
+    if delta and _dispatch(wheel_input(delta, horizontal)) != 1:
+        raise RuntimeError("SendInput rejected the wheel event (target elevated or desktop locked?)")
+
+
+class UnicodeTyper:
+    """Types text as KEYEVENTF_UNICODE events, many characters per SendInput call.
+
+    Layout independent and not limited to ASCII, and it never touches the
+    clipboard. With ``interval`` > 0 each character is sent on its own,
+    followed by that pause, for targets that drop bursts.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[Sequence[KeyInput]], int] = send_input,
+        *,
+        batch_events: int = 1000,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._dispatch = dispatch
+        self._batch_events = max(4, batch_events)
+        self._sleep = sleep
+
+    def type(self, text: str, interval: float = 0.0) -> Dict[str, int]:
+        if interval > 0:
+            chunks: Iterator[List[KeyInput]] = (char_events(ch) for ch in normalize_newlines(text))
+        else:
+            chunks = batches(text, self._batch_events)
+        sent = calls = 0
+        for batch in chunks:
+            inserted = self._dispatch(batch)
+            calls += 1
+            sent += inserted
+            if inserted != len(batch):
+                # SendInput is blocked by UIPI (elevated target) or the
+                # desktop is locked; it reports no error code for that.
+                raise RuntimeError(
+                    f"SendInput inserted {inserted} of {len(batch)} events (target elevated or desktop locked?)"
+                )
+            if interval > 0:
+                self._sleep(interval)
+        return {"events": sent, "batches": calls}
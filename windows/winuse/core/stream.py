@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from winuse.core.capture import CaptureEngine, Region
+from winuse.core.coords import scaled_size
+from winuse.core.encode import Encoder, EncoderProfile
+
+
+@dataclass(frozen=True)
+class StreamFrame:
+    seq: int
+    frame_id: int
+    data: bytes
+
+
+class Subscriber:
+    """A single viewer's mailbox.
+
+    The mailbox holds only the newest frame: if the viewer has not picked up
+    the previous one by the time the next is published, that frame is
+    dropped rather than queued, so a slow client never builds up latency or
+    memory on the server.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, fps: Optional[float] = None) -> None:
+        self._loop = loop
+        self._event = asyncio.Event()
+        self._lock = threading.Lock()
+        self._pending: StreamFrame | None = None
+        self._min_interval = 1.0 / fps if fps else 0.0
+        self._last_sent = 0.0
+        self.delivered = 0
+        self.dropped = 0
+
+    def offer(self, frame: StreamFrame) -> None:
+        """Called from the hub thread."""
+        with self._lock:
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = frame
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            # The viewer's event loop is gone; the hub will drop it on unsubscribe.
+            pass
+
+    async def next(self) -> StreamFrame:
+        while True:
+            await self._event.wait()
+            self._event.clear()
+            wait = self._last_sent + self._min_interval - time.monotonic()
+            if wait > 0:
+                # Per-viewer fps cap: let newer frames replace this one meanwhile.
+                await asyncio.sleep(wait)
+            with self._lock:
+                frame, self._pending = self._pending, None
+            if frame is not None:
+                self._last_sent = time.monotonic()
+                self.delivered += 1
+                return frame
+
+
+class StreamHub:
+    """One capture + encode loop shared by every connected viewer."""
+
+    def __init__(
+        self,
+        engine: CaptureEngine,
+        encoder: Encoder,
+        *,
+        fps: float = 5.0,
+        profile: EncoderProfile | None = None,
+        max_width: Optional[int] = None,
+        region: Optional[Region] = None,
+        skip_unchanged: bool = True,
+    ) -> None:
+        self._engine = engine
+        self._encoder = encoder
+        self._interval = 1.0 / max(0.1, fps)
+        self._profile = profile or EncoderProfile("jpg", quality=70)
+        self._max_width = max_width
+        self._region = region
+        self._skip_unchanged = skip_unchanged
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._latest: StreamFrame | None = None
+        self._seq = 0
+        self._encoded = 0
+        self._unchanged = 0
+        self._errors = 0
+        self._dropped = 0
+
+    def subscribe(self, loop: asyncio.AbstractEventLoop, fps: Optional[float] = None) -> Subscriber:
+        sub = Subscriber(loop, fps)
+        with self._lock:
+            self._subscribers.append(sub)
+            latest = self._latest
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="winuse-stream", daemon=True)
+                self._thread.start()
+        if latest is not None:
+            # New viewers get the last frame immediately instead of waiting
+            # for the screen to change.
+            sub.offer(latest)
+        return sub
+
+    def unsubscribe(self, sub: Subscriber) -> None:
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+                self._dropped += sub.dropped
+        self._wake.set()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._subscribers.clear()
+            thread = self._thread
+        self._wake.set()
+        if thread is not None:
+            thread.join(timeout=2)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            subs = list(self._subscribers)
+            running = self._thread is not None and self._thread.is_alive()
+        return {
+            "running": running,
+            "viewers": len(subs),
+            "frames_encoded": self._encoded,
+            "frames_unchanged": self._unchanged,
+            "errors": self._errors,
+            "dropped": self._dropped + sum(s.dropped for s in subs),
+        }
+
+    def _run(self) -> None:
+        previous_raw = None
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    self._latest = None
+                    return
+                subs = list(self._subscribers)
+            started = time.monotonic()
+            try:
+                frame = self._engine.grab(self._region)
+                if self._skip_unchanged and previous_raw is not None and frame.raw == previous_raw:
+                    self._unchanged += 1
+                else:
+                    previous_raw = frame.raw
+                    size = scaled_size(frame.width, frame.height, max_width=self._max_width)
+                    encoded = self._encoder.encode(frame, self._profile, size)
+                    self._seq += 1
+                    self._encoded += 1
+                    out = StreamFrame(self._seq, frame.frame_id, encoded.data)
+                    with self._lock:
+                        self._latest = out
+                    for sub in subs:
+                        sub.offer(out)
+            except Exception:
+                self._errors += 1
+            deadline = started + self._interval
+            while True:
+                remaining = deadline - time.monotonic()
+                with self._lock:
+                    idle = not self._subscribers
+                if remaining <= 0 or idle:
+                    break
+                self._wake.wait(remaining)
+                self._wake.clear()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class InputTiming:
+    """Delays applied around synthesized input, in seconds.
+
+    ``pause_s`` is pyautogui's implicit sleep after every call
+    (``pyautogui.PAUSE``, 0.1 s by default); the others are the gaps
+    between keys of a hotkey, between clicks of a multi-click and between
+    characters of typed text.
+    """
+
+    pause_s: float = 0.0
+    key_delay_s: float = 0.0
+    click_interval_s: float = 0.0
+    type_interval_s: float = 0.0
+
+    def __post_init__(self) -> None:
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if not 0.0 <= value <= 5.0:
+                raise ValueError(f"{f.name} must be between 0 and 5 seconds")
+
+
+PROFILES: Dict[str, InputTiming] = {
+    # No implicit pauses; a tiny key gap keeps modifier chords reliable.
+    "fast": InputTiming(pause_s=0.0, key_delay_s=0.005, click_interval_s=0.0, type_interval_s=0.0),
+    # For slow or remote-desktop targets that drop input sent back to back.
+    "safe": InputTiming(pause_s=0.05, key_delay_s=0.03, click_interval_s=0.08, type_interval_s=0.01),
+    # Only what ``input_timing`` sets; everything else is 0.
+    "custom": InputTiming(),
+}
+
+
+def input_timing(profile: str = "fast", overrides: Optional[Dict[str, Any]] = None) -> InputTiming:
+    """Resolve a profile name plus per-field overrides from ``behavior.input_timing``."""
+    base = PROFILES.get(profile)
+    if base is None:
+        raise ValueError(f"Unknown input profile {profile!r} (valid: {', '.join(PROFILES)})")
+    known = {f.name for f in fields(InputTiming)}
+    unknown = sorted(set(overrides or {}) - known)
+    if unknown:
+        raise ValueError(f"Unknown input_timing key(s): {', '.join(unknown)}")
+    changes = {k: float(v) for k, v in (overrides or {}).items() if v is not None}
+    return replace(base, **changes) if changes else base
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """Nearest-rank ``q`` quantile (0..1) of ``values``, rounded for metrics; None if empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 2)
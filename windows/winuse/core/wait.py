@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from winuse.core.capture import CaptureEngine, Frame, Region
+from winuse.core.delta import frame_array
+
+_Geometry = Tuple[int, int, int, int]
+
+
+def signature(frame: Frame, cells: int = 160, step: int = 2) -> np.ndarray:
+    """Downscale ``frame`` to about ``cells`` block means per side (0..765 B+G+R).
+
+    Every ``step``-th pixel is read, then averaged per block: block means
+    rather than point samples, so a single typed character or a small
+    spinner still moves its block's value by a clear margin.
+    """
+    px = frame_array(frame)[::step, ::step]
+    gray = px[:, :, 0].astype(np.uint16)
+    gray += px[:, :, 1]
+    gray += px[:, :, 2]
+    height, width = gray.shape
+    block = max(1, -(-max(width, height) // cells))
+    rows, cols = -(-height // block), -(-width // block)
+    if (rows * block, cols * block) != (height, width):
+        gray = np.pad(gray, ((0, rows * block - height), (0, cols * block - width)), mode="edge")
+    return gray.reshape(rows, block, cols, block).mean(axis=(1, 3), dtype=np.float32)
+
+
+def differs(a: np.ndarray, b: np.ndarray, tolerance: float) -> bool:
+    return a.shape != b.shape or float(np.abs(a - b).max(initial=0.0)) > tolerance
+
+
+class FrameWaiter:
+    """Long-polls the capture engine until a region changes or settles.
+
+    Signatures of recent frames are kept by ``frame_id`` so a client can
+    pass the ``frame_id`` of an earlier wait or screenshot as the baseline
+    for the next change, without racing the action in between.
+    """
+
+    def __init__(
+        self,
+        engine: CaptureEngine,
+        history: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._engine = engine
+        self._history = max(1, history)
+        self._clock = clock
+        self._sleep = sleep
+        self._signatures: "OrderedDict[int, Tuple[_Geometry, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"waits": 0, "met": 0, "timed_out": 0, "samples": 0}
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _sample(self, region: Optional[Region]) -> Tuple[Frame, np.ndarray]:
+        frame = self._engine.grab(region)
+        sig = signature(frame)
+        with self._lock:
+            self._signatures[frame.frame_id] = ((frame.left, frame.top, frame.width, frame.height), sig)
+            while len(self._signatures) > self._history:
+                self._signatures.popitem(last=False)
+            self._stats["samples"] += 1
+        return frame, sig
+
+    def _baseline(self, since: int, geometry: _Geometry) -> Optional[np.ndarray]:
+        with self._lock:
+            entry = self._signatures.get(since)
+        if entry is None:
+            frame = self._engine.get(since)
+            if frame is None:
+                return None
+            entry = ((frame.left, frame.top, frame.width, frame.height), signature(frame))
+        return entry[1] if entry[0] == geometry else None
+
+    def wait(
+        self,
+        region: Optional[Region] = None,
+        *,
+        until: str = "stable",
+        timeout_ms: float = 5000.0,
+        stable_ms: float = 300.0,
+        interval_ms: float = 50.0,
+        tolerance: float = 6.0,
+        since: Optional[int] = None,
+    ) -> Dict[str, object]:
+        """Block until ``until`` holds or ``timeout_ms`` passes.
+
+        ``change``: any block of the region differs from frame ``since``
+        (or from the first sample) by more than ``tolerance``, in summed
+        B+G+R levels. ``stable``: no such change for ``stable_ms``.
+        """
+        if until not in ("change", "stable"):
+            raise ValueError(f"Unknown wait condition {until!r}")
+        start = self._clock()
+        deadline = start + timeout_ms / 1000.0
+        frame, sig = self._sample(region)
+        geometry = (frame.left, frame.top, frame.width, frame.height)
+        baseline = self._baseline(since, geometry) if since is not None else None
+        if baseline is None:
+            baseline = sig
+        anchor, last_change, changes = sig, start, 0
+        samples = 1
+        while True:
+            now = self._clock()
+            if until == "change":
+                met = differs(sig, baseline, tolerance)
+            else:
+                met = (now - last_change) * 1000.0 >= stable_ms
+            if met or now >= deadline:
+                break
+            self._sleep(max(0.0, min(interval_ms / 1000.0, deadline - now)))
+            frame, sig = self._sample(region)
+            samples += 1
+            if differs(sig, anchor, tolerance):
+                anchor, last_change = sig, self._clock()
+                changes += 1
+        with self._lock:
+            self._stats["waits"] += 1
+            self._stats["met" if met else "timed_out"] += 1
+        return {
+            "until": until,
+            "met": met,
+            "timed_out": not met,
+            "elapsed_ms": round((now - start) * 1000.0, 1),
+            "samples": samples,
+            "changes": changes,
+            "frame_id": frame.frame_id,
+        }
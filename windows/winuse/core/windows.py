@@ -1,25 +1,26 @@
 from __future__ import annotations
 
-from typing import Dict, List
+import ctypes
+import threading
+from ctypes import wintypes
+from typing import Callable, Dict, List, Optional, Tuple
 
 import win32api
 import win32con
 import win32gui
 import win32process
 
-try:
-    import psutil
-except Exception:  # pragma: no cover - optional dependency at runtime
-    psutil = None
+from winuse.core.coords import rect_point
+from winuse.core.focus import FocusManager
+from winuse.core.processes import ProcessCache
+
+# Shared by every listing; process names are looked up once per process
+# instead of once per window per request.
+process_cache = ProcessCache()
 
 
 def _get_process_name(pid: int) -> str | None:
-    if not psutil:
-        return None
-    try:
-        return psutil.Process(pid).name()
-    except Exception:
-        return None
+    return process_cache.name(pid)
 
 
 def get_window_rect(hwnd: int) -> Dict[str, int]:
@@ -32,30 +33,210 @@ def get_window_rect(hwnd: int) -> Dict[str, int]:
     }
 
 
-def list_windows() -> List[Dict[str, object]]:
-    windows: List[Dict[str, object]] = []
+def get_client_rect(hwnd: int) -> Dict[str, int]:
+    """The client area (no frame, title bar or menus) in screen coordinates."""
+    _, _, width, height = win32gui.GetClientRect(hwnd)
+    x, y = win32gui.ClientToScreen(hwnd, (0, 0))
+    return {"x": int(x), "y": int(y), "width": int(width), "height": int(height)}
 
-    def enum_handler(hwnd, _):
+
+def window_point(
+    hwnd: int, x: float, y: float, *, area: str = "window", normalized: bool = False
+) -> Tuple[int, int]:
+    """Screen pixel for ``x``/``y`` relative to a window's frame or client area, as of now."""
+    if not win32gui.IsWindow(hwnd):
+        raise LookupError(f"No window with hwnd {hwnd}")
+    rect = get_client_rect(hwnd) if area == "client" else get_window_rect(hwnd)
+    return rect_point(rect, x, y, normalized=normalized)
+
+
+def describe_window(hwnd: int) -> Dict[str, object] | None:
+    """Info for one top-level window, or None if it would not be listed."""
+    try:
         if not win32gui.IsWindowVisible(hwnd):
-            return
+            return None
         title = win32gui.GetWindowText(hwnd)
         if not title:
-            return
+            return None
         _, pid = win32process.GetWindowThreadProcessId(hwnd)
-        windows.append(
-            {
-                "hwnd": int(hwnd),
-                "title": title,
-                "pid": int(pid),
-                "process": _get_process_name(pid),
-                "rect": get_window_rect(hwnd),
-            }
-        )
+        return {
+            "hwnd": int(hwnd),
+            "title": title,
+            "pid": int(pid),
+            "process": _get_process_name(pid),
+            "rect": get_window_rect(hwnd),
+        }
+    except win32gui.error:
+        # Destroyed between the event/enumeration and the query.
+        return None
+
+
+def list_windows() -> List[Dict[str, object]]:
+    windows: List[Dict[str, object]] = []
+
+    def enum_handler(hwnd, _):
+        info = describe_window(hwnd)
+        if info is not None:
+            windows.append(info)
 
     win32gui.EnumWindows(enum_handler, None)
     return windows
 
 
+_EVENT_SYSTEM_FOREGROUND = 0x0003
+_EVENT_SYSTEM_MINIMIZESTART = 0x0016
+_EVENT_SYSTEM_MINIMIZEEND = 0x0017
+_EVENT_OBJECT_CREATE = 0x8000
+_EVENT_OBJECT_DESTROY = 0x8001
+_EVENT_OBJECT_SHOW = 0x8002
+_EVENT_OBJECT_HIDE = 0x8003
+_EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+_EVENT_OBJECT_NAMECHANGE = 0x800C
+_WINEVENT_OUTOFCONTEXT = 0x0000
+_WINEVENT_SKIPOWNPROCESS = 0x0002
+_OBJID_WINDOW = 0
+_CHILDID_SELF = 0
+_GA_ROOT = 2
+_WM_QUIT = 0x0012
+
+_EVENT_KINDS = {
+    _EVENT_SYSTEM_FOREGROUND: "foreground",
+    _EVENT_SYSTEM_MINIMIZESTART: "minimize",
+    _EVENT_SYSTEM_MINIMIZEEND: "restore",
+    _EVENT_OBJECT_CREATE: "create",
+    _EVENT_OBJECT_DESTROY: "destroy",
+    _EVENT_OBJECT_SHOW: "show",
+    _EVENT_OBJECT_HIDE: "hide",
+    _EVENT_OBJECT_LOCATIONCHANGE: "location",
+    _EVENT_OBJECT_NAMECHANGE: "name",
+}
+
+_WinEventProc = ctypes.WINFUNCTYPE(
+    None,
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    wintypes.HWND,
+    wintypes.LONG,
+    wintypes.LONG,
+    wintypes.DWORD,
+    wintypes.DWORD,
+)
+
+
+def _user32():
+    user32 = ctypes.windll.user32
+    user32.SetWinEventHook.restype = wintypes.HANDLE
+    user32.SetWinEventHook.argtypes = [
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.HMODULE,
+        _WinEventProc,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.DWORD,
+    ]
+    user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+    user32.GetAncestor.restype = wintypes.HWND
+    user32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+    user32.PostThreadMessageW.argtypes = [
+        wintypes.DWORD,
+        wintypes.UINT,
+        wintypes.WPARAM,
+        wintypes.LPARAM,
+    ]
+    return user32
+
+
+class Win32WindowBackend:
+    """Window enumeration plus out-of-context WinEvent hooks.
+
+    pywin32 does not wrap ``SetWinEventHook``, so the hooks are installed via
+    ctypes on a dedicated thread that pumps messages, as out-of-context
+    hooks require.
+    """
+
+    def __init__(self) -> None:
+        self._thread: threading.Thread | None = None
+        self._thread_id = 0
+        self._callback: Optional[Callable[[str, int], None]] = None
+        self._user32 = None
+        self._proc = _WinEventProc(self._handle)  # keep a reference for the hook's lifetime
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        return list_windows()
+
+    def describe(self, hwnd: int) -> Dict[str, object] | None:
+        return describe_window(hwnd)
+
+    def foreground(self) -> int | None:
+        return int(win32gui.GetForegroundWindow()) or None
+
+    def _handle(self, _hook, event, hwnd, id_object, id_child, _thread, _time) -> None:
+        if id_object != _OBJID_WINDOW or id_child != _CHILDID_SELF or not hwnd:
+            return
+        kind = _EVENT_KINDS.get(event)
+        if kind is None or self._callback is None:
+            return
+        # Destroyed windows can no longer be checked; the registry ignores
+        # unknown handles anyway.
+        if kind != "destroy" and self._user32.GetAncestor(hwnd, _GA_ROOT) != hwnd:
+            return
+        try:
+            self._callback(kind, int(hwnd))
+        except Exception:
+            pass
+
+    def start_events(self, callback: Callable[[str, int], None]) -> bool:
+        if self._thread is not None:
+            return True
+        self._callback = callback
+        self._user32 = _user32()
+        started = threading.Event()
+        ok: List[bool] = []
+
+        def run() -> None:
+            user32 = self._user32
+            flags = _WINEVENT_OUTOFCONTEXT | _WINEVENT_SKIPOWNPROCESS
+            ranges = [
+                (_EVENT_SYSTEM_FOREGROUND, _EVENT_SYSTEM_FOREGROUND),
+                (_EVENT_SYSTEM_MINIMIZESTART, _EVENT_SYSTEM_MINIMIZEEND),
+                (_EVENT_OBJECT_CREATE, _EVENT_OBJECT_NAMECHANGE),
+            ]
+            hooks = [
+                user32.SetWinEventHook(lo, hi, None, self._proc, 0, 0, flags) for lo, hi in ranges
+            ]
+            self._thread_id = win32api.GetCurrentThreadId()
+            ok.append(all(hooks))
+            started.set()
+            try:
+                if ok[0]:
+                    msg = wintypes.MSG()
+                    while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                        user32.TranslateMessage(ctypes.byref(msg))
+                        user32.DispatchMessageW(ctypes.byref(msg))
+            finally:
+                for hook in hooks:
+                    if hook:
+                        user32.UnhookWinEvent(hook)
+
+        self._thread = threading.Thread(target=run, name="winuse-winevents", daemon=True)
+        self._thread.start()
+        started.wait(timeout=5)
+        if not (ok and ok[0]):
+            self.stop_events()
+            return False
+        return True
+
+    def stop_events(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        if self._thread_id:
+            self._user32.PostThreadMessageW(self._thread_id, _WM_QUIT, 0, 0)
+        thread.join(timeout=2)
+        self._callback = None
+
+
 def get_active_window() -> Dict[str, object] | None:
     hwnd = win32gui.GetForegroundWindow()
     if not hwnd:
@@ -79,53 +260,60 @@ def _last_error_message() -> str:
     return f"{code}: {message}"
 
 
-def focus_window(hwnd: int) -> None:
-    # Only restore if minimized — SW_RESTORE on a maximized window
-    # will un-maximize it and change its position/size
-    if win32gui.IsIconic(hwnd):
-        win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-    win32gui.BringWindowToTop(hwnd)
-
-    def is_foreground() -> bool:
+class Win32FocusBackend:
+    def is_foreground(self, hwnd: int) -> bool:
         return win32gui.GetForegroundWindow() == hwnd
 
-    def set_foreground() -> bool:
+    def prepare(self, hwnd: int) -> None:
+        # Only restore if minimized — SW_RESTORE on a maximized window
+        # will un-maximize it and change its position/size
+        if win32gui.IsIconic(hwnd):
+            win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+        win32gui.BringWindowToTop(hwnd)
+
+    def apply(self, strategy: str, hwnd: int) -> None:
+        if strategy == "direct":
+            win32gui.SetForegroundWindow(hwnd)
+        elif strategy == "attach":
+            self._attach_and_set(hwnd)
+        elif strategy == "alt":
+            win32api.keybd_event(win32con.VK_MENU, 0, 0, 0)
+            win32api.keybd_event(win32con.VK_MENU, 0, win32con.KEYEVENTF_KEYUP, 0)
+            win32gui.SetForegroundWindow(hwnd)
+        else:
+            raise ValueError(f"Unknown focus strategy {strategy!r}")
+
+    @staticmethod
+    def _attach_and_set(hwnd: int) -> None:
+        current_tid = win32api.GetCurrentThreadId()
+        fg_hwnd = win32gui.GetForegroundWindow()
+        fg_tid, _ = win32process.GetWindowThreadProcessId(fg_hwnd)
+        target_tid, _ = win32process.GetWindowThreadProcessId(hwnd)
+        attached_fg = False
+        attached_target = False
         try:
+            attached_fg = win32process.AttachThreadInput(current_tid, fg_tid, True)
+            attached_target = win32process.AttachThreadInput(current_tid, target_tid, True)
             win32gui.SetForegroundWindow(hwnd)
-        except win32gui.error:
-            return False
-        return is_foreground()
+            win32gui.SetActiveWindow(hwnd)
+            win32gui.SetFocus(hwnd)
+        finally:
+            if attached_target:
+                win32process.AttachThreadInput(current_tid, target_tid, False)
+            if attached_fg:
+                win32process.AttachThreadInput(current_tid, fg_tid, False)
 
-    if set_foreground():
-        return
+    def last_error(self) -> str:
+        return _last_error_message()
 
-    current_tid = win32api.GetCurrentThreadId()
-    fg_hwnd = win32gui.GetForegroundWindow()
-    fg_tid, _ = win32process.GetWindowThreadProcessId(fg_hwnd)
-    target_tid, _ = win32process.GetWindowThreadProcessId(hwnd)
-    attached_fg = False
-    attached_target = False
-    try:
-        attached_fg = win32process.AttachThreadInput(current_tid, fg_tid, True)
-        attached_target = win32process.AttachThreadInput(current_tid, target_tid, True)
-        win32gui.SetForegroundWindow(hwnd)
-        win32gui.SetActiveWindow(hwnd)
-        win32gui.SetFocus(hwnd)
-    finally:
-        if attached_target:
-            win32process.AttachThreadInput(current_tid, target_tid, False)
-        if attached_fg:
-            win32process.AttachThreadInput(current_tid, fg_tid, False)
-
-    if is_foreground():
-        return
-
-    win32api.keybd_event(win32con.VK_MENU, 0, 0, 0)
-    win32api.keybd_event(win32con.VK_MENU, 0, win32con.KEYEVENTF_KEYUP, 0)
-    if set_foreground():
-        return
-
-    raise RuntimeError(f"SetForegroundWindow failed ({_last_error_message()})")
+
+focus_manager = FocusManager(Win32FocusBackend())
+
+
+def focus_window(hwnd: int, timeout_ms: float = 1000.0) -> Dict[str, object]:
+    """Focus ``hwnd`` and confirm it; returns the strategy used and elapsed time."""
+    _, pid = win32process.GetWindowThreadProcessId(hwnd)
+    return focus_manager.focus(hwnd, _get_process_name(pid), timeout_ms=timeout_ms)
 
 
 def minimize_window(hwnd: int) -> None: